@@ -18,11 +18,16 @@ Run (HTTP — for remote/multi-client):
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
 import os
+import random
+import secrets
 import sys
 import time
 import logging
+from collections import OrderedDict
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 from enum import Enum
@@ -43,8 +48,56 @@ BASE_URL = os.environ.get("JETNET_BASE_URL", "https://customer.jetnetconnect.com
 TOKEN_TTL_SECONDS = 50 * 60
 DEFAULT_PAGESIZE = 100
 MAX_PAGES = 50
+# Pages fetched at once by get_all_pages. Every page still takes a token from the
+# "paged" bucket below, whose burst defaults to this value so the first wave goes
+# out together; after that pages are capped at JETNET_RATE_PAGED per second
+# (default 2), e.g. >= ~23s for 50 pages. Concurrency pays off when a page takes
+# longer than 1 / JETNET_RATE_PAGED seconds to come back.
+PAGE_CONCURRENCY = int(os.environ.get("JETNET_PAGE_CONCURRENCY", "4"))
 CHARACTER_LIMIT = 50_000
 
+# Retry policy for transient JETNET failures. Same attempts, statuses and backoff
+# as src/jetnet/session.py, but a 120s deadline instead of 300s: a tool call
+# blocks an interactive agent, which is better served by a prompt error than a
+# five-minute wait.
+RETRY_MAX_ATTEMPTS = int(os.environ.get("JETNET_RETRY_MAX_ATTEMPTS", "4"))
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+RETRY_BACKOFF_BASE = 0.5
+RETRY_BACKOFF_MAX = 30.0
+RETRY_DEADLINE = float(os.environ.get("JETNET_RETRY_DEADLINE", "120"))
+
+# Client-side rate budgets: (requests per second, burst) per endpoint class.
+# Mirrors src/jetnet/rate_limit.py; "paged" covers *Paged endpoints, with its
+# burst sized to PAGE_CONCURRENCY unless JETNET_BURST_PAGED is set.
+RATE_BUDGETS = {
+    "lookup": (float(os.environ.get("JETNET_RATE_LOOKUP", "10")), float(os.environ.get("JETNET_BURST_LOOKUP", "20"))),
+    "paged": (float(os.environ.get("JETNET_RATE_PAGED", "2")), float(os.environ.get("JETNET_BURST_PAGED", str(max(4, PAGE_CONCURRENCY))))),
+}
+
+# getRelationships batching: concurrent single-aircraft requests within the
+# window are merged into one aclist call of at most RELATIONSHIP_BATCH_MAX IDs.
+RELATIONSHIP_BATCH_WINDOW = float(os.environ.get("JETNET_BATCH_WINDOW", "0.01"))
+RELATIONSHIP_BATCH_MAX = int(os.environ.get("JETNET_BATCH_MAX", "50"))
+
+# Response cache: TTL in seconds per endpoint (matched on the path), LRU-evicted
+# by total JSON bytes. Endpoints not listed here are never cached.
+CACHE_TTLS = {
+    "getModelPerformanceSpecs": int(os.environ.get("JETNET_CACHE_TTL_SPECS", "86400")),
+    "getAircraftModelList": int(os.environ.get("JETNET_CACHE_TTL_MODELS", "86400")),
+    "getRegNumber": int(os.environ.get("JETNET_CACHE_TTL_REGISTRATION", "300")),
+    "getPictures": int(os.environ.get("JETNET_CACHE_TTL_PICTURES", "3600")),
+}
+CACHE_MAX_BYTES = int(os.environ.get("JETNET_CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+
+# Result handles: JSON output over CHARACTER_LIMIT is kept server-side for
+# jetnet_query_result instead of being cut off.
+RESULT_TTL = int(os.environ.get("JETNET_RESULT_TTL", "1800"))
+RESULT_STORE_MAX_BYTES = int(os.environ.get("JETNET_RESULT_STORE_MAX_BYTES", str(64 * 1024 * 1024)))
+RESULT_PREVIEW_RECORDS = 5
+
+# jetnet_golden_path: per-step timeout for the concurrent relationships/pictures calls.
+GOLDEN_PATH_STEP_TIMEOUT = float(os.environ.get("JETNET_GOLDEN_PATH_STEP_TIMEOUT", "10"))
+
 logger = logging.getLogger("jetnet_mcp")
 
 LIST_KEYS = frozenset({
@@ -54,6 +107,147 @@ LIST_KEYS = frozenset({
 })
 
 
+class TokenBucket:
+    """In-process token bucket. reserve() takes a token and returns the wait in seconds."""
+
+    def __init__(self, rate: float, burst: float) -> None:
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+
+    def reserve(self) -> float:
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate) - 1
+        self.updated = now
+        return max(-self.tokens / self.rate, 0.0)
+
+
+class ResponseCache:
+    """TTL + LRU cache of parsed JSON responses, bounded by total response bytes."""
+
+    def __init__(self, max_bytes: int = CACHE_MAX_BYTES) -> None:
+        self.max_bytes = max_bytes
+        self.entries: "OrderedDict[str, tuple]" = OrderedDict()   # key -> (expires_at, size, data)
+        self.bytes = 0
+        self.stats: Dict[str, int] = {"hits": 0, "misses": 0, "evictions": 0, "expired": 0}
+
+    @staticmethod
+    def key(method: str, path: str, body: Optional[Dict[str, Any]]) -> str:
+        canonical = json.dumps(body, sort_keys=True, separators=(",", ":"), default=str)
+        return f"{method} {path} {hashlib.sha256(canonical.encode()).hexdigest()}"
+
+    @staticmethod
+    def ttl_for(path: str) -> int:
+        return next((ttl for name, ttl in CACHE_TTLS.items() if name in path), 0)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        entry = self.entries.get(key)
+        if entry is None:
+            self.stats["misses"] += 1
+            return None
+        if entry[0] <= time.monotonic():
+            self._drop(key)
+            self.stats["expired"] += 1
+            self.stats["misses"] += 1
+            return None
+        self.entries.move_to_end(key)
+        self.stats["hits"] += 1
+        return entry[2]
+
+    def put(self, key: str, data: Dict[str, Any], ttl: int, size: int) -> None:
+        if size > self.max_bytes:
+            return
+        if key in self.entries:
+            self._drop(key)
+        self.entries[key] = (time.monotonic() + ttl, size, data)
+        self.bytes += size
+        while self.bytes > self.max_bytes:
+            self._drop(next(iter(self.entries)))
+            self.stats["evictions"] += 1
+
+    def _drop(self, key: str) -> None:
+        _, size, _ = self.entries.pop(key)
+        self.bytes -= size
+
+    def snapshot(self) -> Dict[str, Any]:
+        return dict(self.stats, entries=len(self.entries), bytes=self.bytes, max_bytes=self.max_bytes)
+
+
+class ResultStore(ResponseCache):
+    """Full tool results kept under random handles, with the cache's TTL and byte-bounded LRU."""
+
+    def __init__(self, max_bytes: int = RESULT_STORE_MAX_BYTES) -> None:
+        super().__init__(max_bytes)
+
+    def add(self, records: List[Any], meta: Dict[str, Any], size: int, ttl: int = RESULT_TTL) -> str:
+        handle = f"r_{secrets.token_hex(8)}"
+        self.put(handle, {"records": records, "meta": meta}, ttl, size)
+        return handle
+
+
+class RelationshipBatcher:
+    """DataLoader-style batching for getRelationships.
+
+    IDs requested within RELATIONSHIP_BATCH_WINDOW seconds (up to
+    RELATIONSHIP_BATCH_MAX) go out as one `aclist` call; each caller gets
+    the relationships for its own aircraftid. Mirrors src/jetnet/batching.py.
+    """
+
+    def __init__(self, session: "JetnetSession") -> None:
+        self.session = session
+        self.pending: Dict[bool, Dict[int, List[asyncio.Future]]] = {}
+        self.timers: Dict[bool, asyncio.TimerHandle] = {}
+        self.tasks: set = set()
+        self.stats: Dict[str, int] = {"requested": 0, "batches": 0, "aircraft": 0}
+
+    async def get(self, aircraft_id: int, show_historical: bool = False) -> List[Dict[str, Any]]:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self.stats["requested"] += 1
+        batch = self.pending.setdefault(show_historical, {})
+        batch.setdefault(aircraft_id, []).append(future)
+        if len(batch) >= RELATIONSHIP_BATCH_MAX:
+            self._dispatch(show_historical)
+        elif show_historical not in self.timers:
+            self.timers[show_historical] = loop.call_later(
+                RELATIONSHIP_BATCH_WINDOW, self._dispatch, show_historical
+            )
+        return await future
+
+    def _dispatch(self, show_historical: bool) -> None:
+        timer = self.timers.pop(show_historical, None)
+        if timer is not None:
+            timer.cancel()
+        batch = self.pending.pop(show_historical, {})
+        if batch:
+            task = asyncio.ensure_future(self._send(show_historical, batch))
+            self.tasks.add(task)
+            task.add_done_callback(self.tasks.discard)
+
+    async def _send(self, show_historical: bool, batch: Dict[int, List[asyncio.Future]]) -> None:
+        self.stats["batches"] += 1
+        self.stats["aircraft"] += len(batch)
+        try:
+            data = await self.session.request("POST", "/api/Aircraft/getRelationships/{apiToken}", {
+                "aclist": list(batch), "modlist": [], "actiondate": "",
+                "showHistoricalAcRefs": show_historical,
+            })
+        except Exception as e:
+            for futures in batch.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+        by_id: Dict[Any, List[Dict[str, Any]]] = {}
+        for rel in data.get("relationships") or []:
+            by_id.setdefault(rel.get("aircraftid"), []).append(rel)
+        for aircraft_id, futures in batch.items():
+            for future in futures:
+                if not future.done():
+                    future.set_result(list(by_id.get(aircraft_id, [])))
+
+
 class JetnetSession:
     """Manages JETNET authentication and token lifecycle."""
 
@@ -62,6 +256,18 @@ class JetnetSession:
         self.api_token: str = ""
         self.login_time: float = 0.0
         self.client = httpx.AsyncClient(base_url=BASE_URL, timeout=30.0)
+        self.retry_stats: Dict[str, Any] = {"calls": 0, "retries": 0, "exhausted": 0, "by_reason": {}}
+        self.buckets = {name: TokenBucket(rate, burst) for name, (rate, burst) in RATE_BUDGETS.items()}
+        self.rate_stats: Dict[str, Dict[str, float]] = {
+            name: {"calls": 0, "waited": 0, "total_wait": 0.0, "max_wait": 0.0} for name in RATE_BUDGETS
+        }
+        self.relationships = RelationshipBatcher(self)
+        self.cache = ResponseCache()
+        self.results = ResultStore()
+        # Single-flight: identical concurrent requests share one in-flight task.
+        self._inflight: Dict[str, "asyncio.Task"] = {}
+        self.flight_stats: Dict[str, int] = {"sent": 0, "coalesced": 0, "logins": 0}
+        self._login_lock = asyncio.Lock()
 
     @property
     def is_expired(self) -> bool:
@@ -75,8 +281,8 @@ class JetnetSession:
                 "Missing JETNET credentials. Set JETNET_EMAIL and JETNET_PASSWORD "
                 "environment variables."
             )
-        resp = await self.client.post(
-            "/api/Admin/APILogin",
+        resp = await self._send(
+            "POST", "/api/Admin/APILogin",
             json={"emailAddress": email, "password": password},
         )
         resp.raise_for_status()
@@ -84,33 +290,130 @@ class JetnetSession:
         self.bearer = data["bearerToken"]
         self.api_token = data["apiToken"]
         self.login_time = time.time()
+        self.flight_stats["logins"] += 1
         logger.info("JETNET login successful. Token: %s...", self.api_token[:8])
 
+    async def _throttle(self, url: str) -> None:
+        """Wait for a token from the rate bucket of this URL's endpoint class."""
+        name = "paged" if "Paged" in url else "lookup"
+        wait = self.buckets[name].reserve()
+        stats = self.rate_stats[name]
+        stats["calls"] += 1
+        if wait > 0:
+            stats["waited"] += 1
+            stats["total_wait"] += wait
+            stats["max_wait"] = max(stats["max_wait"], wait)
+            await asyncio.sleep(wait)
+
+    async def _send(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """Send with exponential backoff + full jitter on transient failures.
+
+        Retries RETRY_STATUSES and httpx transport errors (resets, timeouts),
+        honours Retry-After, and gives up after RETRY_MAX_ATTEMPTS or
+        RETRY_DEADLINE seconds. Counters are kept in self.retry_stats.
+        """
+        started = time.monotonic()
+        attempt = 0
+        self.retry_stats["calls"] += 1
+        while True:
+            attempt += 1
+            retry_after: Optional[float] = None
+            error: Optional[httpx.TransportError] = None
+            try:
+                await self._throttle(url)
+                resp = await self.client.request(method, url, **kwargs)
+            except httpx.TransportError as e:
+                error, reason = e, type(e).__name__
+            else:
+                if resp.status_code not in RETRY_STATUSES:
+                    return resp
+                reason = str(resp.status_code)
+                header = resp.headers.get("Retry-After", "")
+                retry_after = float(header) if header.replace(".", "", 1).isdigit() else None
+
+            delay = retry_after if retry_after is not None else random.uniform(
+                0, min(RETRY_BACKOFF_MAX, RETRY_BACKOFF_BASE * 2 ** (attempt - 1))
+            )
+            if attempt >= RETRY_MAX_ATTEMPTS or time.monotonic() - started + delay > RETRY_DEADLINE:
+                self.retry_stats["exhausted"] += 1
+                if error is not None:
+                    raise error
+                return resp
+
+            self.retry_stats["retries"] += 1
+            by_reason = self.retry_stats["by_reason"]
+            by_reason[reason] = by_reason.get(reason, 0) + 1
+            logger.warning("JETNET %s on %s (attempt %d/%d), retrying in %.1fs",
+                           reason, method, attempt, RETRY_MAX_ATTEMPTS, delay)
+            await asyncio.sleep(delay)
+
     async def ensure_valid(self) -> None:
         if not self.bearer or self.is_expired:
-            await self.login()
+            async with self._login_lock:
+                # Another request may have logged in while we waited.
+                if not self.bearer or self.is_expired:
+                    await self.login()
+
+    async def _relogin(self, stale_bearer: Optional[str]) -> None:
+        """Log in again after INVALID SECURITY TOKEN, once per stale token."""
+        async with self._login_lock:
+            if self.bearer == stale_bearer:
+                await self.login()
 
     async def request(
         self,
         method: str,
         path: str,
         body: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        ttl = ResponseCache.ttl_for(path)
+        cache_key = ResponseCache.key(method, path, body) if ttl else ""
+        if ttl:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        key = cache_key or ResponseCache.key(method, path, body)
+        flight = self._inflight.get(key)
+        if flight is None:
+            self.flight_stats["sent"] += 1
+            flight = asyncio.ensure_future(self._fetch(method, path, body, ttl, cache_key))
+            self._inflight[key] = flight
+            flight.add_done_callback(lambda f: self._flight_done(key, f))
+        else:
+            self.flight_stats["coalesced"] += 1
+        # shield: a caller that gives up (timeout, cancel) must not cancel the
+        # request for the other callers sharing it.
+        return await asyncio.shield(flight)
+
+    def _flight_done(self, key: str, flight: "asyncio.Task") -> None:
+        self._inflight.pop(key, None)
+        if not flight.cancelled():
+            flight.exception()   # mark retrieved even if every caller went away
+
+    async def _fetch(
+        self,
+        method: str,
+        path: str,
+        body: Optional[Dict[str, Any]],
+        ttl: int,
+        cache_key: str,
     ) -> Dict[str, Any]:
         await self.ensure_valid()
 
         url = path.replace("{apiToken}", self.api_token)
         headers = {"Authorization": f"Bearer {self.bearer}"}
 
-        resp = await self.client.request(method, url, headers=headers, json=body)
+        resp = await self._send(method, url, headers=headers, json=body)
         resp.raise_for_status()
         data = resp.json()
 
         status = data.get("responsestatus", "")
         if "INVALID SECURITY TOKEN" in status.upper():
-            await self.login()
+            await self._relogin(headers["Authorization"][len("Bearer "):])
             url = path.replace("{apiToken}", self.api_token)
             headers = {"Authorization": f"Bearer {self.bearer}"}
-            resp = await self.client.request(method, url, headers=headers, json=body)
+            resp = await self._send(method, url, headers=headers, json=body)
             resp.raise_for_status()
             data = resp.json()
             status = data.get("responsestatus", "")
@@ -118,6 +421,8 @@ class JetnetSession:
         if "ERROR" in status.upper():
             raise ValueError(f"JETNET API error: {status}")
 
+        if ttl:
+            self.cache.put(cache_key, data, ttl, len(resp.content))
         return data
 
     async def get_all_pages(
@@ -126,19 +431,43 @@ class JetnetSession:
         body: Dict[str, Any],
         pagesize: int = DEFAULT_PAGESIZE,
         max_pages: int = MAX_PAGES,
+        max_records: Optional[int] = None,
+        concurrency: int = PAGE_CONCURRENCY,
     ) -> List[Dict[str, Any]]:
-        results: List[Dict[str, Any]] = []
-        page = 1
-        while page <= max_pages:
-            data = await self.request("POST", f"{path}/{pagesize}/{page}", body)
-            for key in LIST_KEYS:
-                if key in data and isinstance(data[key], list):
-                    results.extend(data[key])
+        """
+        Page 1 gives maxpages and the list key; the remaining pages are then
+        fetched up to `concurrency` at a time and appended in page order.
+        Stops (and cancels pages not yet sent) once `max_records` are collected.
+        """
+        first = await self.request("POST", f"{path}/{pagesize}/1", body)
+        key = next((k for k in LIST_KEYS if isinstance(first.get(k), list)), None)
+        if key is None:
+            return []
+        results: List[Dict[str, Any]] = list(first[key])
+
+        last = min(first.get("maxpages", 1) or 1, max_pages)
+        if max_records is not None:
+            last = min(last, -(-max_records // pagesize))
+        if last <= 1 or (max_records is not None and len(results) >= max_records):
+            return results[:max_records]
+
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def fetch(page: int) -> List[Dict[str, Any]]:
+            async with semaphore:
+                data = await self.request("POST", f"{path}/{pagesize}/{page}", body)
+            return data.get(key) or []
+
+        tasks = [asyncio.ensure_future(fetch(page)) for page in range(2, last + 1)]
+        try:
+            for task in tasks:
+                results.extend(await task)
+                if max_records is not None and len(results) >= max_records:
                     break
-            if page >= data.get("maxpages", 1):
-                break
-            page += 1
-        return results
+        finally:
+            for task in tasks:
+                task.cancel()
+        return results[:max_records]
 
     async def close(self) -> None:
         await self.client.aclose()
@@ -177,10 +506,106 @@ class MakeType(str, Enum):
     TURBINE = "Turbine"
 
 
-def _truncate(text: str) -> str:
+def _split_records(payload: Any) -> tuple:
+    """(records, list_key, meta): the payload's largest list, its key, and the other top-level fields."""
+    if isinstance(payload, list):
+        return payload, None, {}
+    if isinstance(payload, dict):
+        lists = [k for k, v in payload.items() if isinstance(v, list)]
+        if lists:
+            key = max(lists, key=lambda k: len(payload[k]))
+            return payload[key], key, {k: v for k, v in payload.items() if k != key}
+    return [payload], None, {}
+
+
+def _clip(value: Any, limit: int = 200) -> Any:
+    """Scalars as-is; long strings and nested values as a string of at most `limit` chars."""
+    if value is None or isinstance(value, (bool, int, float)):
+        return value
+    text = value if isinstance(value, str) else json.dumps(value, default=str)
+    return text if len(text) <= limit else text[:limit] + "…"
+
+
+def _rendered_size(row: Any) -> int:
+    """Chars `row` takes as an element of an indent=2 list nested one level deep."""
+    text = json.dumps(row, indent=2, default=str)
+    return len(text) + 4 * text.count("\n") + 8
+
+
+def _fit_row(row: Dict[str, Any], budget: int) -> Dict[str, Any]:
+    """Clip the values of a row too large for `budget`, then drop trailing fields if still needed."""
+    limit = 2_000
+    fitted = row
+    while limit >= 20:
+        fitted = {k: _clip(v, limit) for k, v in row.items()}
+        if _rendered_size(fitted) <= budget:
+            return fitted
+        limit //= 2
+    keys = list(fitted)
+    while keys and _rendered_size({k: fitted[k] for k in keys}) > budget:
+        keys = keys[: len(keys) // 2]
+    return {k: fitted[k] for k in keys}
+
+
+def _json_result(session: JetnetSession, payload: Any, source: str) -> str:
+    """JSON text of `payload`, or, past CHARACTER_LIMIT, a summary plus a result handle.
+
+    The full result stays server-side (RESULT_TTL); jetnet_query_result pages,
+    projects, filters and aggregates it without another JETNET call.
+    """
+    text = json.dumps(payload, indent=2, default=str)
     if len(text) <= CHARACTER_LIMIT:
         return text
-    return text[:CHARACTER_LIMIT] + "\n\n[... truncated — use pagination or filters to narrow results]"
+
+    records, list_key, meta = _split_records(payload)
+    fields: Dict[str, None] = {}
+    for record in records[:200]:
+        if isinstance(record, dict):
+            fields.update(dict.fromkeys(record))
+    handle = session.results.add(
+        records, {"source": source, "list_key": list_key, "fields": list(fields), "context": meta}, len(text),
+    )
+    summary: Dict[str, Any] = {
+        "result_handle": handle,
+        "source": source,
+        "total_records": len(records),
+        "list_key": list_key,
+        "fields": list(fields),
+        "context": meta,
+        "preview": records[:RESULT_PREVIEW_RECORDS],
+        "expires_in_seconds": RESULT_TTL,
+        "note": (
+            f"Full result ({len(text):,} chars) stored server-side. Call jetnet_query_result "
+            "with this result_handle to page, select fields, filter, sort or aggregate it."
+        ),
+    }
+
+    # Shrink the summary until it fits: fewer preview records, then clipped
+    # values, then fewer listed fields. The handle and note are always kept.
+    def fits() -> Optional[str]:
+        out = json.dumps(summary, indent=2, default=str)
+        return out if len(out) <= CHARACTER_LIMIT else None
+
+    for n in range(RESULT_PREVIEW_RECORDS, 0, -1):
+        summary["preview"] = records[:n]
+        out = fits()
+        if out:
+            return out
+    summary["context"] = {k: _clip(v) for k, v in meta.items()}
+    summary["preview"] = [
+        {k: _clip(v, 80) for k, v in r.items()} if isinstance(r, dict) else _clip(r, 80)
+        for r in records[:RESULT_PREVIEW_RECORDS]
+    ]
+    while True:
+        out = fits()
+        if out:
+            return out
+        if summary["preview"]:
+            summary["preview"].pop()
+        elif summary["context"]:
+            summary["context"] = {}
+        else:
+            summary["fields"] = summary["fields"][: len(summary["fields"]) // 2]
 
 
 def _format_aircraft_md(ac: Dict[str, Any]) -> str:
@@ -203,6 +628,24 @@ def _format_aircraft_md(ac: Dict[str, Any]) -> str:
     return "\n".join(lines)
 
 
+async def _timed_step(name: str, awaitable, timeout: float) -> tuple:
+    """Await one workflow step with its own timeout.
+
+    Returns (result, timing). A timeout or error yields an empty list plus a
+    timing entry with status "timeout" / "error", so sibling steps are unaffected.
+    """
+    started = time.monotonic()
+    try:
+        result = await asyncio.wait_for(awaitable, timeout)
+        timing: Dict[str, Any] = {"step": name, "status": "ok"}
+    except asyncio.TimeoutError:
+        result, timing = [], {"step": name, "status": "timeout"}
+    except Exception as e:
+        result, timing = [], {"step": name, "status": "error", "error": str(e)[:200]}
+    timing["ms"] = round((time.monotonic() - started) * 1000)
+    return result, timing
+
+
 def _get_session(ctx) -> JetnetSession:
     return ctx.request_context.lifespan_state["session"]
 
@@ -313,21 +756,13 @@ async def jetnet_get_relationships(params: RelationshipsInput, ctx=None) -> str:
     """
     session = _get_session(ctx)
 
-    body = {
-        "aircraftid": params.aircraftid,
-        "aclist": [params.aircraftid],
-        "modlist": [],
-        "actiondate": "",
-        "showHistoricalAcRefs": params.show_historical,
-    }
-    data = await session.request("POST", "/api/Aircraft/getRelationships/{apiToken}", body)
-    rels = data.get("relationships", [])
+    rels = await session.relationships.get(params.aircraftid, params.show_historical)
 
     if not rels:
         return f"No relationships found for aircraft ID {params.aircraftid}."
 
     if params.response_format == ResponseFormat.JSON:
-        return _truncate(json.dumps(rels, indent=2, default=str))
+        return _json_result(session, rels, "jetnet_get_relationships")
 
     lines = [f"## Relationships for Aircraft ID {params.aircraftid}", ""]
     for r in rels:
@@ -400,20 +835,17 @@ async def jetnet_get_flight_data(params: FlightDataInput, ctx=None) -> str:
     }
 
     pagesize = min(params.max_records, DEFAULT_PAGESIZE)
-    max_p = (params.max_records // pagesize) + 1
 
     flights = await session.get_all_pages(
         "/api/Aircraft/getFlightDataPaged/{apiToken}",
-        body, pagesize=pagesize, max_pages=max_p,
+        body, pagesize=pagesize, max_records=params.max_records,
     )
 
-    flights = flights[:params.max_records]
-
     if not flights:
         return f"No flight data found for aircraft {params.aircraftid} between {params.start_date} and {params.end_date}."
 
     if params.response_format == ResponseFormat.JSON:
-        return _truncate(json.dumps(flights, indent=2, default=str))
+        return _json_result(session, flights, "jetnet_get_flight_data")
 
     lines = [f"## Flight Activity — Aircraft {params.aircraftid}", f"**Period**: {params.start_date} to {params.end_date} | **Records**: {len(flights)}", ""]
     for f in flights[:20]:
@@ -510,7 +942,7 @@ async def jetnet_search_fleet(params: FleetSearchInput, ctx=None) -> str:
     count = data.get("count", len(aircraft))
 
     if params.response_format == ResponseFormat.JSON:
-        return _truncate(json.dumps({"total": count, "aircraft": aircraft}, indent=2, default=str))
+        return _json_result(session, {"total": count, "aircraft": aircraft}, "jetnet_search_fleet")
 
     lines = [f"## Fleet Search Results", f"**Total matching**: {count} | **Showing**: {len(aircraft)}", ""]
     for ac in aircraft:
@@ -586,19 +1018,17 @@ async def jetnet_get_history(params: HistoryInput, ctx=None) -> str:
     }
 
     pagesize = min(params.max_records, DEFAULT_PAGESIZE)
-    max_p = (params.max_records // pagesize) + 1
 
     history = await session.get_all_pages(
         "/api/Aircraft/getHistoryListPaged/{apiToken}",
-        body, pagesize=pagesize, max_pages=max_p,
+        body, pagesize=pagesize, max_records=params.max_records,
     )
-    history = history[:params.max_records]
 
     if not history:
         return "No transaction history found for those filters and date range."
 
     if params.response_format == ResponseFormat.JSON:
-        return _truncate(json.dumps(history, indent=2, default=str))
+        return _json_result(session, history, "jetnet_get_history")
 
     lines = [f"## Transaction History", f"**Period**: {params.start_date} to {params.end_date} | **Records**: {len(history)}", ""]
     for h in history[:25]:
@@ -662,7 +1092,7 @@ async def jetnet_get_market_trends(params: MarketTrendsInput, ctx=None) -> str:
     data = await session.request("POST", "/api/Model/getModelMarketTrends/{apiToken}", body)
 
     if params.response_format == ResponseFormat.JSON:
-        return _truncate(json.dumps(data, indent=2, default=str))
+        return _json_result(session, data, "jetnet_get_market_trends")
 
     trends = data.get("modelmarkettrends", data.get("trends", []))
     if not trends:
@@ -811,7 +1241,7 @@ async def jetnet_get_snapshot(params: SnapshotInput, ctx=None) -> str:
         "POST", "/api/Aircraft/getCondensedSnapshot/{apiToken}", body
     )
     if params.response_format == ResponseFormat.JSON:
-        return _truncate(json.dumps(data, indent=2, default=str))
+        return _json_result(session, data, "jetnet_get_snapshot")
 
     snapshot = data.get("snapshotowneroperators", data.get("snapshot", []))
     lines = ["## Fleet Snapshot", f"**Date**: {params.snapshot_date}", ""]
@@ -866,7 +1296,7 @@ async def jetnet_get_model_specs(params: ModelSpecsInput, ctx=None) -> str:
         "POST", "/api/Model/getModelPerformanceSpecs/{apiToken}", body
     )
     if params.response_format == ResponseFormat.JSON:
-        return _truncate(json.dumps(data, indent=2, default=str))
+        return _json_result(session, data, "jetnet_get_model_specs")
 
     specs = data.get("specs", data.get("modelperformancespecs", data))
     lines = [f"## Model Specifications -- Model {params.modelid}", ""]
@@ -907,7 +1337,15 @@ async def jetnet_health_check(params: HealthCheckInput, ctx=None) -> str:
         data = await session.request(
             "GET", "/api/Admin/getAccountInfo/{apiToken}"
         )
-        return f"Connected to JETNET. Token valid. Account: {json.dumps(data, indent=2, default=str)}"
+        return (
+            f"Connected to JETNET. Token valid. Account: {json.dumps(data, indent=2, default=str)}\n"
+            f"Retry stats: {json.dumps(session.retry_stats, default=str)}\n"
+            f"Rate limiter: {json.dumps(session.rate_stats, default=str)}\n"
+            f"Relationship batching: {json.dumps(session.relationships.stats)}\n"
+            f"Response cache: {json.dumps(session.cache.snapshot())}\n"
+            f"Request coalescing: {json.dumps(session.flight_stats)}\n"
+            f"Stored results: {json.dumps(session.results.snapshot())}"
+        )
     except Exception as e:
         return f"Connection failed: {str(e)}. Check JETNET_EMAIL and JETNET_PASSWORD."
 
@@ -926,6 +1364,13 @@ class GoldenPathInput(BaseModel):
     response_format: ResponseFormat = Field(
         default=ResponseFormat.MARKDOWN, description="Output format",
     )
+    step_timeout: float = Field(
+        default=GOLDEN_PATH_STEP_TIMEOUT, ge=1, le=120,
+        description="Seconds to wait for relationships and for pictures (each); a slow step is skipped, not fatal",
+    )
+    include_timings: bool = Field(
+        default=False, description="Append per-step timings (ms) and step status to the result",
+    )
 
     @field_validator("registration")
     @classmethod
@@ -950,10 +1395,16 @@ async def jetnet_golden_path(params: GoldenPathInput, ctx=None) -> str:
 
     This is the recommended starting point for most queries. It combines
     getRegNumber + getRelationships + getPictures into one workflow.
+    Relationships and pictures are fetched concurrently, each with its own
+    timeout; if one is slow or fails the profile is returned without it.
     """
     session = _get_session(ctx)
+    started = time.monotonic()
 
     data = await session.request("GET", f"/api/Aircraft/getRegNumber/{params.registration}/{{apiToken}}")
+    timings: List[Dict[str, Any]] = [
+        {"step": "getRegNumber", "status": "ok", "ms": round((time.monotonic() - started) * 1000)}
+    ]
     ac = data.get("aircraftresult", {})
 
     if not ac:
@@ -963,26 +1414,29 @@ async def jetnet_golden_path(params: GoldenPathInput, ctx=None) -> str:
     if not aid:
         return f"Aircraft found but no aircraftid returned. Unexpected response."
 
-    try:
-        rel_data = await session.request("POST", "/api/Aircraft/getRelationships/{apiToken}", {
-            "aircraftid": aid, "aclist": [aid], "modlist": [], "actiondate": "", "showHistoricalAcRefs": False,
-        })
-        rels = rel_data.get("relationships", [])
-    except Exception:
-        rels = []
-
-    try:
+    async def fetch_pictures() -> List[Dict[str, Any]]:
         pic_data = await session.request("GET", f"/api/Aircraft/getPictures/{aid}/{{apiToken}}")
-        pics = pic_data.get("pictures", [])
-    except Exception:
-        pics = []
+        return pic_data.get("pictures", [])
+
+    (rels, rel_timing), (pics, pic_timing) = await asyncio.gather(
+        _timed_step("getRelationships", session.relationships.get(aid), params.step_timeout),
+        _timed_step("getPictures", fetch_pictures(), params.step_timeout),
+    )
+    timings += [rel_timing, pic_timing]
+    timings.append({"step": "total", "status": "ok", "ms": round((time.monotonic() - started) * 1000)})
+    degraded = [t for t in (rel_timing, pic_timing) if t["status"] != "ok"]
 
     if params.response_format == ResponseFormat.JSON:
-        return _truncate(json.dumps({
+        result: Dict[str, Any] = {
             "aircraft": ac,
             "relationships": rels,
             "pictures": pics,
-        }, indent=2, default=str))
+        }
+        if degraded:
+            result["degraded"] = degraded
+        if params.include_timings:
+            result["timings"] = timings
+        return _json_result(session, result, "jetnet_golden_path")
 
     reg = ac.get("regnbr", "N/A")
     make = ac.get("make", "")
@@ -1017,6 +1471,238 @@ async def jetnet_golden_path(params: GoldenPathInput, ctx=None) -> str:
                 lines.append(f"- {url}")
         lines.append("")
 
+    for t in degraded:
+        lines.append(f"> {t['step']} unavailable ({t['status']}"
+                     + (f": {t['error']}" if t.get("error") else "") + ") — profile shown without it.")
+    if degraded:
+        lines.append("")
+
+    if params.include_timings:
+        lines.append("## Timings")
+        for t in timings:
+            lines.append(f"- {t['step']}: {t['ms']} ms ({t['status']})")
+        lines.append("")
+
+    return "\n".join(lines)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# TOOL: QUERY A STORED RESULT
+# ═══════════════════════════════════════════════════════════════════════════════
+
+_FILTER_OPS = (">=", "<=", "!=", ">", "<", "~")
+_METRICS = ("count", "sum", "avg", "min", "max")
+
+
+def _as_number(value: Any) -> Optional[float]:
+    if isinstance(value, bool) or value is None:
+        return None
+    try:
+        return float(str(value).replace(",", "").replace("$", ""))
+    except ValueError:
+        return None
+
+
+def _matches(record: Dict[str, Any], field: str, op: str, expected: Any) -> bool:
+    value = record.get(field)
+    if op == "~":
+        return str(expected).lower() in str(value or "").lower()
+    left, right = _as_number(value), _as_number(expected)
+    if left is None or right is None:
+        left, right = str(value if value is not None else "").lower(), str(expected).lower()
+    if op == "=":
+        return left == right
+    if op == "!=":
+        return left != right
+    if type(left) is not type(right):
+        return False
+    return {">": left > right, ">=": left >= right, "<": left < right, "<=": left <= right}[op]
+
+
+def _parse_filters(filters: Dict[str, Any]) -> List[tuple]:
+    parsed = []
+    for key, expected in filters.items():
+        op = next((o for o in _FILTER_OPS if key.endswith(o)), "=")
+        field = key[: -len(op)].strip() if op != "=" else key.strip()
+        parsed.append((field, op, expected))
+    return parsed
+
+
+def _aggregate(records: List[Dict[str, Any]], metrics: List[str]) -> Dict[str, Any]:
+    out: Dict[str, Any] = {}
+    for metric in metrics:
+        name, _, field = metric.partition(":")
+        if name == "count":
+            out["count"] = len(records) if not field else sum(1 for r in records if r.get(field) not in (None, ""))
+            continue
+        values = [v for v in (_as_number(r.get(field)) for r in records) if v is not None]
+        if not values:
+            out[metric] = None
+        elif name == "sum":
+            out[metric] = sum(values)
+        elif name == "avg":
+            out[metric] = round(sum(values) / len(values), 2)
+        elif name == "min":
+            out[metric] = min(values)
+        elif name == "max":
+            out[metric] = max(values)
+    return out
+
+
+class QueryResultInput(BaseModel):
+    """Page, project, filter or aggregate a result stored under a result_handle."""
+    model_config = ConfigDict(str_strip_whitespace=True, extra="forbid")
+
+    result_handle: str = Field(
+        ..., description="result_handle returned by a tool whose output was too large (e.g. 'r_3f9a...')",
+        min_length=3, max_length=64,
+    )
+    filters: Dict[str, Any] = Field(
+        default_factory=dict,
+        description=(
+            "Field conditions, all must match. Plain key = equality (case-insensitive); "
+            "suffix the key with >=, <=, >, <, != or ~ (contains), e.g. "
+            '{"forsale": "true", "yearofmfr>=": 2015, "make~": "gulfstream"}'
+        ),
+    )
+    fields: List[str] = Field(
+        default_factory=list, description="Fields to return per record. Empty = all fields.",
+    )
+    sort_by: Optional[str] = Field(default=None, description="Field to sort by (numeric when possible)")
+    descending: bool = Field(default=False, description="Sort descending")
+    group_by: Optional[str] = Field(
+        default=None, description="Aggregate per value of this field instead of returning records",
+    )
+    metrics: List[str] = Field(
+        default_factory=list,
+        description=(
+            "Aggregates: 'count', 'sum:<field>', 'avg:<field>', 'min:<field>', 'max:<field>'. "
+            "With no group_by they are computed over all matching records."
+        ),
+    )
+    offset: int = Field(default=0, ge=0, description="Records to skip (for paging)")
+    limit: int = Field(default=50, ge=1, le=500, description="Max records or groups to return")
+    response_format: ResponseFormat = Field(
+        default=ResponseFormat.JSON, description="Output format",
+    )
+
+    @field_validator("metrics")
+    @classmethod
+    def check_metrics(cls, v: List[str]) -> List[str]:
+        for metric in v:
+            name, _, field = metric.partition(":")
+            if name not in _METRICS or (name != "count" and not field):
+                raise ValueError(f"Invalid metric '{metric}'. Use count, sum:<field>, avg:<field>, min:<field> or max:<field>.")
+        return v
+
+
+@mcp.tool(
+    name="jetnet_query_result",
+    annotations={
+        "title": "Query a Stored Large Result",
+        "readOnlyHint": True,
+        "destructiveHint": False,
+        "idempotentHint": True,
+        "openWorldHint": False,
+    },
+)
+async def jetnet_query_result(params: QueryResultInput, ctx=None) -> str:
+    """Work with a large tool result without calling JETNET again.
+
+    When a tool's JSON output exceeds the response size limit it returns a
+    summary with a `result_handle` instead. Use this tool with that handle to
+    page through the records (offset/limit), select fields, filter, sort, or
+    group and aggregate (count, sum, avg, min, max). Handles expire after
+    about 30 minutes; re-run the original tool if the handle is gone.
+    """
+    session = _get_session(ctx)
+    stored = session.results.get(params.result_handle)
+    if stored is None:
+        return (f"Result handle '{params.result_handle}' not found or expired. "
+                "Re-run the original tool to get a fresh handle.")
+
+    records = [r for r in stored["records"] if isinstance(r, dict)]
+    conditions = _parse_filters(params.filters)
+    if conditions:
+        records = [r for r in records if all(_matches(r, f, op, v) for f, op, v in conditions)]
+    matched = len(records)
+
+    if params.group_by or params.metrics:
+        metrics = params.metrics or ["count"]
+        if params.group_by:
+            groups: Dict[str, List[Dict[str, Any]]] = {}
+            for r in records:
+                groups.setdefault(str(r.get(params.group_by, "")), []).append(r)
+            rows = [{params.group_by: k, **_aggregate(v, metrics)} for k, v in groups.items()]
+            sort_key = params.sort_by or ("count" if "count" in metrics else metrics[0])
+        else:
+            rows = [_aggregate(records, metrics)]
+            sort_key = None
+    else:
+        rows = records
+        sort_key = params.sort_by
+
+    if sort_key:
+        # Groups default to largest first.
+        descending = params.descending or bool(params.group_by and not params.sort_by)
+        numeric = [r for r in rows if _as_number(r.get(sort_key)) is not None]
+        other = [r for r in rows if _as_number(r.get(sort_key)) is None]
+        numeric.sort(key=lambda r: _as_number(r.get(sort_key)), reverse=descending)
+        other.sort(key=lambda r: str(r.get(sort_key) or ""), reverse=descending)
+        rows = numeric + other
+
+    total_rows = len(rows)
+    page = rows[params.offset: params.offset + params.limit]
+    if params.fields and not (params.group_by or params.metrics):
+        page = [{f: r.get(f) for f in params.fields} for r in page]
+
+    # Keep the page within the response limit; the agent continues from next_offset.
+    budget = CHARACTER_LIMIT - 2_000
+    kept, used, clipped = [], 0, False
+    for row in page:
+        size = _rendered_size(row)
+        if not kept and size > budget:
+            # One row alone exceeds the limit: clip its values rather than break the cap.
+            row, clipped = _fit_row(row, budget), True
+            size = _rendered_size(row)
+        used += size
+        if kept and used > budget:
+            break
+        kept.append(row)
+    next_offset = params.offset + len(kept)
+
+    result: Dict[str, Any] = {
+        "result_handle": params.result_handle,
+        "source": stored["meta"].get("source"),
+        "matched_records": matched,
+        "total_rows": total_rows,
+        "offset": params.offset,
+        "returned": len(kept),
+        "next_offset": next_offset if next_offset < total_rows else None,
+        "rows": kept,
+    }
+    if clipped:
+        result["note"] = ("The first row exceeded the response limit and its values were clipped; "
+                          "use `fields` to select the columns you need.")
+
+    if params.response_format == ResponseFormat.JSON:
+        return json.dumps(result, indent=2, default=str)
+
+    columns = list(params.fields) or list(dict.fromkeys(k for row in kept for k in row))[:8]
+    lines = [
+        f"## Stored Result {params.result_handle} ({result['source']})",
+        f"**Matched**: {matched} | **Rows**: {params.offset + 1 if kept else 0}–{next_offset} of {total_rows}",
+        "",
+    ]
+    if kept:
+        lines.append("| " + " | ".join(columns) + " |")
+        lines.append("|" + "---|" * len(columns))
+        for row in kept:
+            lines.append("| " + " | ".join(str(row.get(c, "")) for c in columns) + " |")
+    if clipped:
+        lines.append(f"\n*{result['note']}*")
+    if result["next_offset"] is not None:
+        lines.append(f"\n*More rows: call again with offset={next_offset}.*")
     return "\n".join(lines)
 
 
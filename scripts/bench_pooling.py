@@ -0,0 +1,132 @@
+"""
+bench_pooling.py -- Connection pooling benchmark for src/jetnet/session.py
+
+Starts a local stand-in for the JETNET API (HTTP/1.1 keep-alive, canned
+JSON responses) and measures calls/sec for:
+
+  1. unpooled  -- one module-level requests.request() per call, i.e. a new
+                  TCP connection every time (the pre-pooling behaviour)
+  2. pooled    -- jetnet_request() on a SessionState, which reuses the
+                  session's keep-alive connection pool
+
+The stand-in server is plain HTTP, so the numbers only include the TCP
+handshake. Against the real API each unpooled call also pays a TLS
+handshake, so the gap in production is larger than shown here.
+
+Usage:
+    python scripts/bench_pooling.py
+    python scripts/bench_pooling.py --calls 2000 --threads 8
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from src.jetnet.session import TransportConfig, jetnet_request, login  # noqa: E402
+
+TAIL_PATH = "/api/Aircraft/getRegNumber/N12345/{apiToken}"
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Minimal JETNET stand-in: login, account info, and a tail lookup."""
+
+    protocol_version = "HTTP/1.1"   # keep connections open between requests
+    disable_nagle_algorithm = True  # headers and body go out as separate writes
+
+    def _reply(self, payload: dict) -> None:
+        body = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        self.rfile.read(length)
+        if self.path.startswith("/api/Admin/APILogin"):
+            self._reply({"responsestatus": "SUCCESS", "bearerToken": "BEARER", "apiToken": "TOKEN"})
+        else:
+            self._reply({"responsestatus": "SUCCESS"})
+
+    def do_GET(self):
+        if self.path.startswith("/api/Aircraft/getRegNumber/"):
+            self._reply({
+                "responsestatus": "SUCCESS",
+                "aircraftresult": {"aircraftid": 211461, "regnbr": "N12345"},
+            })
+        else:
+            self._reply({"responsestatus": "SUCCESS"})
+
+    def log_message(self, *args):
+        pass
+
+
+def start_stand_in() -> ThreadingHTTPServer:
+    """Start the stand-in server on a free localhost port in a daemon thread."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def run(fn, calls: int, threads: int) -> float:
+    """Run fn() `calls` times across `threads` workers. Returns calls/sec."""
+    start = time.perf_counter()
+    if threads <= 1:
+        for _ in range(calls):
+            fn()
+    else:
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            list(pool.map(lambda _: fn(), range(calls)))
+    return calls / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=1000)
+    parser.add_argument("--threads", type=int, default=1)
+    args = parser.parse_args()
+
+    server = start_stand_in()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    session = login("bench@example.com", "x", base_url,
+                    transport_config=TransportConfig(pool_maxsize=max(args.threads, 1)))
+
+    def unpooled():
+        url = f"{session.base_url}{TAIL_PATH}".replace("{apiToken}", session.api_token)
+        r = requests.request("GET", url, headers={
+            "Authorization": f"Bearer {session.bearer_token}",
+            "Content-Type": "application/json",
+        }, timeout=60)
+        r.raise_for_status()
+        return r.json()
+
+    def pooled():
+        return jetnet_request("GET", TAIL_PATH, session)
+
+    # Warm up both paths so the first-connection cost is not counted.
+    unpooled()
+    pooled()
+
+    print(f"{args.calls} calls, {args.threads} thread(s), stand-in at {base_url}")
+    base = run(unpooled, args.calls, args.threads)
+    print(f"  unpooled (requests.request): {base:8.0f} calls/sec")
+    fast = run(pooled, args.calls, args.threads)
+    print(f"  pooled   (jetnet_request):   {fast:8.0f} calls/sec  ({fast / base:.1f}x)")
+
+    session.close()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
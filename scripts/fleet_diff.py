@@ -0,0 +1,204 @@
+"""
+fleet_diff.py -- Fingerprint bulk-export records and emit typed change events.
+
+A watchlist poll (prompts/03_fleet_watchlist_alerts.md) that keeps every
+aircraft record in a JSON state file and compares all fields on every run
+is slow, and the state file grows large. FleetDiff keeps, per aircraft:
+
+    h  -- one hash of the whole record
+    g  -- one hash per field group: ownership, market, contacts
+    v  -- only the few tracked values needed to describe a change
+          (owner/operator names, forsale, status, asking, owner contact)
+    c  -- the non-empty contact-group fields (owr*, opr*, chp*, brokers, ...),
+          so a contact_change reports exactly the fields that changed
+
+An aircraft whose record hash matches the stored one is skipped after a
+single hash. If the hash differs, only the groups whose hash changed are
+diffed, and each change becomes a typed ChangeEvent:
+
+    new_aircraft       forsale_flip        status_change      asking_change
+    owner_change       operator_change     contact_change
+
+Usage:
+    from scripts.fleet_diff import FleetDiff
+
+    diff = FleetDiff.load("watchlist_state.json")
+    events = diff.apply(records)          # bulk-export records from this poll
+    diff.save("watchlist_state.json")
+    for e in events:
+        print(e.regnbr, e.kind, e.old, "->", e.new)
+
+    python scripts/fleet_diff.py old.json new.json    # diff two saved bulk-export responses
+"""
+
+import hashlib
+import json
+import os
+import sys
+from dataclasses import asdict, dataclass
+from operator import itemgetter
+from typing import Any
+
+OWNERSHIP_FIELDS = ("owrcompid", "owrcompanyname", "oprcompid", "oprcompanyname", "ownership")
+MARKET_FIELDS = ("forsale", "status", "asking", "datelisted")
+CONTACT_PREFIXES = ("owr", "opr", "chp", "excbrk1", "excbrk2", "addl1", "addl2", "addl3")
+OWNER_CONTACT_FIELDS = ("owrcontactid", "owrfname", "owrlname", "owrtitle", "owremail")
+
+# Values kept in state so events can report old -> new.
+TRACKED_FIELDS = OWNERSHIP_FIELDS + MARKET_FIELDS + OWNER_CONTACT_FIELDS + ("regnbr",)
+
+# Embedded arrays (acevents, flightdata, ...) change on almost every poll and
+# have no alert of their own, so they do not count towards the record hash.
+IGNORED_FIELDS = {"_schema_note", "acevents", "flightdata", "acmaintenance",
+                  "acaddequipment", "acexteriors", "acinteriors"}
+
+
+@dataclass
+class ChangeEvent:
+    kind: str
+    aircraftid: int
+    regnbr: str
+    field: str = None
+    old: Any = None
+    new: Any = None
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def _digest(values) -> str:
+    return hashlib.blake2b(
+        "\x1f".join(map(str, values)).encode(), digest_size=8
+    ).hexdigest()
+
+
+def _is_contact_field(field: str) -> bool:
+    return field.startswith(CONTACT_PREFIXES) and field not in OWNERSHIP_FIELDS
+
+
+# Records from one endpoint share a key layout. Cache, per layout, the
+# sorted field getter and a hash pre-seeded with the field names, so each
+# record costs one repr() of its values and one hash update.
+_layouts = {}
+
+
+def _layout(record: dict) -> tuple:
+    keys = tuple(record)
+    layout = _layouts.get(keys)
+    if layout is None:
+        fields = tuple(sorted(k for k in keys if k not in IGNORED_FIELDS))
+        seed = hashlib.blake2b(repr(fields).encode(), digest_size=8)
+        contacts = tuple(k for k in fields if _is_contact_field(k))
+        layout = _layouts[keys] = (itemgetter(*fields), seed, contacts)
+    return layout
+
+
+def record_hash(record: dict) -> str:
+    """Hash of every field except IGNORED_FIELDS."""
+    getter, seed, _ = _layout(record)
+    h = seed.copy()
+    h.update(repr(getter(record)).encode())
+    return h.hexdigest()
+
+
+def group_hashes(record: dict) -> dict:
+    """Hashes of the ownership, market and contacts field groups."""
+    contacts = _layout(record)[2]
+    return {
+        "ownership": _digest(record.get(k) for k in OWNERSHIP_FIELDS),
+        "market": _digest(record.get(k) for k in MARKET_FIELDS),
+        "contacts": _digest(f"{k}={record[k]}" for k in contacts),
+    }
+
+
+class FleetDiff:
+    """Per-aircraft fingerprints plus tracked values, keyed by aircraftid."""
+
+    def __init__(self, state: dict = None):
+        self.aircraft = (state or {}).get("aircraft", {})
+
+    @classmethod
+    def load(cls, path: str) -> "FleetDiff":
+        if not os.path.exists(path):
+            return cls()
+        with open(path) as f:
+            return cls(json.load(f))
+
+    def save(self, path: str, **extra) -> None:
+        """Write state atomically; `extra` keys (e.g. last_run) are stored alongside."""
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(dict(extra, aircraft=self.aircraft), f, separators=(",", ":"))
+        os.replace(tmp_path, path)
+
+    def apply(self, records: list) -> list:
+        """Compare `records` with the stored state, update it, and return ChangeEvents."""
+        events = []
+        for record in records:
+            key = str(record.get("aircraftid"))
+            digest = record_hash(record)
+            stored = self.aircraft.get(key)
+            if stored is not None and stored["h"] == digest:
+                continue
+
+            groups = group_hashes(record)
+            values = {k: record.get(k) for k in TRACKED_FIELDS if record.get(k) not in (None, "")}
+            contacts = {k: record[k] for k in _layout(record)[2] if record[k] not in (None, "")}
+            if stored is None:
+                events.append(ChangeEvent("new_aircraft", record.get("aircraftid"), record.get("regnbr")))
+            else:
+                events.extend(self._diff(record, stored, groups, values, contacts))
+            self.aircraft[key] = {"h": digest, "g": groups, "v": values, "c": contacts}
+        return events
+
+    @staticmethod
+    def _diff(record: dict, stored: dict, groups: dict, values: dict, contacts: dict) -> list:
+        old = stored["v"]
+        changed = {g for g, h in groups.items() if stored["g"].get(g) != h}
+        aircraft_id, regnbr = record.get("aircraftid"), record.get("regnbr")
+        events = []
+
+        def compare(kind, field):
+            if old.get(field) != values.get(field):
+                events.append(ChangeEvent(kind, aircraft_id, regnbr, field, old.get(field), values.get(field)))
+                return True
+            return False
+
+        if "market" in changed:
+            compare("forsale_flip", "forsale")
+            compare("status_change", "status")
+            compare("asking_change", "asking")
+        if "ownership" in changed:
+            if not compare("owner_change", "owrcompanyname"):
+                compare("owner_change", "owrcompid")
+            if not compare("operator_change", "oprcompanyname"):
+                compare("operator_change", "oprcompid")
+        if "contacts" in changed:
+            old_contacts = stored.get("c")
+            if old_contacts is None:
+                # State written before "c" existed: only owner contact values are known.
+                old_contacts = {k: old[k] for k in OWNER_CONTACT_FIELDS if k in old}
+                contacts = {k: v for k, v in contacts.items() if k in OWNER_CONTACT_FIELDS}
+            differing = sorted(k for k in old_contacts.keys() | contacts.keys()
+                               if old_contacts.get(k) != contacts.get(k))
+            if differing:
+                events.append(ChangeEvent("contact_change", aircraft_id, regnbr, "contacts",
+                                          {k: old_contacts.get(k) for k in differing},
+                                          {k: contacts.get(k) for k in differing}))
+        return events
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        print("Usage: python scripts/fleet_diff.py <old-response.json> <new-response.json>")
+        sys.exit(1)
+
+    def load_records(path):
+        with open(path) as f:
+            data = json.load(f)
+        return data.get("response", data).get("aircraft") or []
+
+    diff = FleetDiff()
+    diff.apply(load_records(sys.argv[1]))
+    for event in diff.apply(load_records(sys.argv[2])):
+        print(f"  {event.regnbr or event.aircraftid:<10} {event.kind:<16} {event.old} -> {event.new}")
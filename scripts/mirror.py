@@ -0,0 +1,354 @@
+"""
+mirror.py -- Local SQLite mirror of a bulk-export fleet, kept current with delta pulls.
+
+docs/bulk-export.md describes the integration pattern: one snapshot
+export, then periodic delta pulls with aircraftchanges=true. A delta pull
+returns the full relational graph of every aircraft whose graph changed
+since your last call. FleetMirror implements that pattern:
+
+    1. snapshot  -- full export; when it completes, aircraft it did not return
+                    are swept together with their graph rows, so the store
+                    matches the export exactly
+    2. delta     -- aircraftchanges=true; each aircraft in the delta is
+                    upserted with its companies, contacts, phones,
+                    relationships and embedded arrays (acevents, flightdata, ...)
+
+Every page is applied in ONE transaction with batched executemany()
+upserts, so a crash never leaves an aircraft half-updated, and an hourly
+delta of a few dozen aircraft takes seconds.
+
+Records are split with BulkNormalizer (scripts/normalize_bulk.py). Each
+table keeps its key columns plus the full row as JSON in `data`.
+
+Usage:
+    python scripts/mirror.py fleet.db 278 288        # snapshot first time, delta after
+    python scripts/mirror.py fleet.db 278 288 --snapshot
+
+    from scripts.mirror import FleetMirror
+    mirror = FleetMirror("fleet.db")
+    mirror.sync(bearer, token, body)     # snapshot if the store is empty, else delta
+    mirror.counts()
+
+Delta cursors live on the JETNET side ("since your last call"), so the
+mirror only records each run in the sync_runs table for auditing. It
+does not track a watermark.
+"""
+
+import json
+import os
+import sqlite3
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from scripts.normalize_bulk import BulkNormalizer  # noqa: E402
+from scripts.paginate import _find_records, iter_pages  # noqa: E402
+
+BULK_PATH = "/api/Aircraft/getBulkAircraftExportPaged"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS aircraft (
+    aircraftid INTEGER PRIMARY KEY,
+    regnbr     TEXT,
+    modelid    INTEGER,
+    forsale    TEXT,
+    data       TEXT NOT NULL,
+    synced_at  REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS aircraft_regnbr ON aircraft (regnbr);
+
+CREATE TABLE IF NOT EXISTS company (
+    compid      INTEGER PRIMARY KEY,
+    companyname TEXT,
+    data        TEXT NOT NULL,
+    synced_at   REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS contact (
+    contact_key TEXT PRIMARY KEY,     -- contactid, or a content hash when there is none
+    contactid   INTEGER,
+    compid      INTEGER,
+    data        TEXT NOT NULL,
+    synced_at   REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS contact_compid ON contact (compid);
+
+CREATE TABLE IF NOT EXISTS phone (
+    compid    INTEGER,
+    contactid INTEGER,
+    number    TEXT NOT NULL,
+    type      TEXT
+);
+CREATE INDEX IF NOT EXISTS phone_owner ON phone (compid, contactid);
+
+CREATE TABLE IF NOT EXISTS relationship (
+    aircraftid  INTEGER NOT NULL,
+    role        TEXT NOT NULL,
+    compid      INTEGER,
+    contactid   INTEGER,
+    contact_key TEXT                  -- joins contact.contact_key, also for contacts without an ID
+);
+CREATE INDEX IF NOT EXISTS relationship_aircraft ON relationship (aircraftid);
+CREATE INDEX IF NOT EXISTS relationship_company ON relationship (compid);
+
+CREATE TABLE IF NOT EXISTS embedded (
+    aircraftid INTEGER NOT NULL,
+    kind       TEXT NOT NULL,          -- acevents, flightdata, acmaintenance, ...
+    data       TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS embedded_aircraft ON embedded (aircraftid, kind);
+
+CREATE TABLE IF NOT EXISTS sync_runs (
+    id          INTEGER PRIMARY KEY AUTOINCREMENT,
+    mode        TEXT NOT NULL,         -- snapshot | delta
+    started_at  REAL NOT NULL,
+    finished_at REAL,
+    pages       INTEGER NOT NULL DEFAULT 0,
+    aircraft    INTEGER NOT NULL DEFAULT 0,
+    status      TEXT NOT NULL          -- running | ok | failed: <error>
+);
+"""
+
+GRAPH_TABLES = ("aircraft", "company", "contact", "phone", "relationship")
+
+
+def _json(row: dict) -> str:
+    return json.dumps(row, sort_keys=True, default=str, separators=(",", ":"))
+
+
+def _merge_json(row: dict) -> str:
+    """JSON for json_patch(): empty values dropped so they never overwrite stored ones."""
+    return _json({k: v for k, v in row.items() if v not in (None, "")})
+
+
+class FleetMirror:
+    """SQLite store for one bulk-export scope (one modlist/filter set per file)."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.conn = sqlite3.connect(path, isolation_level=None)   # explicit BEGIN/COMMIT
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(relationship)")}
+        if "contact_key" not in columns:   # stores created before contact_key existed
+            self.conn.execute("ALTER TABLE relationship ADD COLUMN contact_key TEXT")
+
+    def close(self) -> None:
+        self.conn.close()
+
+    # -- applying pages -------------------------------------------------------
+
+    def apply_page(self, records: list) -> int:
+        """
+        Upsert one page of bulk-export records and their graphs in a single
+        transaction. Returns the number of aircraft written.
+
+        Per aircraft, relationships and embedded rows are replaced outright
+        (delta records are complete). Companies and contacts are upserted by
+        merging the new non-empty fields into the stored JSON (json_patch),
+        since a role slot such as excbrk1* carries fewer company fields than
+        owr*. Phones are replaced only for (compid, contactid) slots whose
+        record carried phone fields; phones of slots the page's aircraft no
+        longer reference are deleted once no relationship refers to them.
+        """
+        if not records:
+            return 0
+        tables = BulkNormalizer()
+        tables.add_page(records)
+        now = time.time()
+
+        aircraft = list(tables["aircraft"].iter_rows())
+        aircraft_ids = [(a["aircraftid"],) for a in aircraft]
+        companies = list(tables["company"].iter_rows())
+        contacts = list(tables["contact"].iter_rows())
+        phones = list(tables["phone"].iter_rows())
+        embedded = [
+            (row.get("aircraftid"), name, _json(row))
+            for name, table in tables.tables.items() if name not in GRAPH_TABLES
+            for row in table.iter_rows()
+        ]
+
+        relationships = list(tables["relationship"].iter_rows())
+        new_owners = {(r.get("compid"), r.get("contactid")) for r in relationships}
+        phone_slots = tables.phone_slots
+
+        cur = self.conn.cursor()
+        cur.execute("BEGIN")
+        try:
+            old_owners = {
+                owner for (aircraft_id,) in aircraft_ids
+                for owner in cur.execute(
+                    "SELECT DISTINCT compid, contactid FROM relationship WHERE aircraftid = ?", (aircraft_id,)
+                )
+            }
+            cur.executemany(
+                "INSERT INTO aircraft (aircraftid, regnbr, modelid, forsale, data, synced_at) "
+                "VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT (aircraftid) DO UPDATE SET "
+                "regnbr = excluded.regnbr, modelid = excluded.modelid, forsale = excluded.forsale, "
+                "data = excluded.data, synced_at = excluded.synced_at",
+                [(a["aircraftid"], a.get("regnbr"), a.get("modelid"), a.get("forsale"), _json(a), now)
+                 for a in aircraft],
+            )
+            cur.executemany(
+                "INSERT INTO company (compid, companyname, data, synced_at) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (compid) DO UPDATE SET "
+                "companyname = COALESCE(excluded.companyname, company.companyname), "
+                "data = json_patch(company.data, excluded.data), synced_at = excluded.synced_at",
+                [(c["compid"], c.get("companyname") or None, _merge_json(c), now) for c in companies],
+            )
+            cur.executemany(
+                "INSERT INTO contact (contact_key, contactid, compid, data, synced_at) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (contact_key) DO UPDATE SET compid = COALESCE(excluded.compid, contact.compid), "
+                "data = json_patch(contact.data, excluded.data), synced_at = excluded.synced_at",
+                [(c["contact_key"], c.get("contactid"), c.get("compid"), _merge_json(c), now) for c in contacts],
+            )
+
+            cur.executemany("DELETE FROM relationship WHERE aircraftid = ?", aircraft_ids)
+            cur.executemany(
+                "INSERT INTO relationship (aircraftid, role, compid, contactid, contact_key) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [(r["aircraftid"], r["role"], r.get("compid"), r.get("contactid"), r.get("contact_key"))
+                 for r in relationships],
+            )
+
+            # Phones belong to a (compid, contactid) slot. Replace them only for
+            # slots whose record carried phone fields (even if all empty): a
+            # slot without phone fields (opr*, excbrk*) says nothing about
+            # them. Drop the phones of slots nothing references any more.
+            cur.executemany("DELETE FROM phone WHERE compid IS ? AND contactid IS ?", phone_slots)
+            cur.executemany(
+                "INSERT INTO phone (compid, contactid, number, type) VALUES (?, ?, ?, ?)",
+                [(p.get("compid"), p.get("contactid"), p["number"], p.get("type")) for p in phones],
+            )
+            cur.executemany(
+                "DELETE FROM phone WHERE compid IS ?1 AND contactid IS ?2 AND NOT EXISTS "
+                "(SELECT 1 FROM relationship WHERE compid IS ?1 AND contactid IS ?2)",
+                old_owners - new_owners,
+            )
+
+            cur.executemany("DELETE FROM embedded WHERE aircraftid = ?", aircraft_ids)
+            cur.executemany("INSERT INTO embedded (aircraftid, kind, data) VALUES (?, ?, ?)", embedded)
+            cur.execute("COMMIT")
+        except BaseException:
+            cur.execute("ROLLBACK")
+            raise
+        return len(aircraft)
+
+    def sweep(self, since: float) -> dict:
+        """
+        Delete everything a completed snapshot did not touch: aircraft (and
+        their relationship / embedded rows), companies and contacts with
+        synced_at < `since`, then phones no relationship refers to.
+        Returns rows removed per table.
+        """
+        cur = self.conn.cursor()
+        cur.execute("BEGIN")
+        try:
+            removed = {
+                "aircraft": cur.execute("DELETE FROM aircraft WHERE synced_at < ?", (since,)).rowcount,
+                "company": cur.execute("DELETE FROM company WHERE synced_at < ?", (since,)).rowcount,
+                "contact": cur.execute("DELETE FROM contact WHERE synced_at < ?", (since,)).rowcount,
+            }
+            for table in ("relationship", "embedded"):
+                removed[table] = cur.execute(
+                    f"DELETE FROM {table} WHERE aircraftid NOT IN (SELECT aircraftid FROM aircraft)"
+                ).rowcount
+            removed["phone"] = cur.execute(
+                "DELETE FROM phone WHERE NOT EXISTS (SELECT 1 FROM relationship r "
+                "WHERE r.compid IS phone.compid AND r.contactid IS phone.contactid)"
+            ).rowcount
+            cur.execute("COMMIT")
+        except BaseException:
+            cur.execute("ROLLBACK")
+            raise
+        return removed
+
+    # -- sync runs ------------------------------------------------------------
+
+    def _run(self, mode: str, bearer: str, token: str, body: dict, pagesize: int, **options) -> dict:
+        started = time.time()
+        removed = None
+        run_id = self.conn.execute(
+            "INSERT INTO sync_runs (mode, started_at, status) VALUES (?, ?, 'running')", (mode, started)
+        ).lastrowid
+        pages = written = 0
+        status = "ok"
+        try:
+            for _, data in iter_pages(bearer, token, BULK_PATH, body, pagesize, **options):
+                written += self.apply_page(_find_records(data))
+                pages += 1
+                self.conn.execute("UPDATE sync_runs SET pages = ?, aircraft = ? WHERE id = ?",
+                                  (pages, written, run_id))
+            if mode == "snapshot":
+                removed = self.sweep(started)
+        except BaseException as e:
+            status = f"failed: {e}"
+            raise
+        finally:
+            self.conn.execute("UPDATE sync_runs SET finished_at = ?, status = ? WHERE id = ?",
+                              (time.time(), status, run_id))
+        result = {"mode": mode, "pages": pages, "aircraft": written,
+                  "seconds": round(time.time() - started, 2)}
+        if removed is not None:
+            result["removed"] = removed
+        return result
+
+    def snapshot(self, bearer: str, token: str, body: dict, pagesize: int = 50, **options) -> dict:
+        """
+        Full export (aircraftchanges omitted) applied page by page. Once every
+        page is in, rows the export did not return are swept (see sweep()).
+        A failed snapshot sweeps nothing.
+        """
+        body = {k: v for k, v in body.items() if k != "aircraftchanges"}
+        return self._run("snapshot", bearer, token, body, pagesize, **options)
+
+    def sync_delta(self, bearer: str, token: str, body: dict, pagesize: int = 50, **options) -> dict:
+        """Delta pull (aircraftchanges=true): only aircraft whose graph changed since the last call."""
+        return self._run("delta", bearer, token, dict(body, aircraftchanges=True), pagesize, **options)
+
+    def has_snapshot(self) -> bool:
+        return self.conn.execute(
+            "SELECT 1 FROM sync_runs WHERE mode = 'snapshot' AND status = 'ok' LIMIT 1"
+        ).fetchone() is not None
+
+    def sync(self, bearer: str, token: str, body: dict, pagesize: int = 50, **options) -> dict:
+        """Snapshot if no snapshot has completed yet, otherwise a delta pull."""
+        if self.has_snapshot():
+            return self.sync_delta(bearer, token, body, pagesize, **options)
+        return self.snapshot(bearer, token, body, pagesize, **options)
+
+    def counts(self) -> dict:
+        return {
+            table: self.conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+            for table in GRAPH_TABLES + ("embedded",)
+        }
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from src.jetnet.session import login
+
+    parser = argparse.ArgumentParser(description="Snapshot / delta-sync a bulk-export fleet into SQLite.")
+    parser.add_argument("db", help="SQLite file (one per model scope)")
+    parser.add_argument("modlist", type=int, nargs="+", help="AMODIDs to mirror")
+    parser.add_argument("--snapshot", action="store_true", help="force a full snapshot")
+    parser.add_argument("--pagesize", type=int, default=50)
+    args = parser.parse_args()
+
+    session = login()
+    mirror = FleetMirror(args.db)
+    body = {"modlist": args.modlist, "maketype": "None", "airframetype": "None",
+            "forsale": "", "actiondate": "", "enddate": "", "aclist": []}
+    if args.snapshot:
+        result = mirror.snapshot(session.bearer_token, session.api_token, body, args.pagesize)
+    else:
+        result = mirror.sync(session.bearer_token, session.api_token, body, args.pagesize)
+    print(f"{result['mode']}: {result['aircraft']} aircraft in {result['pages']} page(s), "
+          f"{result['seconds']}s")
+    if result.get("removed"):
+        print(f"swept: {result['removed']}")
+    print(mirror.counts())
+    mirror.close()
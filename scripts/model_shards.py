@@ -0,0 +1,161 @@
+"""
+model_shards.py -- Pack model IDs into fleet-balanced shards for parallel pulls.
+
+A large modlist export is either one enormous query or a one-model-per-call
+loop. The loop wastes calls on models with 5 aircraft and leaves a
+straggler on the model with 2,000. This script uses fleetCount from
+references/model-id-table.json to pack AMODIDs into shards of roughly equal
+size, so parallel workers finish together.
+
+Usage:
+    python scripts/model_shards.py "citation"                 # default target
+    python scripts/model_shards.py "gulfstream" --target 500
+    python scripts/model_shards.py "challenger" --shards 4
+
+In code:
+    from scripts.model_shards import shard_models, paginate_sharded
+
+    shards = shard_models([145, 278, 288, 1194, ...], target_records=2000)
+    records = paginate_sharded(bearer, token, "/api/Aircraft/getBulkAircraftExportPaged",
+                               body, shards, pagesize=50, workers=4)
+
+Shard weight is fleetCount x records_per_aircraft. For bulk export that is
+about 1. For history and flight data, pass an estimate for the date range,
+e.g. records_per_aircraft=40 for a year of flights. A model that is larger
+than the target on its own gets its own shard. Split it further by date
+(paginate_by_date_window in scripts/paginate.py).
+"""
+
+import argparse
+import heapq
+import json
+import math
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(SCRIPT_DIR, ".."))
+
+from scripts.model_search import TABLE_PATH, search  # noqa: E402
+from scripts.paginate import paginate_all  # noqa: E402
+
+DEFAULT_TARGET_RECORDS = 2000
+
+
+def load_fleet_counts(path: str = TABLE_PATH) -> dict:
+    """Return {amodid: fleetCount} from the model-ID reference table."""
+    with open(path) as f:
+        return {m["amodid"]: m["fleetCount"] for m in json.load(f)}
+
+
+def shard_models(
+    amodids: list,
+    target_records: int = DEFAULT_TARGET_RECORDS,
+    shards: int = None,
+    records_per_aircraft: float = 1.0,
+    fleet_counts: dict = None,
+) -> list:
+    """
+    Pack model IDs into shards of roughly equal expected record count.
+
+    Uses longest-processing-time-first packing: models are sorted by weight
+    (largest first) and each goes to the currently lightest shard.
+
+    Args:
+        amodids:              model IDs to pack
+        target_records:       expected records per shard; sets the shard count
+        shards:               fixed shard count (overrides target_records)
+        records_per_aircraft: expected records per aircraft for the query
+        fleet_counts:         {amodid: fleetCount}; defaults to the reference table.
+                              Models missing from it are weighted as 1 aircraft.
+
+    Returns:
+        List of shards, each a list of AMODIDs, largest shard first
+    """
+    if fleet_counts is None:
+        fleet_counts = load_fleet_counts()
+    weights = {m: max(fleet_counts.get(m, 1), 1) * records_per_aircraft for m in set(amodids)}
+    if not weights:
+        return []
+
+    if shards is None:
+        shards = math.ceil(sum(weights.values()) / target_records)
+    shards = max(1, min(shards, len(weights)))
+
+    heap = [(0.0, i) for i in range(shards)]   # (shard weight, shard index)
+    packed = [[] for _ in range(shards)]
+    for amodid in sorted(weights, key=lambda m: (-weights[m], m)):
+        load, index = heapq.heappop(heap)
+        packed[index].append(amodid)
+        heapq.heappush(heap, (load + weights[amodid], index))
+
+    loads = {index: load for load, index in heap}
+    order = sorted(range(shards), key=lambda i: -loads[i])
+    return [packed[i] for i in order]
+
+
+def paginate_sharded(
+    bearer: str,
+    token: str,
+    base_path: str,
+    body: dict,
+    shards: list,
+    pagesize: int = 100,
+    workers: int = 4,
+    **options,
+) -> list:
+    """
+    Run one paginated query per shard (body["modlist"] = shard) on `workers`
+    threads and return the combined records in shard order.
+
+    Works with any modlist-filtered paged endpoint: getBulkAircraftExportPaged,
+    getHistoryListPaged, getFlightDataPaged, ... Extra keyword arguments go to
+    paginate_all (retry, timeout, limiter, max_pages).
+    """
+    def run(shard):
+        return paginate_all(bearer, token, base_path, dict(body, modlist=shard), pagesize, **options)
+
+    all_records = []
+    with ThreadPoolExecutor(max_workers=max(workers, 1)) as pool:
+        for records in pool.map(run, shards):
+            all_records.extend(records)
+    return all_records
+
+
+def format_shards(shards: list, fleet_counts: dict) -> str:
+    lines = [f"  {'SHARD':>5}  {'MODELS':>6}  {'FLEET':>6}  modlist"]
+    for i, shard in enumerate(shards, 1):
+        fleet = sum(fleet_counts.get(m, 1) for m in shard)
+        lines.append(f"  {i:>5}  {len(shard):>6}  {fleet:>6}  {shard}")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pack matching model IDs into fleet-balanced shards.")
+    parser.add_argument("term", help="make / model / ICAO search term (as in model_search.py)")
+    parser.add_argument("--target", type=int, default=DEFAULT_TARGET_RECORDS,
+                        help=f"expected records per shard (default {DEFAULT_TARGET_RECORDS})")
+    parser.add_argument("--shards", type=int, help="fixed number of shards")
+    parser.add_argument("--per-aircraft", type=float, default=1.0,
+                        help="expected records per aircraft (default 1, i.e. bulk export)")
+    args = parser.parse_args()
+
+    with open(TABLE_PATH) as f:
+        table = json.load(f)
+    fleet_counts = {m["amodid"]: m["fleetCount"] for m in table}
+    models = search(args.term, table)
+    if not models:
+        print("  No matches found.")
+        return
+
+    shards = shard_models([m["amodid"] for m in models], args.target, args.shards,
+                          args.per_aircraft, fleet_counts)
+    total = sum(m["fleetCount"] for m in models)
+    print(f"  {len(models)} model(s), {total} aircraft, "
+          f"{len(shards)} shard(s) -- each ~{round(total / len(shards)):,} aircraft\n")
+    print(format_shards(shards, fleet_counts))
+
+
+if __name__ == "__main__":
+    main()
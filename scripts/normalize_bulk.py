@@ -0,0 +1,319 @@
+"""
+normalize_bulk.py -- Normalize flat getBulkAircraftExportPaged records into column tables.
+
+Each bulk-export record is one wide row per aircraft. Relationships are
+flattened into prefixed fields (see docs/bulk-export.md):
+
+    owr*  Owner          excbrk1* / excbrk2*        Exclusive Brokers
+    opr*  Operator       addl1* / addl2* / addl3*   Additional relationships
+    chp*  Chief Pilot
+
+The same owner, broker and management companies repeat across hundreds of
+aircraft. Keeping the raw dicts stores every copy. BulkNormalizer splits
+each record into five tables:
+
+    aircraft      -- one row per aircraftid (non-relationship scalar fields)
+    company       -- one row per compid
+    contact       -- one row per contactid (or per content hash if there is no ID)
+    phone         -- one row per (compid, contactid, number)
+    relationship  -- aircraftid, role, compid, contactid, contact_key
+
+Embedded arrays (acevents, flightdata, acmaintenance, ...) get a table of
+their own named after the field, each row tagged with its aircraftid.
+
+Tables are column-wise: a list per column, with repeated strings interned.
+Companies and contacts are deduplicated by ID. Each role slot carries a
+different subset of a company's fields (owr* has the address, excbrk1* only
+the name), so rows with the same key are merged field by field: fields the
+stored row lacks are filled in, and only a different value in a field both
+rows carry counts as an update (the newest value wins).
+
+Contacts without a contactid are keyed by a content hash. Both the contact
+row and its relationship rows carry that key as `contact_key`
+(str(contactid), or "h:<hash>"), so they can be joined.
+
+Usage:
+    from scripts.normalize_bulk import BulkNormalizer, normalize_bulk_export
+
+    tables = normalize_bulk_export(bearer, token, body)          # fetch + normalize
+    tables.stats()        # rows per table, duplicates skipped, updates applied
+    tables["company"].column("companyname")
+
+    normalizer = BulkNormalizer()
+    for page, data in iter_pages(...):                            # or feed pages yourself
+        normalizer.add_page(data["aircraft"])
+
+    python scripts/normalize_bulk.py examples/responses/bulk-export-hourly.json
+"""
+
+import hashlib
+import json
+import os
+import re
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from scripts.paginate import iter_records  # noqa: E402
+
+# Longest prefixes first, so "excbrk1" is tried before anything shorter.
+ROLE_PREFIXES = {
+    "excbrk1": "Exclusive Broker 1",
+    "excbrk2": "Exclusive Broker 2",
+    "addl1": "Additional 1",
+    "addl2": "Additional 2",
+    "addl3": "Additional 3",
+    "owr": "Owner",
+    "opr": "Operator",
+    "chp": "Chief Pilot",
+}
+
+CONTACT_FIELDS = {"contactid", "salut", "fname", "mname", "lname", "title", "email"}
+_PHONE_FIELD = re.compile(r"phone\d*$")
+_PHONE_TYPE = re.compile(r"^(.*\S)\s+([A-Z]{2,5})$")   # "708-571-4137 OFF" -> number, type
+
+# Fields that describe the response, not the aircraft.
+SKIP_FIELDS = {"_schema_note"}
+
+
+def _intern(value):
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _content_hash(row: dict) -> str:
+    return hashlib.blake2b(
+        json.dumps(row, sort_keys=True, default=str).encode(), digest_size=16
+    ).hexdigest()
+
+
+def _has_value(value) -> bool:
+    return value not in (None, "", 0)
+
+
+def contact_key_for(contact: dict) -> str:
+    """str(contactid), or "h:<content hash>" for a contact without an ID."""
+    contact_id = contact.get("contactid")
+    if _has_value(contact_id):
+        return str(contact_id)
+    return "h:" + _content_hash({k: v for k, v in contact.items() if k != "contact_key"})
+
+
+class ColumnTable:
+    """
+    Column-oriented table: one list per column, optional unique key.
+
+    A row appended with a key that already exists is merged into the stored
+    row: None and "" values are ignored (a thinner slot carries no
+    information for them), new fields are filled in (a merge), and a
+    differing value in a field both rows carry overwrites the stored one
+    (an update). A row that adds nothing counts as a duplicate.
+    """
+
+    def __init__(self, name: str, key: tuple = None):
+        self.name = name
+        self.key = key
+        self.columns = {}
+        self.rows = 0
+        self._index = {}    # key value -> row number
+        self.duplicates = 0
+        self.merges = 0
+        self.updates = 0
+
+    def _set(self, row_number: int, row: dict) -> None:
+        for column, value in row.items():
+            values = self.columns.get(column)
+            if values is None:
+                values = self.columns[column] = [None] * self.rows
+            values[row_number] = _intern(value)
+
+    def add(self, row: dict, key=None) -> None:
+        """Append a row, or merge it into an existing row with the same key."""
+        if key is None and self.key:
+            key = tuple(row.get(k) for k in self.key)
+        if key is not None:
+            existing = self._index.get(key)
+            if existing is not None:
+                self._merge(existing, row)
+                return
+            self._index[key] = self.rows
+
+        for values in self.columns.values():
+            values.append(None)
+        self.rows += 1
+        self._set(self.rows - 1, row)
+
+    def _merge(self, row_number: int, row: dict) -> None:
+        changed = added = False
+        for column, value in row.items():
+            if value is None or value == "":
+                continue
+            values = self.columns.get(column)
+            stored = values[row_number] if values is not None else None
+            if stored == value:
+                continue
+            if stored is None or stored == "":
+                added = True
+            else:
+                changed = True
+            if values is None:
+                values = self.columns[column] = [None] * self.rows
+            values[row_number] = _intern(value)
+        if changed:
+            self.updates += 1
+        elif added:
+            self.merges += 1
+        else:
+            self.duplicates += 1
+
+    def column(self, name: str) -> list:
+        return self.columns.get(name, [None] * self.rows)
+
+    def iter_rows(self):
+        """Yield rows as dicts (skipping null columns), e.g. for loading into a database."""
+        names = list(self.columns)
+        for i in range(self.rows):
+            yield {n: self.columns[n][i] for n in names if self.columns[n][i] is not None}
+
+    def __len__(self) -> int:
+        return self.rows
+
+
+class BulkNormalizer:
+    """Accumulates normalized tables from bulk-export records, page by page."""
+
+    def __init__(self):
+        self.tables = {
+            "aircraft": ColumnTable("aircraft", key=("aircraftid",)),
+            "company": ColumnTable("company", key=("compid",)),
+            "contact": ColumnTable("contact"),
+            "phone": ColumnTable("phone", key=("compid", "contactid", "number")),
+            "relationship": ColumnTable("relationship", key=("aircraftid", "role", "compid", "contact_key")),
+        }
+        # (compid, contactid) of every role slot that carried phone fields, even
+        # empty ones: the slots whose phone list this data is authoritative for.
+        self.phone_slots = set()
+
+    def __getitem__(self, name: str) -> ColumnTable:
+        return self.tables[name]
+
+    def add_page(self, records: list) -> None:
+        for record in records:
+            self.add_record(record)
+
+    def add_record(self, record: dict) -> None:
+        aircraft_id = record.get("aircraftid")
+        aircraft = {}
+        roles = {}   # prefix -> {suffix: value}
+
+        for field, value in record.items():
+            if field in SKIP_FIELDS:
+                continue
+            prefix = next((p for p in ROLE_PREFIXES if field.startswith(p)), None)
+            if prefix:
+                roles.setdefault(prefix, {})[field[len(prefix):]] = value
+            elif isinstance(value, list):
+                self._add_embedded(field, aircraft_id, value)
+            else:
+                aircraft[field] = value
+        self.tables["aircraft"].add(aircraft)
+
+        for prefix, fields in roles.items():
+            self._add_role(aircraft_id, ROLE_PREFIXES[prefix], fields)
+
+    def _add_embedded(self, name: str, aircraft_id, rows: list) -> None:
+        table = self.tables.get(name)
+        if table is None:
+            table = self.tables[name] = ColumnTable(name)
+        for row in rows:
+            if isinstance(row, dict):
+                table.add(row if "aircraftid" in row else dict(row, aircraftid=aircraft_id))
+
+    def _add_role(self, aircraft_id, role: str, fields: dict) -> None:
+        comp_id = fields.get("compid")
+        company = {"compid": comp_id}
+        contact = {}
+        phones = []
+        has_phone_fields = False
+        for suffix, value in fields.items():
+            if suffix == "compid":
+                continue
+            if suffix in CONTACT_FIELDS:
+                contact[suffix] = value
+            elif _PHONE_FIELD.match(suffix):
+                has_phone_fields = True
+                if _has_value(value):
+                    phones.append(value)
+            else:
+                company[suffix] = value
+
+        if not _has_value(comp_id) and not any(_has_value(v) for v in contact.values()):
+            return   # empty slot (e.g. oprcompid: 0)
+
+        if _has_value(comp_id):
+            self.tables["company"].add(company)
+        else:
+            comp_id = None
+
+        contact_id = contact.get("contactid")
+        contact_key = None
+        has_contact = any(_has_value(v) for k, v in contact.items() if k != "contactid")
+        if has_contact or _has_value(contact_id):
+            contact["compid"] = comp_id
+            contact_key = contact_key_for(contact)
+            contact["contact_key"] = contact_key
+            self.tables["contact"].add(contact, key=contact_key)
+        if not _has_value(contact_id):
+            contact_id = None
+
+        if has_phone_fields:
+            self.phone_slots.add((comp_id, contact_id))
+        for number in phones:
+            match = _PHONE_TYPE.match(number)
+            self.tables["phone"].add({
+                "compid": comp_id,
+                "contactid": contact_id,
+                "number": match.group(1) if match else number,
+                "type": match.group(2) if match else None,
+            })
+
+        self.tables["relationship"].add({
+            "aircraftid": aircraft_id,
+            "role": role,
+            "compid": comp_id,
+            "contactid": contact_id,
+            "contact_key": contact_key,
+        })
+
+    def stats(self) -> dict:
+        """Rows, duplicates skipped, field merges and in-place updates per table."""
+        return {
+            name: {"rows": len(t), "duplicates": t.duplicates, "merges": t.merges, "updates": t.updates}
+            for name, t in self.tables.items()
+        }
+
+    def to_dict(self) -> dict:
+        """{table: {column: [values]}} -- ready for pandas.DataFrame / pyarrow.table."""
+        return {name: dict(t.columns) for name, t in self.tables.items()}
+
+
+def normalize_bulk_export(bearer, token, body, pagesize=50, **options) -> BulkNormalizer:
+    """Stream getBulkAircraftExportPaged and return the normalized tables (see iter_records for options)."""
+    normalizer = BulkNormalizer()
+    for record in iter_records(bearer, token, "/api/Aircraft/getBulkAircraftExportPaged",
+                               body, pagesize, **options):
+        normalizer.add_record(record)
+    return normalizer
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print("Usage: python scripts/normalize_bulk.py <bulk-export-response.json>")
+        sys.exit(1)
+    with open(sys.argv[1]) as f:
+        data = json.load(f)
+    data = data.get("response", data)   # examples/responses/*.json wrap the payload
+    normalizer = BulkNormalizer()
+    normalizer.add_page(data.get("aircraft") or [])
+    for name, s in normalizer.stats().items():
+        print(f"  {name:<14} {s['rows']:>6} rows  {s['duplicates']:>6} duplicates  "
+              f"{s['merges']:>4} merges  {s['updates']:>4} updates")
@@ -26,14 +26,71 @@ Usage:
         pagesize=100
     )
     print(f"Total records: {len(all_history)}")
+
+Transient failures (429/5xx, connection resets, read timeouts) are retried
+per page with the RetryPolicy from src/jetnet/session.py, so a long export
+does not abort on one bad page. Pass retry=RetryPolicy(...) to tune it.
+
+Concurrent mode:
+    # Page 1 reveals maxpages; pages 2..N are fetched on 8 threads and
+    # reassembled in page order (ordered=False delivers them as they land).
+    records = paginate_all(bearer, token, base_path, body, workers=8)
+
+Streaming (constant memory, for large exports):
+    for record in iter_records(bearer, token, "/api/Aircraft/getBulkAircraftExportPaged", body, 50):
+        sink.write(record)
+
+    iter_pages yields (page_number, page_data); the get_all_* wrappers have
+    iter_* counterparts (iter_history, iter_bulk_export, ...).
+
+Direct-to-disk exports (scripts/sinks.py):
+    with NDJSONSink("exports/g550", compress=True) as sink:
+        paginate_to_sink(bearer, token, "/api/Aircraft/getBulkAircraftExportPaged", body, sink, 50)
+
+Resumable (checkpointed) runs:
+    # Re-running after a crash fetches only the pages that are missing.
+    paginate_resumable(bearer, token, "/api/Aircraft/getHistoryListPaged", body,
+                       checkpoint_dir="runs/g550-history-2024")
+    for record in iter_checkpoint_records("runs/g550-history-2024"):
+        ...
+
+Date-window backfills (getFlightDataPaged, getHistoryListPaged):
+    # Multi-year ranges are cut into windows, oversized windows are halved,
+    # and all windows are fetched in parallel and merged without duplicates.
+    flights = get_flight_data_windowed(bearer, token, body, window_days=7, workers=8)
+
+Adaptive page size:
+    # pagesize moves along 25/50/100/200/400 towards the best records/sec.
+    # The sizes tried and their measurements are logged and available from
+    # controller.summary(), to pin a good default per endpoint.
+    controller = PageSizeController()
+    records = paginate_adaptive(bearer, token, base_path, body, controller=controller)
+
+Pass limiter=RateLimiter(...) (src/jetnet/rate_limit.py) to share a request
+budget with other threads or, in SQLite mode, other worker processes.
 """
 
+import hashlib
+import json
+import logging
+import re
 import requests
 import os
+import sys
+import time
+from datetime import date, datetime, timedelta
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from typing import Any
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from src.jetnet.rate_limit import RateLimiter  # noqa: E402
+from src.jetnet.session import RetryPolicy, TransportConfig, build_transport, send_with_retry  # noqa: E402
+
 BASE_URL = os.getenv("JETNET_BASE_URL", "https://customer.jetnetconnect.com")
 
+log = logging.getLogger("jetnet.paginate")
+
 # The response list keys for each paged endpoint.
 # The paginator auto-detects the list from this set.
 LIST_KEYS = {
@@ -70,6 +127,172 @@ def _find_records(data: dict) -> list:
     return []
 
 
+def _page_fetcher(
+    bearer: str,
+    token: str,
+    base_path: str,
+    body: dict,
+    pagesize: int,
+    retry: RetryPolicy,
+    timeout: int,
+    limiter: RateLimiter,
+    transport: requests.Session,
+    on_response: callable = None,
+):
+    """
+    Return fetch(page) -> page_data for one paged query. Safe to call from worker threads.
+
+    on_response(page, response), if given, sees each final HTTP response
+    (for payload-size accounting) before it is parsed.
+    """
+    headers = {
+        "Authorization": f"Bearer {bearer}",
+        "Content-Type": "application/json",
+    }
+
+    def fetch(page: int) -> dict:
+        url = build_paged_url(base_path, token, pagesize, page)
+
+        def send():
+            if limiter is not None:
+                limiter.acquire(base_path)
+            return transport.post(url, headers=headers, json=body, timeout=timeout)
+
+        response = send_with_retry(send, retry)
+        response.raise_for_status()
+        if on_response is not None:
+            on_response(page, response)
+        data = response.json()
+
+        status = data.get("responsestatus", "")
+        if "ERROR" in status.upper():
+            raise ValueError(f"JETNET error on page {page}: {status}")
+        return data
+
+    return fetch
+
+
+def _total_pages(data: dict) -> int:
+    # getBulkAircraftExport and getHistoryList (non-paged variant) return
+    # maxpages=0 / currentpage=0 when all results fit in one call.
+    # Treat maxpages <= 1 as a single-page result (not an error).
+    return max(data.get("maxpages", 1), 1)
+
+
+def _fetch_concurrently(fetch, pages: list, workers: int, ordered: bool = True):
+    """
+    Yield (page_number, page_data) for `pages` using a pool of `workers`
+    threads, with at most 2 * workers requests outstanding. Pages come back
+    in the order given if `ordered`, otherwise as soon as each completes.
+    """
+    remaining = iter(pages)
+    pending = {}   # page number -> future
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        def fill():
+            while len(pending) < workers * 2:
+                page = next(remaining, None)
+                if page is None:
+                    return
+                pending[page] = pool.submit(fetch, page)
+
+        try:
+            fill()
+            if ordered:
+                for page in pages:
+                    data = pending.pop(page).result()
+                    fill()
+                    yield page, data
+            else:
+                while pending:
+                    done, _ = wait(list(pending.values()), return_when=FIRST_COMPLETED)
+                    for page in [p for p, f in pending.items() if f in done]:
+                        yield page, pending.pop(page).result()
+                    fill()
+        finally:
+            for future in pending.values():
+                future.cancel()
+
+
+def _iter_page_data(fetch, max_pages: int = None, workers: int = 1, ordered: bool = True):
+    """
+    Yield (page_number, page_data) for every page.
+
+    workers <= 1: strictly sequential, stopping on each page's maxpages.
+    workers > 1:  page 1 is fetched alone to learn maxpages, then pages
+                  2..N go through _fetch_concurrently.
+    """
+    if workers <= 1:
+        page = 1
+        while True:
+            data = fetch(page)
+            yield page, data
+            # Stop conditions
+            if page >= _total_pages(data):
+                break
+            if max_pages and page >= max_pages:
+                break
+            page += 1
+        return
+
+    first = fetch(1)
+    yield 1, first
+    last = _total_pages(first)
+    if max_pages:
+        last = min(last, max_pages)
+    if last > 1:
+        yield from _fetch_concurrently(fetch, list(range(2, last + 1)), workers, ordered)
+
+
+def iter_pages(
+    bearer: str,
+    token: str,
+    base_path: str,
+    body: dict,
+    pagesize: int = 100,
+    max_pages: int = None,
+    retry: RetryPolicy = None,
+    timeout: int = 60,
+    limiter: RateLimiter = None,
+    workers: int = 1,
+    ordered: bool = True,
+):
+    """
+    Stream a paged endpoint: yield (page_number, page_data) as pages arrive.
+
+    Nothing is accumulated, so memory stays at about one page (2 * workers
+    pages in concurrent mode) however large the result set is. Arguments
+    are the same as paginate_all. Closing the generator early stops
+    fetching and releases the connection pool.
+    """
+    transport = build_transport(TransportConfig(pool_maxsize=max(workers, 1)))
+    fetch = _page_fetcher(bearer, token, base_path, body, pagesize, retry, timeout, limiter, transport)
+    try:
+        yield from _iter_page_data(fetch, max_pages, workers, ordered)
+    finally:
+        transport.close()
+
+
+def iter_records(
+    bearer: str,
+    token: str,
+    base_path: str,
+    body: dict,
+    pagesize: int = 100,
+    **options,
+):
+    """
+    Stream individual records from a paged endpoint, one page in memory at a time.
+
+    Accepts the same keyword options as iter_pages (max_pages, retry,
+    timeout, limiter, workers, ordered).
+
+        for record in iter_records(bearer, token, "/api/Aircraft/getBulkAircraftExportPaged", body, 50):
+            out.write(json.dumps(record) + "\\n")
+    """
+    for _, data in iter_pages(bearer, token, base_path, body, pagesize, **options):
+        yield from _find_records(data)
+
+
 def paginate_all(
     bearer: str,
     token: str,
@@ -78,10 +301,18 @@ def paginate_all(
     pagesize: int = 100,
     max_pages: int = None,
     on_page: callable = None,
+    retry: RetryPolicy = None,
+    timeout: int = 60,
+    limiter: RateLimiter = None,
+    workers: int = 1,
+    ordered: bool = True,
 ) -> list:
     """
     Fetch all pages from a JETNET paged endpoint.
 
+    For large exports prefer iter_pages / iter_records, which stream instead
+    of holding every record in memory.
+
     Args:
         bearer:    bearerToken from APILogin
         token:     apiToken from APILogin
@@ -92,52 +323,546 @@ def paginate_all(
         max_pages: optional hard cap on pages to fetch (None = no cap)
         on_page:   optional callback(page_number, page_data, records_so_far)
                    called after each page completes
+        retry:     RetryPolicy for transient failures on each page
+                   (default: session.DEFAULT_RETRY_POLICY)
+        timeout:   per-request timeout in seconds
+        limiter:   optional RateLimiter; each page request waits for a
+                   token from its 'paged' budget
+        workers:   1 = fetch pages one after another (default). >1 = fetch
+                   page 1, then pages 2..maxpages concurrently on this many
+                   threads over one keep-alive connection pool
+        ordered:   with workers > 1, keep records (and on_page calls) in page
+                   order (default). False = deliver pages as they complete
 
     Returns:
         Combined list of all records across all pages.
 
     Raises:
         ValueError: if JETNET returns an ERROR responsestatus
-        requests.HTTPError: on HTTP error
+        requests.HTTPError: on HTTP error (after retries, for transient codes)
     """
-    headers = {
-        "Authorization": f"Bearer {bearer}",
-        "Content-Type": "application/json",
-    }
+    all_records = []
+    for page, data in iter_pages(bearer, token, base_path, body, pagesize, max_pages,
+                                 retry, timeout, limiter, workers, ordered):
+        all_records.extend(_find_records(data))
+        if on_page:
+            on_page(page, data, all_records)
+
+    return all_records
+
+
+def paginate_to_sink(
+    bearer: str,
+    token: str,
+    base_path: str,
+    body: dict,
+    sink,
+    pagesize: int = 100,
+    **options,
+) -> dict:
+    """
+    Stream every page straight into a sink (scripts/sinks.py) and close it.
+
+    Memory stays at about one page plus the sink's buffer, so multi-million
+    record exports run in constant memory. Keyword options are as for
+    iter_pages (max_pages, retry, timeout, limiter, workers); pages reach
+    the sink in page order.
+
+    Returns:
+        The sink's manifest (part files, per-page record counts, total).
+        If the export fails, the sink is left open; use it as a context
+        manager to get an incomplete manifest on disk.
+    """
+    options["ordered"] = True
+    for page, data in iter_pages(bearer, token, base_path, body, pagesize, **options):
+        sink.write_page(page, _find_records(data))
+    return sink.close()
+
+
+# ---------------------------------------------------------------------------
+# Adaptive page size
+# ---------------------------------------------------------------------------
+
+_ENTITY_COUNT = re.compile(r"(\w+) Count:\s*(\d+)", re.IGNORECASE)
+
+
+def parse_entity_counts(status: str) -> dict:
+    """
+    Parse the entity counts some endpoints put in responsestatus.
+
+        "SUCCESS: AC Count: 1 Comp Count: 9 Cont Count: 9 Phone Count: 15"
+        -> {"ac": 1, "comp": 9, "cont": 9, "phone": 15}
+    """
+    return {name.lower(): int(n) for name, n in _ENTITY_COUNT.findall(status or "")}
+
+
+class PageSizeController:
+    """
+    Hill-climbing page-size tuner for one paged query.
+
+    Sizes come from a doubling ladder (min_pagesize, 2x, 4x, ... <= max_pagesize),
+    so every size divides every larger one. After N records the next page
+    starts at offset N, and a new size s can take over at page N / s + 1
+    whenever s divides N. The size can therefore change mid-query without
+    skipping or repeating records.
+
+    Each full page updates an exponentially weighted records/sec estimate
+    for its size. The controller moves to the best measured size, trying the
+    unmeasured neighbour one step up, then one step down, first. Sizes whose
+    pages exceeded max_page_bytes are never chosen again, which keeps
+    entity-heavy bulk-export pages within a sane payload.
+    """
+
+    def __init__(
+        self,
+        min_pagesize: int = 25,
+        max_pagesize: int = 400,
+        start_pagesize: int = 100,
+        max_page_bytes: int = 8 * 1024 * 1024,
+        smoothing: float = 0.5,
+    ):
+        self.sizes = []
+        size = min_pagesize
+        while size <= max_pagesize:
+            self.sizes.append(size)
+            size *= 2
+        self.max_page_bytes = max_page_bytes
+        self.smoothing = smoothing
+        self.current = min(self.sizes, key=lambda s: abs(s - start_pagesize))
+        self.stats = {}          # size -> {"pages", "records_per_sec", "bytes_per_record", "entities_per_record"}
+        self.too_large = set()   # sizes whose pages exceeded max_page_bytes
+
+    def observe(self, pagesize: int, records: int, seconds: float, nbytes: int, entities: dict = None) -> None:
+        """Record one page. Short (final) pages are ignored; they understate throughput."""
+        if records < pagesize or seconds <= 0:
+            return
+        if nbytes > self.max_page_bytes:
+            self.too_large.update(s for s in self.sizes if s >= pagesize)
+        rate = records / seconds
+        stats = self.stats.setdefault(pagesize, {"pages": 0, "records_per_sec": rate})
+        stats["pages"] += 1
+        stats["records_per_sec"] += self.smoothing * (rate - stats["records_per_sec"])
+        stats["bytes_per_record"] = round(nbytes / records)
+        if entities:
+            stats["entities_per_record"] = round(sum(entities.values()) / records, 2)
+
+    def _allowed(self) -> list:
+        return [s for s in self.sizes if s not in self.too_large] or self.sizes[:1]
+
+    def next_pagesize(self, offset: int) -> int:
+        """Choose the size for the page starting at record `offset`."""
+        allowed = self._allowed()
+        measured = [s for s in allowed if s in self.stats]
+        if measured:
+            best = max(measured, key=lambda s: self.stats[s]["records_per_sec"])
+            i = allowed.index(best)
+            neighbours = [allowed[j] for j in (i + 1, i - 1) if 0 <= j < len(allowed)]
+            target = next((s for s in neighbours if s not in self.stats), best)
+        else:
+            target = max((s for s in allowed if s <= self.current), default=allowed[0])
+
+        # Page boundaries must line up: fall back to the largest size <= target dividing offset.
+        size = max(s for s in self.sizes if s <= target and offset % s == 0)
+        if size != self.current:
+            log.info("pagesize %d -> %d at record %d", self.current, size, offset)
+            self.current = size
+        return size
+
+    def summary(self) -> dict:
+        """Per-size measurements plus the best size seen, for pinning defaults."""
+        measured = {s: dict(v, records_per_sec=round(v["records_per_sec"], 1)) for s, v in self.stats.items()}
+        best = max(measured, key=lambda s: measured[s]["records_per_sec"]) if measured else self.current
+        return {"best_pagesize": best, "sizes": measured, "excluded": sorted(self.too_large)}
+
+
+def iter_pages_adaptive(
+    bearer: str,
+    token: str,
+    base_path: str,
+    body: dict,
+    controller: PageSizeController = None,
+    retry: RetryPolicy = None,
+    timeout: int = 60,
+    limiter: RateLimiter = None,
+):
+    """
+    Stream a paged endpoint with a self-tuning pagesize.
+
+    Yields (pagesize, page_number, page_data). Pages are fetched one at a
+    time so each latency measurement is clean. The controller's summary
+    is logged at the end.
+    """
+    controller = controller or PageSizeController()
+    transport = build_transport()
+    payload_bytes = {}   # pagesize -> bytes of the last response
+    fetchers = {}
+    offset = 0
+    try:
+        while True:
+            pagesize = controller.next_pagesize(offset)
+            if pagesize not in fetchers:
+                def on_response(page, response, pagesize=pagesize):
+                    payload_bytes[pagesize] = len(response.content)
+                fetchers[pagesize] = _page_fetcher(bearer, token, base_path, body, pagesize,
+                                                   retry, timeout, limiter, transport, on_response)
+            page = offset // pagesize + 1
+
+            started = time.perf_counter()
+            data = fetchers[pagesize](page)
+            elapsed = time.perf_counter() - started
+
+            records = len(_find_records(data))
+            controller.observe(pagesize, records, elapsed, payload_bytes.get(pagesize, 0),
+                               parse_entity_counts(data.get("responsestatus", "")))
+            yield pagesize, page, data
+
+            offset += records
+            if records < pagesize or page >= _total_pages(data):
+                break
+    finally:
+        transport.close()
+        log.info("adaptive pagesize for %s: %s", base_path, controller.summary())
+
+
+def paginate_adaptive(
+    bearer: str,
+    token: str,
+    base_path: str,
+    body: dict,
+    controller: PageSizeController = None,
+    **options,
+) -> list:
+    """
+    Fetch all pages with a self-tuning pagesize (see PageSizeController).
 
+    Pass your own controller to bound the sizes or to read
+    controller.summary() afterwards. Other keyword options (retry, timeout,
+    limiter) are as for paginate_all.
+    """
     all_records = []
-    page = 1
+    for _, _, data in iter_pages_adaptive(bearer, token, base_path, body, controller, **options):
+        all_records.extend(_find_records(data))
+    return all_records
 
-    while True:
-        url = build_paged_url(base_path, token, pagesize, page)
-        response = requests.post(url, headers=headers, json=body)
-        response.raise_for_status()
-        data = response.json()
 
-        status = data.get("responsestatus", "")
-        if "ERROR" in status.upper():
-            raise ValueError(f"JETNET error on page {page}: {status}")
+# ---------------------------------------------------------------------------
+# Resumable pagination (on-disk checkpoints)
+# ---------------------------------------------------------------------------
+
+CHECKPOINT_FILE = "checkpoint.json"
+MAX_SHIFT_RESTARTS = 3
+
+
+def request_hash(base_path: str, body: dict, pagesize: int) -> str:
+    """Stable hash of everything that defines a paged result set."""
+    canonical = json.dumps(
+        {"path": base_path.rstrip("/"), "pagesize": pagesize, "body": body},
+        sort_keys=True, separators=(",", ":"), default=str,
+    )
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def _page_file(checkpoint_dir: str, page: int) -> str:
+    return os.path.join(checkpoint_dir, "pages", f"page-{page:05d}.ndjson")
+
 
+def _write_atomic(path: str, text: str) -> None:
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+def _new_checkpoint(checkpoint_dir: str, base_path: str, body_hash: str, pagesize: int) -> dict:
+    pages_dir = os.path.join(checkpoint_dir, "pages")
+    for name in os.listdir(pages_dir):
+        if name.startswith("page-"):
+            os.remove(os.path.join(pages_dir, name))
+    return {
+        "base_path": base_path,
+        "body_hash": body_hash,
+        "pagesize": pagesize,
+        "maxpages": None,
+        "pages": {},            # page number (str) -> records on that page
+        "output_dir": pages_dir,
+        "complete": False,
+        "restarts": 0,
+        "updated_at": time.time(),
+    }
+
+
+def paginate_resumable(
+    bearer: str,
+    token: str,
+    base_path: str,
+    body: dict,
+    checkpoint_dir: str,
+    pagesize: int = 100,
+    max_pages: int = None,
+    retry: RetryPolicy = None,
+    timeout: int = 60,
+    limiter: RateLimiter = None,
+    workers: int = 1,
+    restart: bool = False,
+) -> dict:
+    """
+    Paginate with an on-disk checkpoint so a crashed run resumes where it stopped.
+
+    Each completed page is written to {checkpoint_dir}/pages/page-NNNNN.ndjson,
+    then {checkpoint_dir}/checkpoint.json is updated with the completed page
+    numbers and record counts, the request hash (base_path + body + pagesize),
+    maxpages and the output location. Re-running with the same arguments
+    fetches only the missing pages.
+
+    Result-set shifts: every page reports maxpages. If it differs from the
+    value recorded in the checkpoint, the server-side result set has changed
+    (records were added or removed), so page boundaries no longer line up.
+    The checkpoint is discarded and the run restarts from page 1 (at most
+    MAX_SHIFT_RESTARTS times).
+
+    Args:
+        checkpoint_dir: directory for checkpoint.json and the page files
+                        (one directory per query)
+        restart:        ignore any existing checkpoint and start from page 1
+        other args:     as for paginate_all
+
+    Returns:
+        The final checkpoint dict. Read the records with
+        iter_checkpoint_records(checkpoint_dir).
+
+    Raises:
+        ValueError: if the checkpoint belongs to a different query, if the
+                    result set keeps shifting, or on a JETNET ERROR status
+    """
+    os.makedirs(os.path.join(checkpoint_dir, "pages"), exist_ok=True)
+    checkpoint_path = os.path.join(checkpoint_dir, CHECKPOINT_FILE)
+    body_hash = request_hash(base_path, body, pagesize)
+
+    checkpoint = None
+    if not restart and os.path.exists(checkpoint_path):
+        with open(checkpoint_path) as f:
+            checkpoint = json.load(f)
+        if checkpoint["body_hash"] != body_hash:
+            raise ValueError(
+                f"Checkpoint in {checkpoint_dir} is for a different query. "
+                "Use a separate directory per query, or pass restart=True."
+            )
+    if checkpoint is None:
+        checkpoint = _new_checkpoint(checkpoint_dir, base_path, body_hash, pagesize)
+
+    def save() -> None:
+        checkpoint["updated_at"] = time.time()
+        _write_atomic(checkpoint_path, json.dumps(checkpoint, indent=2))
+
+    def store(page: int, data: dict) -> None:
         records = _find_records(data)
-        all_records.extend(records)
+        _write_atomic(_page_file(checkpoint_dir, page),
+                      "".join(json.dumps(r, default=str) + "\n" for r in records))
+        checkpoint["pages"][str(page)] = len(records)
+        save()
 
-        # getBulkAircraftExport and getHistoryList (non-paged variant) return
-        # maxpages=0 / currentpage=0 when all results fit in one call.
-        # Treat maxpages <= 1 as a single-page result (not an error).
-        total_pages = max(data.get("maxpages", 1), 1)
-        current    = data.get("currentpage", page)
+    def missing_pages() -> list:
+        last = checkpoint["maxpages"]
+        if max_pages:
+            last = min(last, max_pages)
+        return [p for p in range(1, last + 1) if str(p) not in checkpoint["pages"]]
 
-        if on_page:
-            on_page(page, data, all_records)
+    transport = build_transport(TransportConfig(pool_maxsize=max(workers, 1)))
+    fetch = _page_fetcher(bearer, token, base_path, body, pagesize, retry, timeout, limiter, transport)
+
+    try:
+        while True:
+            restarts = checkpoint["restarts"]
+            todo = [1] if checkpoint["maxpages"] is None else missing_pages()
+            shifted = False
+
+            if todo:
+                # The first outstanding page doubles as a probe of the current maxpages.
+                probe = todo[0]
+                data = fetch(probe)
+                if checkpoint["maxpages"] not in (None, _total_pages(data)):
+                    shifted = True
+                else:
+                    checkpoint["maxpages"] = _total_pages(data)
+                    store(probe, data)
+                    rest = missing_pages()
+                    pages = (_fetch_concurrently(fetch, rest, workers, ordered=False)
+                             if workers > 1 else ((p, fetch(p)) for p in rest))
+                    try:
+                        for page, data in pages:
+                            if _total_pages(data) != checkpoint["maxpages"]:
+                                shifted = True
+                                break
+                            store(page, data)
+                    finally:
+                        # On a shift, cancel the pages still queued before restarting.
+                        pages.close()
+
+            if not shifted:
+                break
+            if restarts >= MAX_SHIFT_RESTARTS:
+                raise ValueError(
+                    f"Result set for {base_path} kept shifting (maxpages changed "
+                    f"{restarts + 1} times); narrow the query or retry later."
+                )
+            checkpoint = _new_checkpoint(checkpoint_dir, base_path, body_hash, pagesize)
+            checkpoint["restarts"] = restarts + 1
+            save()
+    finally:
+        transport.close()
 
-        # Stop conditions
-        if page >= total_pages:
-            break
-        if max_pages and page >= max_pages:
-            break
+    checkpoint["complete"] = True
+    save()
+    return checkpoint
 
-        page += 1
 
+def iter_checkpoint_records(checkpoint_dir: str):
+    """Yield the records saved by paginate_resumable, in page order."""
+    with open(os.path.join(checkpoint_dir, CHECKPOINT_FILE)) as f:
+        checkpoint = json.load(f)
+    for page in sorted(int(p) for p in checkpoint["pages"]):
+        with open(_page_file(checkpoint_dir, page)) as f:
+            for line in f:
+                yield json.loads(line)
+
+
+# ---------------------------------------------------------------------------
+# Date-window partitioning (getFlightDataPaged, getHistoryListPaged)
+# ---------------------------------------------------------------------------
+
+DATE_FORMAT = "%m/%d/%Y"
+
+# Unique record ID per endpoint, used to drop records returned by two
+# adjacent windows. Records without the key are compared by content.
+RECORD_ID_KEYS = {
+    "getFlightDataPaged": "flightid",
+    "getHistoryListPaged": "transid",
+}
+
+
+def _split_window(start: date, end: date) -> list:
+    """Halve a window. Halves share the midpoint date so nothing falls between them."""
+    mid = start + (end - start) // 2
+    return [(start, mid), (mid, end)]
+
+
+def _record_key(record: dict, id_key: str):
+    if id_key and record.get(id_key) is not None:
+        return record[id_key]
+    return json.dumps(record, sort_keys=True, default=str)
+
+
+def paginate_by_date_window(
+    bearer: str,
+    token: str,
+    base_path: str,
+    body: dict,
+    pagesize: int = 100,
+    window_days: int = 7,
+    max_window_pages: int = 20,
+    workers: int = 4,
+    retry: RetryPolicy = None,
+    timeout: int = 60,
+    limiter: RateLimiter = None,
+) -> list:
+    """
+    Split a startdate/enddate query into date windows, fetch them in parallel
+    and merge the results.
+
+    Planning: the range is cut into windows of `window_days` and page 1 of
+    every window is fetched. Any window whose maxpages exceeds
+    `max_window_pages` is halved and probed again, down to single-day
+    windows. Page 1 of each final window is kept, so planning costs no
+    extra requests on windows that are not split.
+
+    Fetching: the remaining pages of all windows share one pool of
+    `workers` threads, so small windows do not leave threads idle while a
+    large one finishes.
+
+    Merging: records come back in window order, then page order. Adjacent
+    windows share their boundary date, so boundary records can appear
+    twice; they are dropped by flightid / transid (RECORD_ID_KEYS), or by
+    content for other endpoints.
+
+    Args:
+        body:             must contain startdate and enddate (MM/DD/YYYY)
+        window_days:      initial window length in days
+        max_window_pages: split windows that report more pages than this
+        workers:          threads for both planning and fetching
+        other args:       as for paginate_all
+
+    Returns:
+        Combined, deduplicated record list
+
+    Raises:
+        ValueError: if startdate/enddate are missing or malformed, or on a
+                    JETNET ERROR status
+    """
+    try:
+        start = datetime.strptime(body["startdate"], DATE_FORMAT).date()
+        end = datetime.strptime(body["enddate"], DATE_FORMAT).date()
+    except (KeyError, ValueError) as e:
+        raise ValueError(f"paginate_by_date_window needs startdate/enddate as MM/DD/YYYY: {e}")
+
+    windows = []
+    cursor = start
+    while cursor < end:
+        windows.append((cursor, min(cursor + timedelta(days=window_days), end)))
+        cursor = windows[-1][1]
+    if not windows:
+        windows = [(start, end)]
+
+    transport = build_transport(TransportConfig(pool_maxsize=max(workers, 1)))
+
+    def fetcher(window):
+        window_body = dict(body,
+                           startdate=window[0].strftime(DATE_FORMAT),
+                           enddate=window[1].strftime(DATE_FORMAT))
+        return _page_fetcher(bearer, token, base_path, window_body, pagesize,
+                             retry, timeout, limiter, transport)
+
+    try:
+        # Plan: probe page 1 of each window, halving the ones that are too big.
+        planned = []   # (window, fetch, page 1 data)
+        with ThreadPoolExecutor(max_workers=max(workers, 1)) as pool:
+            while windows:
+                fetches = [fetcher(w) for w in windows]
+                firsts = list(pool.map(lambda fetch: fetch(1), fetches))
+                oversized = []
+                for window, fetch, first in zip(windows, fetches, firsts):
+                    if _total_pages(first) > max_window_pages and window[1] - window[0] > timedelta(days=1):
+                        oversized.extend(_split_window(*window))
+                    else:
+                        planned.append((window, fetch, first))
+                windows = oversized
+        planned.sort(key=lambda item: item[0])
+
+        # Fetch: pages 2..N of every window through one shared pool.
+        results = {}   # (window index, page) -> records
+        remaining = []
+        for index, (window, fetch, first) in enumerate(planned):
+            results[(index, 1)] = _find_records(first)
+            remaining.extend((index, page) for page in range(2, _total_pages(first) + 1))
+
+        def fetch_window_page(item):
+            return planned[item[0]][1](item[1])
+
+        if remaining:
+            for item, data in _fetch_concurrently(fetch_window_page, remaining, max(workers, 1), ordered=False):
+                results[item] = _find_records(data)
+    finally:
+        transport.close()
+
+    # Merge in window/page order, dropping boundary duplicates.
+    id_key = RECORD_ID_KEYS.get(base_path.rstrip("/").rsplit("/", 1)[-1])
+    seen = set()
+    all_records = []
+    for item in sorted(results):
+        for record in results[item]:
+            key = _record_key(record, id_key)
+            if key not in seen:
+                seen.add(key)
+                all_records.append(record)
     return all_records
 
 
@@ -147,6 +872,7 @@ def paginate_with_summary(
     base_path: str,
     body: dict,
     pagesize: int = 100,
+    workers: int = 1,
 ) -> dict:
     """
     Like paginate_all but also returns metadata about the run.
@@ -164,7 +890,7 @@ def paginate_with_summary(
     def capture(page_num, page_data, records_so_far):
         meta["total_pages"] = page_data.get("maxpages", page_num)
 
-    records = paginate_all(bearer, token, base_path, body, pagesize, on_page=capture)
+    records = paginate_all(bearer, token, base_path, body, pagesize, on_page=capture, workers=workers)
     meta["total_records"] = len(records)
 
     return {"records": records, **meta}
@@ -174,37 +900,49 @@ def paginate_with_summary(
 # Convenience wrappers for the most common paged endpoints
 # ---------------------------------------------------------------------------
 
-def get_all_history(bearer, token, body, pagesize=100):
+def get_all_history(bearer, token, body, pagesize=100, workers=1):
     """Fetch all ownership history records. response key: history"""
-    return paginate_all(bearer, token, "/api/Aircraft/getHistoryListPaged", body, pagesize)
+    return paginate_all(bearer, token, "/api/Aircraft/getHistoryListPaged", body, pagesize, workers=workers)
 
 
-def get_all_flight_data(bearer, token, body, pagesize=100):
+def get_all_flight_data(bearer, token, body, pagesize=100, workers=1):
     """Fetch all flight records. response key: flightdata"""
-    return paginate_all(bearer, token, "/api/Aircraft/getFlightDataPaged", body, pagesize)
+    return paginate_all(bearer, token, "/api/Aircraft/getFlightDataPaged", body, pagesize, workers=workers)
 
 
-def get_all_events(bearer, token, body, pagesize=100):
+def get_flight_data_windowed(bearer, token, body, pagesize=100, window_days=7, workers=4):
+    """Fetch flight records for a long date range in parallel date windows. response key: flightdata"""
+    return paginate_by_date_window(bearer, token, "/api/Aircraft/getFlightDataPaged", body, pagesize,
+                                   window_days=window_days, workers=workers)
+
+
+def get_history_windowed(bearer, token, body, pagesize=100, window_days=30, workers=4):
+    """Fetch ownership history for a long date range in parallel date windows. response key: history"""
+    return paginate_by_date_window(bearer, token, "/api/Aircraft/getHistoryListPaged", body, pagesize,
+                                   window_days=window_days, workers=workers)
+
+
+def get_all_events(bearer, token, body, pagesize=100, workers=1):
     """Fetch all event records. response key: events"""
-    return paginate_all(bearer, token, "/api/Aircraft/getEventListPaged", body, pagesize)
+    return paginate_all(bearer, token, "/api/Aircraft/getEventListPaged", body, pagesize, workers=workers)
 
 
-def get_bulk_export(bearer, token, body, pagesize=50):
+def get_bulk_export(bearer, token, body, pagesize=50, workers=1):
     """Fetch full aircraft export records. response key: aircraft"""
-    return paginate_all(bearer, token, "/api/Aircraft/getBulkAircraftExportPaged", body, pagesize)
+    return paginate_all(bearer, token, "/api/Aircraft/getBulkAircraftExportPaged", body, pagesize, workers=workers)
 
 
-def get_all_companies(bearer, token, body, pagesize=100):
+def get_all_companies(bearer, token, body, pagesize=100, workers=1):
     """Fetch all company search results. response key: companylist"""
-    return paginate_all(bearer, token, "/api/Company/getCompanyListPaged", body, pagesize)
+    return paginate_all(bearer, token, "/api/Company/getCompanyListPaged", body, pagesize, workers=workers)
 
 
-def get_all_contacts(bearer, token, body, pagesize=100):
+def get_all_contacts(bearer, token, body, pagesize=100, workers=1):
     """Fetch all contact search results. response key: contactlist"""
-    return paginate_all(bearer, token, "/api/Contact/getContactListPaged", body, pagesize)
+    return paginate_all(bearer, token, "/api/Contact/getContactListPaged", body, pagesize, workers=workers)
 
 
-def get_fractional_owners(bearer, token, body, pagesize=100):
+def get_fractional_owners(bearer, token, body, pagesize=100, workers=1):
     """
     Fetch all fractional owner records. response key: aircraftcompfractionalrefs
 
@@ -227,7 +965,48 @@ def get_fractional_owners(bearer, token, body, pagesize=100):
     return paginate_all(
         bearer, token,
         "/api/Aircraft/getAcCompanyFractionalReportPaged",
-        body, pagesize
+        body, pagesize, workers=workers,
+    )
+
+
+# Streaming variants: same endpoints, yielding records one page at a time.
+
+def iter_history(bearer, token, body, pagesize=100, workers=1):
+    """Stream ownership history records. response key: history"""
+    return iter_records(bearer, token, "/api/Aircraft/getHistoryListPaged", body, pagesize, workers=workers)
+
+
+def iter_flight_data(bearer, token, body, pagesize=100, workers=1):
+    """Stream flight records. response key: flightdata"""
+    return iter_records(bearer, token, "/api/Aircraft/getFlightDataPaged", body, pagesize, workers=workers)
+
+
+def iter_events(bearer, token, body, pagesize=100, workers=1):
+    """Stream event records. response key: events"""
+    return iter_records(bearer, token, "/api/Aircraft/getEventListPaged", body, pagesize, workers=workers)
+
+
+def iter_bulk_export(bearer, token, body, pagesize=50, workers=1):
+    """Stream full aircraft export records. response key: aircraft"""
+    return iter_records(bearer, token, "/api/Aircraft/getBulkAircraftExportPaged", body, pagesize, workers=workers)
+
+
+def iter_companies(bearer, token, body, pagesize=100, workers=1):
+    """Stream company search results. response key: companylist"""
+    return iter_records(bearer, token, "/api/Company/getCompanyListPaged", body, pagesize, workers=workers)
+
+
+def iter_contacts(bearer, token, body, pagesize=100, workers=1):
+    """Stream contact search results. response key: contactlist"""
+    return iter_records(bearer, token, "/api/Contact/getContactListPaged", body, pagesize, workers=workers)
+
+
+def iter_fractional_owners(bearer, token, body, pagesize=100, workers=1):
+    """Stream fractional owner records. response key: aircraftcompfractionalrefs"""
+    return iter_records(
+        bearer, token,
+        "/api/Aircraft/getAcCompanyFractionalReportPaged",
+        body, pagesize, workers=workers,
     )
 
 
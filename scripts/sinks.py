@@ -0,0 +1,347 @@
+"""
+sinks.py -- Write paged JETNET results straight to disk, page by page.
+
+paginate_all() collects every record in memory before you can serialize
+it. A sink instead takes one page at a time, buffers at most
+`buffer_bytes` (NDJSON) or `buffer_records` rows (Parquet), and rotates
+to a new part file once the current one passes `rotate_bytes`. Memory
+therefore stays flat however many records the export has.
+
+Formats:
+    NDJSONSink(dir)                 -- part-00000.ndjson, one JSON record per line
+    NDJSONSink(dir, compress=True)  -- part-00000.ndjson.gz
+    ParquetSink(dir)                -- part-00000.parquet (requires pyarrow)
+
+Every sink writes {dir}/manifest.json listing each part file (records,
+bytes) and each page (page number, records, part file). The manifest is
+rewritten on every rotation and on close(). A manifest with
+"complete": false means the export did not finish.
+
+Usage:
+    from scripts.paginate import paginate_to_sink
+    from scripts.sinks import NDJSONSink
+
+    with NDJSONSink("exports/g550", compress=True) as sink:
+        manifest = paginate_to_sink(bearer, token, "/api/Aircraft/getBulkAircraftExportPaged",
+                                    body, sink, pagesize=50)
+    print(manifest["total_records"])
+"""
+
+import gzip
+import json
+import os
+import time
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Parquet output is optional; NDJSON sinks need only the stdlib
+    pa = None
+    pq = None
+
+MANIFEST_FILE = "manifest.json"
+_INT64_MAX = 2 ** 63 - 1
+
+
+def _value_kind(value) -> str:
+    """Parquet column kind of one value: bool, int, float or str (everything else)."""
+    if isinstance(value, bool):
+        return "bool"
+    if isinstance(value, int):
+        return "int" if -_INT64_MAX - 1 <= value <= _INT64_MAX else "str"
+    if isinstance(value, float):
+        return "float"
+    return "str"
+
+
+class _FileSink:
+    """Shared part-file rotation, buffering and manifest handling."""
+
+    extension = ""
+    format = ""
+
+    def __init__(self, directory: str, prefix: str = "part", rotate_bytes: int = 256 * 1024 * 1024):
+        self.directory = directory
+        self.prefix = prefix
+        self.rotate_bytes = rotate_bytes
+        os.makedirs(directory, exist_ok=True)
+        self.files = []   # [{"path", "records", "bytes"}]
+        self.pages = []   # [{"page", "records", "file"}]
+        self.total_records = 0
+        self.started_at = time.time()
+        self._file = None
+        self._closed = False
+
+    # -- subclass hooks -------------------------------------------------------
+
+    def _open_file(self, path: str) -> None:
+        raise NotImplementedError
+
+    def _buffer(self, records: list) -> None:
+        raise NotImplementedError
+
+    def _flush(self) -> None:
+        raise NotImplementedError
+
+    def _close_file(self) -> None:
+        raise NotImplementedError
+
+    def _bytes_written(self) -> int:
+        raise NotImplementedError
+
+    # -- public API -----------------------------------------------------------
+
+    def write_page(self, page: int, records: list) -> None:
+        """Append one page of records. Rotation happens only between pages."""
+        if self._closed:
+            raise ValueError("sink is closed")
+        if self._file is None or self._bytes_written() >= self.rotate_bytes:
+            self._rotate()
+        if records:
+            self._buffer(records)
+        self.files[-1]["records"] += len(records)
+        self.pages.append({"page": page, "records": len(records), "file": self.files[-1]["path"]})
+        self.total_records += len(records)
+
+    def close(self) -> dict:
+        """Flush and close the current part and write the final manifest. Returns the manifest."""
+        if not self._closed:
+            self._finish_file()
+            self._closed = True
+            self._write_manifest(complete=True)
+        return self.manifest(complete=True)
+
+    def manifest(self, complete: bool = False) -> dict:
+        return {
+            "format": self.format,
+            "directory": self.directory,
+            "complete": complete,
+            "total_records": self.total_records,
+            "files": self.files,
+            "pages": self.pages,
+            "started_at": self.started_at,
+            "updated_at": time.time(),
+        }
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            # Keep what was written, but leave the manifest marked incomplete.
+            self._finish_file()
+            self._closed = True
+            self._write_manifest(complete=False)
+
+    # -- internals ------------------------------------------------------------
+
+    def _rotate(self) -> None:
+        self._finish_file()
+        name = f"{self.prefix}-{len(self.files):05d}{self.extension}"
+        self._open_file(os.path.join(self.directory, name))
+        self.files.append({"path": name, "records": 0, "bytes": 0})
+        self._write_manifest(complete=False)
+
+    def _finish_file(self) -> None:
+        if self._file is None:
+            return
+        self._flush()
+        self._close_file()
+        self.files[-1]["bytes"] = os.path.getsize(os.path.join(self.directory, self.files[-1]["path"]))
+        self._file = None
+
+    def _write_manifest(self, complete: bool) -> None:
+        path = os.path.join(self.directory, MANIFEST_FILE)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self.manifest(complete), f, indent=2)
+        os.replace(tmp_path, path)
+
+
+class NDJSONSink(_FileSink):
+    """
+    Newline-delimited JSON part files, optionally gzip-compressed.
+
+    Serialized lines are buffered up to `buffer_bytes` and then written in
+    one call. With compress=True, rotate_bytes applies to the compressed
+    size on disk: pending lines are pushed into the gzip stream before the
+    check, and only the bytes it has emitted count (data still inside the
+    compressor is not flushed early, so a part can run over by that much
+    plus one page).
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        compress: bool = False,
+        prefix: str = "part",
+        rotate_bytes: int = 256 * 1024 * 1024,
+        buffer_bytes: int = 1024 * 1024,
+    ):
+        self.compress = compress
+        self.extension = ".ndjson.gz" if compress else ".ndjson"
+        self.format = "ndjson.gz" if compress else "ndjson"
+        self.buffer_bytes = buffer_bytes
+        self._pending = []
+        self._pending_bytes = 0
+        self._raw = None
+        super().__init__(directory, prefix, rotate_bytes)
+
+    def _open_file(self, path: str) -> None:
+        self._raw = open(path, "wb")
+        self._file = gzip.GzipFile(fileobj=self._raw, mode="wb") if self.compress else self._raw
+
+    def _buffer(self, records: list) -> None:
+        for record in records:
+            line = (json.dumps(record, default=str, separators=(",", ":")) + "\n").encode()
+            self._pending.append(line)
+            self._pending_bytes += len(line)
+            if self._pending_bytes >= self.buffer_bytes:
+                self._flush()
+
+    def _flush(self) -> None:
+        if self._pending:
+            self._file.write(b"".join(self._pending))
+            self._pending = []
+            self._pending_bytes = 0
+
+    def _close_file(self) -> None:
+        if self._file is not self._raw:
+            self._file.close()
+        self._raw.close()
+        self._raw = None
+
+    def _bytes_written(self) -> int:
+        if self.compress:
+            self._flush()
+            return self._raw.tell()
+        return self._raw.tell() + self._pending_bytes
+
+
+class ParquetSink(_FileSink):
+    """
+    Parquet part files via pyarrow; each buffered batch becomes a row group.
+
+    The schema is inferred from the first batch of each part file, over the
+    union of the keys of all its rows. A column whose values are all bools,
+    all ints, or ints and floats gets that type; a column that is all null or
+    has mixed types is stored as strings. Dict and list values are stored as
+    JSON strings. If a later batch does not fit the schema (a new column, or a
+    value of a different type), the sink rotates to a new part file with that
+    batch's schema, so no data is dropped.
+    """
+
+    extension = ".parquet"
+    format = "parquet"
+
+    def __init__(
+        self,
+        directory: str,
+        prefix: str = "part",
+        rotate_bytes: int = 256 * 1024 * 1024,
+        buffer_records: int = 10000,
+        compression: str = "zstd",
+    ):
+        if pa is None:
+            raise ImportError("ParquetSink requires pyarrow (pip install pyarrow)")
+        self.buffer_records = buffer_records
+        self.compression = compression
+        self._rows = []
+        self._row_pages = []   # manifest entries of the pages whose rows are in self._rows
+        self._path = None
+        super().__init__(directory, prefix, rotate_bytes)
+
+    def _open_file(self, path: str) -> None:
+        # The ParquetWriter is created lazily: its schema comes from the first batch.
+        self._path = path
+        self._file = path
+
+    def write_page(self, page: int, records: list) -> None:
+        super().write_page(page, records)
+        self._row_pages.append(self.pages[-1])
+        if len(self._rows) >= self.buffer_records:
+            self._flush()
+
+    def _buffer(self, records: list) -> None:
+        for record in records:
+            self._rows.append({
+                k: json.dumps(v, default=str) if isinstance(v, (dict, list)) else v
+                for k, v in record.items()
+            })
+
+    def _infer_schema(self):
+        kinds = {}   # column -> set of value kinds, in first-seen column order
+        for row in self._rows:
+            for k, v in row.items():
+                seen = kinds.setdefault(k, set())
+                if v is not None:
+                    seen.add(_value_kind(v))
+        fields = []
+        for name, seen in kinds.items():
+            if seen == {"bool"}:
+                type_ = pa.bool_()
+            elif seen == {"int"}:
+                type_ = pa.int64()
+            elif seen and seen <= {"int", "float"}:
+                type_ = pa.float64()
+            else:
+                type_ = pa.string()
+            fields.append(pa.field(name, type_))
+        return pa.schema(fields)
+
+    def _table(self, schema=None):
+        schema = schema if schema is not None else self._infer_schema()
+        strings = {f.name for f in schema if pa.types.is_string(f.type)}
+        rows = [
+            {k: str(v) if k in strings and v is not None and not isinstance(v, str) else v
+             for k, v in row.items()}
+            for row in self._rows
+        ]
+        return pa.Table.from_pylist(rows, schema=schema)
+
+    def _flush(self) -> None:
+        if not self._rows:
+            return
+        if isinstance(self._file, str):
+            table = self._table()
+            self._file = pq.ParquetWriter(self._path, table.schema, compression=self.compression)
+        else:
+            columns = set().union(*self._rows)
+            try:
+                if not columns <= set(self._file.schema.names):
+                    raise pa.ArrowInvalid("new columns")
+                table = self._table(self._file.schema)
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                # Schema drift: close this part and start the next one with the new schema.
+                rows, self._rows = self._rows, []
+                self._close_file()
+                self._start_next_part()
+                self._rows = rows
+                self._flush()
+                return
+        self._file.write_table(table)
+        self._rows = []
+        self._row_pages = []
+
+    def _start_next_part(self) -> None:
+        """Open the next part file and move the still-buffered pages over to it."""
+        moved = sum(entry["records"] for entry in self._row_pages)
+        self.files[-1]["bytes"] = os.path.getsize(self._path)
+        self.files[-1]["records"] -= moved
+        name = f"{self.prefix}-{len(self.files):05d}{self.extension}"
+        self._open_file(os.path.join(self.directory, name))
+        self.files.append({"path": name, "records": moved, "bytes": 0})
+        for entry in self._row_pages:
+            entry["file"] = name
+
+    def _close_file(self) -> None:
+        if isinstance(self._file, str):
+            # Nothing was written to this part; leave an empty but valid file.
+            pq.write_table(pa.table({}), self._path)
+        else:
+            self._file.close()
+
+    def _bytes_written(self) -> int:
+        return os.path.getsize(self._path) if os.path.exists(self._path) else 0
@@ -0,0 +1,423 @@
+"""
+async_session.py -- asyncio counterpart of session.py
+
+Same login / validation / auto-refresh behaviour as session.py, built on
+httpx.AsyncClient so async services (FastAPI, MCP servers, workers) can run
+hundreds of concurrent lookups from one event loop without a thread per
+request. Error detection is shared with session.py (normalize_error,
+JetnetError), so both clients raise the same errors for the same responses.
+
+Usage:
+    from src.jetnet.async_session import login, ensure_session, jetnet_request
+
+    session = await login("you@example.com", "yourpassword")
+    result  = await jetnet_request("GET", "/api/Aircraft/getRegNumber/N12345/{apiToken}", session)
+
+    # Fan out -- every call shares the session's connection pool
+    results = await asyncio.gather(*[
+        jetnet_request("GET", f"/api/Aircraft/getRegNumber/{tail}/{{apiToken}}", session)
+        for tail in tails
+    ])
+
+    # Stream a paged export without holding it all in memory
+    async for record in iter_records(session, "/api/Aircraft/getBulkAircraftExportPaged", body, 50):
+        ...
+
+    await session.aclose()
+
+Requires httpx (pip install httpx).
+"""
+
+from __future__ import annotations
+import asyncio
+import os
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable, Optional
+
+import httpx
+
+from .session import (
+    BASE_URL,
+    DEFAULT_RETRY_POLICY,
+    TOKEN_TTL_SECONDS,
+    CircuitBreaker,
+    JetnetError,
+    RetryPolicy,
+    normalize_error,
+    parse_retry_after,
+)
+
+if TYPE_CHECKING:
+    from .rate_limit import RateLimiter
+
+# httpx equivalent of session.TRANSIENT_EXCEPTIONS: connect/read timeouts,
+# resets and other transport-level failures.
+TRANSIENT_EXCEPTIONS = (httpx.TransportError,)
+
+# The response list keys for each paged endpoint (same set as scripts/paginate.py).
+LIST_KEYS = {
+    "history",
+    "flightdata",
+    "events",
+    "aircraft",
+    "aircraftowneroperators",
+    "companylist",
+    "contactlist",
+    "relationships",
+    "aircraftcompfractionalrefs",
+}
+
+
+def build_client(limits: Optional[httpx.Limits] = None) -> httpx.AsyncClient:
+    """
+    Create the shared async connection pool.
+
+    Defaults: up to JETNET_ASYNC_MAX_CONNECTIONS (100) concurrent connections,
+    JETNET_ASYNC_MAX_KEEPALIVE (20) of them kept alive between requests.
+    """
+    limits = limits or httpx.Limits(
+        max_connections=int(os.getenv("JETNET_ASYNC_MAX_CONNECTIONS", "100")),
+        max_keepalive_connections=int(os.getenv("JETNET_ASYNC_MAX_KEEPALIVE", "20")),
+    )
+    return httpx.AsyncClient(limits=limits)
+
+
+@dataclass
+class AsyncSessionState:
+    base_url: str
+    email: str
+    password: str
+    bearer_token: str
+    api_token: str
+    client: httpx.AsyncClient = field(repr=False, compare=False)
+    created_at: float = field(default_factory=time.time)
+    last_validated_at: float = field(default_factory=time.time)
+    generation: int = field(default=0, repr=False, compare=False)
+    rate_limiter: Optional[RateLimiter] = field(default=None, repr=False, compare=False)
+    circuit_breaker: Optional[CircuitBreaker] = field(default=None, repr=False, compare=False)
+    _refresh_lock: asyncio.Lock = field(default_factory=asyncio.Lock, init=False, repr=False, compare=False)
+
+    async def aclose(self) -> None:
+        """Close the connection pool. Call once when the session is no longer needed."""
+        await self.client.aclose()
+
+    def age_seconds(self) -> float:
+        return time.time() - self.created_at
+
+    def seconds_since_validated(self) -> float:
+        return time.time() - self.last_validated_at
+
+    def is_stale(self, ttl: int = TOKEN_TTL_SECONDS) -> bool:
+        """True if the token has likely expired based on wall-clock age."""
+        return self.age_seconds() > ttl
+
+    def adopt(self, fresh: AsyncSessionState) -> None:
+        """Swap in the tokens from a freshly logged-in session, in place."""
+        self.bearer_token = fresh.bearer_token
+        self.api_token = fresh.api_token
+        self.created_at = fresh.created_at
+        self.last_validated_at = fresh.last_validated_at
+        self.generation += 1
+
+
+async def login(
+    email: Optional[str] = None,
+    password: Optional[str] = None,
+    base_url: Optional[str] = None,
+    client: Optional[httpx.AsyncClient] = None,
+) -> AsyncSessionState:
+    """
+    Authenticate with the JETNET API and return an AsyncSessionState.
+
+    Reads JETNET_EMAIL / JETNET_PASSWORD / JETNET_BASE_URL from environment
+    if not passed directly. Pass an existing `client` to reuse its pool.
+
+    IMPORTANT: emailAddress has a capital A -- this function handles that for you.
+    """
+    email    = email    or os.environ["JETNET_EMAIL"]
+    password = password or os.environ["JETNET_PASSWORD"]
+    url      = (base_url or BASE_URL).rstrip("/")
+    client   = client or build_client()
+
+    r = await client.post(
+        f"{url}/api/Admin/APILogin",
+        json={"emailAddress": email, "password": password},
+        timeout=30,
+    )
+    r.raise_for_status()
+    data = r.json()
+
+    err = normalize_error(data, endpoint="APILogin")
+    if err:
+        raise err
+
+    return AsyncSessionState(
+        base_url=url,
+        email=email,
+        password=password,
+        bearer_token=data["bearerToken"],
+        api_token=data.get("apiToken") or data.get("securityToken"),
+        client=client,
+    )
+
+
+async def get_account_info(session: AsyncSessionState) -> dict:
+    """Call /getAccountInfo -- a lightweight, read-only probe endpoint."""
+    r = await session.client.get(
+        f"{session.base_url}/api/Admin/getAccountInfo/{session.api_token}",
+        headers={"Authorization": f"Bearer {session.bearer_token}"},
+        timeout=15,
+    )
+    r.raise_for_status()
+    data = r.json()
+
+    err = normalize_error(data, endpoint="getAccountInfo")
+    if err:
+        raise err
+
+    session.last_validated_at = time.time()
+    return data
+
+
+async def relogin(session: AsyncSessionState, seen_generation: Optional[int] = None) -> AsyncSessionState:
+    """
+    Single-flight re-login that refreshes `session` in place.
+
+    Concurrent tasks that hit the same expired token wait on the session's
+    lock; only the first one calls login().
+    """
+    if seen_generation is None:
+        seen_generation = session.generation
+    async with session._refresh_lock:
+        if session.generation == seen_generation:
+            fresh = await login(session.email, session.password, session.base_url,
+                                client=session.client)
+            session.adopt(fresh)
+    return session
+
+
+async def ensure_session(session: AsyncSessionState) -> AsyncSessionState:
+    """
+    Validate the session before starting any workflow. Auto-refreshes once on expiry.
+
+    Same strategy as session.ensure_session: re-login if stale by age,
+    otherwise probe /getAccountInfo and re-login once if the probe fails.
+    """
+    generation = session.generation
+    if session.is_stale():
+        return await relogin(session, generation)
+
+    try:
+        await get_account_info(session)
+        return session
+    except (JetnetError, httpx.HTTPStatusError):
+        pass
+
+    try:
+        await relogin(session, generation)
+        await get_account_info(session)
+        return session
+    except Exception as e:
+        raise JetnetError(
+            f"Session refresh failed. Check credentials and connectivity. Original error: {e}",
+            endpoint="ensure_session",
+        ) from e
+
+
+async def send_with_retry(
+    send: Callable[[], Awaitable[httpx.Response]],
+    policy: Optional[RetryPolicy] = None,
+) -> httpx.Response:
+    """
+    Async version of session.send_with_retry: same RetryPolicy, same
+    counters, asyncio.sleep between attempts.
+    """
+    policy = policy or DEFAULT_RETRY_POLICY
+    transient = policy.retry_exceptions or TRANSIENT_EXCEPTIONS
+    started = time.monotonic()
+    attempt = 0
+    policy.stats.record_call()
+
+    while True:
+        attempt += 1
+        try:
+            r = await send()
+        except transient as e:
+            delay = policy.backoff(attempt)
+            if not policy.allows(attempt, started, delay):
+                policy.stats.record_exhausted()
+                raise
+            reason = type(e).__name__
+        else:
+            if r.status_code not in policy.retry_statuses:
+                return r
+            delay = policy.backoff(attempt, parse_retry_after(r.headers.get("Retry-After")))
+            if not policy.allows(attempt, started, delay):
+                policy.stats.record_exhausted()
+                return r
+            reason = str(r.status_code)
+            await r.aclose()
+        policy.stats.record_retry(reason)
+        await asyncio.sleep(delay)
+
+
+async def jetnet_request(
+    method: str,
+    path: str,
+    session: AsyncSessionState,
+    json: Optional[dict] = None,
+    timeout: int = 60,
+    auto_refresh: bool = True,
+    retry: Optional[RetryPolicy] = None,
+) -> dict:
+    """
+    Make an authenticated JETNET API request.
+
+    Handles the same cases as session.jetnet_request: Bearer header,
+    {apiToken} substitution, transient-failure retries per RetryPolicy,
+    rate limiting via session.rate_limiter, fail-fast via
+    session.circuit_breaker, application-level errors, and one single-flight re-auth on
+    INVALID SECURITY TOKEN.
+
+    Raises:
+        JetnetError: on application-level errors
+        CircuitOpenError: if session.circuit_breaker is open (no request is sent)
+        httpx.HTTPStatusError: on HTTP 4xx/5xx errors (after retries, for transient codes)
+        httpx.TransportError: on network errors that outlast the retry policy
+    """
+    bearer, api_token, generation = session.bearer_token, session.api_token, session.generation
+    url = f"{session.base_url}{path}".replace("{apiToken}", api_token)
+    headers = {
+        "Authorization": f"Bearer {bearer}",
+        "Content-Type": "application/json",
+    }
+
+    async def send() -> httpx.Response:
+        if session.rate_limiter is not None:
+            await session.rate_limiter.acquire_async(path)
+        return await session.client.request(method, url, headers=headers, json=json, timeout=timeout)
+
+    breaker = session.circuit_breaker
+    if breaker is not None:
+        breaker.before_call(path)
+    try:
+        r = await send_with_retry(send, retry)
+    except httpx.TransportError:
+        if breaker is not None:
+            breaker.record_failure()
+        raise
+    if breaker is not None:
+        if r.status_code >= 500 or r.status_code == 429:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+
+    r.raise_for_status()
+    data = r.json()
+
+    err = normalize_error(data, endpoint=path)
+    if err:
+        if auto_refresh and "INVALID" in err.raw_status.upper():
+            await relogin(session, generation)
+            return await jetnet_request(method, path, session, json=json,
+                                        timeout=timeout, auto_refresh=False, retry=retry)
+        raise err
+
+    return data
+
+
+async def refresh_session(session: AsyncSessionState) -> AsyncSessionState:
+    """Force a fresh login regardless of token age. Returns a new session on the same pool."""
+    return await login(session.email, session.password, session.base_url, client=session.client)
+
+
+def _find_records(data: dict) -> list:
+    """Extract the record list from a response dict by matching known list keys."""
+    for key, value in data.items():
+        if isinstance(value, list) and key in LIST_KEYS:
+            return value
+    return []
+
+
+async def iter_pages(
+    session: AsyncSessionState,
+    base_path: str,
+    body: dict,
+    pagesize: int = 100,
+    max_pages: Optional[int] = None,
+    retry: Optional[RetryPolicy] = None,
+) -> AsyncIterator[tuple[int, dict]]:
+    """
+    Stream a paged endpoint: yield (page_number, page_data) as pages arrive.
+
+    Async equivalent of scripts/paginate.py's iter_pages. Only the current
+    page is held in memory.
+    """
+    clean_path = base_path.rstrip("/")
+    page = 1
+
+    while True:
+        data = await jetnet_request(
+            "POST", f"{clean_path}/{{apiToken}}/{pagesize}/{page}", session, json=body, retry=retry,
+        )
+        yield page, data
+
+        # maxpages=0 means everything fit in one page (not an error)
+        if page >= max(data.get("maxpages", 1), 1):
+            break
+        if max_pages and page >= max_pages:
+            break
+
+        page += 1
+
+
+async def iter_records(
+    session: AsyncSessionState,
+    base_path: str,
+    body: dict,
+    pagesize: int = 100,
+    max_pages: Optional[int] = None,
+    retry: Optional[RetryPolicy] = None,
+) -> AsyncIterator[dict]:
+    """Stream individual records from a paged endpoint, one page in memory at a time."""
+    async for _, data in iter_pages(session, base_path, body, pagesize, max_pages, retry):
+        for record in _find_records(data):
+            yield record
+
+
+async def paginate_all(
+    session: AsyncSessionState,
+    base_path: str,
+    body: dict,
+    pagesize: int = 100,
+    max_pages: Optional[int] = None,
+    on_page: Optional[Callable[[int, dict, list], Any]] = None,
+    retry: Optional[RetryPolicy] = None,
+) -> list:
+    """
+    Fetch all pages from a JETNET paged endpoint. Async version of
+    scripts/paginate.py's paginate_all, going through jetnet_request so
+    token refresh and error normalization apply to every page.
+    For large exports prefer iter_pages / iter_records.
+
+    Args:
+        session:   AsyncSessionState from login()
+        base_path: endpoint path without token/pagesize/page,
+                   e.g. '/api/Aircraft/getHistoryListPaged'
+        body:      POST body dict (same for every page)
+        pagesize:  records per page
+        max_pages: optional hard cap on pages to fetch (None = no cap)
+        on_page:   optional callback(page_number, page_data, records_so_far)
+        retry:     RetryPolicy applied to each page request
+
+    Returns:
+        Combined list of all records across all pages.
+    """
+    all_records = []
+    async for page, data in iter_pages(session, base_path, body, pagesize, max_pages, retry):
+        all_records.extend(_find_records(data))
+        if on_page:
+            on_page(page, data, all_records)
+
+    return all_records
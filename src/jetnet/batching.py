@@ -0,0 +1,231 @@
+"""
+batching.py -- DataLoader-style batching of getRelationships calls
+
+getRelationships accepts an `aclist` (Tier B, see
+examples/python/04_ownership.py), but services usually ask for one
+aircraft at a time. A RelationshipBatcher collects the aircraft IDs
+requested within `window` seconds, up to `max_batch` IDs, and sends them
+as ONE aclist call. Each caller then gets back only the relationships for
+its own aircraftid. Under load, N single-aircraft calls become about
+N / max_batch requests.
+
+    sync  -- RelationshipBatcher(session)        for SessionState (threads)
+    async -- AsyncRelationshipBatcher(session)   for AsyncSessionState (asyncio)
+
+Usage:
+    from src.jetnet.batching import RelationshipBatcher
+    from src.jetnet.session import login
+
+    session = login()
+    batcher = RelationshipBatcher(session)
+
+    # From any number of threads (web handlers, worker pools):
+    rels = batcher.get(211461)              # blocks until its batch returns
+
+    batcher.stats()   # {"requested": 500, "batches": 10, "avg_batch": 50.0, ...}
+
+Requests with showHistoricalAcRefs=True and False go in separate batches.
+If a batch call fails, every caller waiting on it gets the exception.
+"""
+
+from __future__ import annotations
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Optional
+
+from .session import SessionState, jetnet_request
+
+RELATIONSHIPS_PATH = "/api/Aircraft/getRelationships/{apiToken}"
+DEFAULT_WINDOW = 0.01
+DEFAULT_MAX_BATCH = 50
+
+
+def _batch_body(aircraft_ids: list, show_historical: bool) -> dict:
+    return {
+        "aclist": aircraft_ids,
+        "modlist": [],
+        "actiondate": "",
+        "showHistoricalAcRefs": show_historical,
+    }
+
+
+def _split_by_aircraft(data: dict) -> dict:
+    by_id = {}
+    for rel in data.get("relationships") or []:
+        by_id.setdefault(rel.get("aircraftid"), []).append(rel)
+    return by_id
+
+
+class _BatchStats:
+    def __init__(self):
+        self.requested = 0
+        self.batches = 0
+        self.aircraft = 0
+        self.failed = 0
+
+    def snapshot(self) -> dict:
+        return {
+            "requested": self.requested,
+            "batches": self.batches,
+            "aircraft": self.aircraft,
+            "failed_batches": self.failed,
+            "avg_batch": round(self.aircraft / self.batches, 1) if self.batches else 0.0,
+        }
+
+
+class RelationshipBatcher:
+    """
+    Thread-safe batcher for SessionState. The thread that fills a batch
+    (or a timer thread when the window closes) sends it.
+
+    Args:
+        session:   SessionState (its connection pool, limiter and breaker apply)
+        window:    seconds to wait for more IDs after the first one arrives
+        max_batch: send immediately once a batch holds this many distinct IDs
+    """
+
+    def __init__(self, session: SessionState, window: float = DEFAULT_WINDOW,
+                 max_batch: int = DEFAULT_MAX_BATCH):
+        self.session = session
+        self.window = window
+        self.max_batch = max_batch
+        self._lock = threading.Lock()
+        self._pending = {}   # show_historical -> {aircraft_id: [Future, ...]}
+        self._timers = {}    # show_historical -> threading.Timer
+        self._stats = _BatchStats()
+
+    def submit(self, aircraft_id: int, show_historical: bool = False) -> Future:
+        """Queue one aircraft; the Future resolves to its relationship list."""
+        future = Future()
+        ready = None
+        with self._lock:
+            self._stats.requested += 1
+            batch = self._pending.setdefault(show_historical, {})
+            batch.setdefault(aircraft_id, []).append(future)
+            if len(batch) >= self.max_batch:
+                ready = self._take(show_historical)
+            elif show_historical not in self._timers:
+                timer = threading.Timer(self.window, self._flush, args=(show_historical,))
+                timer.daemon = True
+                self._timers[show_historical] = timer
+                timer.start()
+        if ready:
+            self._send(show_historical, ready)
+        return future
+
+    def get(self, aircraft_id: int, show_historical: bool = False,
+            timeout: Optional[float] = None) -> list:
+        """Relationships for one aircraft, fetched as part of a batch."""
+        return self.submit(aircraft_id, show_historical).result(timeout)
+
+    def get_many(self, aircraft_ids: list, show_historical: bool = False) -> dict:
+        """{aircraft_id: relationships} for several aircraft."""
+        futures = {aid: self.submit(aid, show_historical) for aid in aircraft_ids}
+        return {aid: f.result() for aid, f in futures.items()}
+
+    def flush(self) -> None:
+        """Send every pending batch now."""
+        for show_historical in list(self._pending):
+            self._flush(show_historical)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return self._stats.snapshot()
+
+    def _take(self, show_historical: bool) -> dict:
+        timer = self._timers.pop(show_historical, None)
+        if timer is not None:
+            timer.cancel()
+        return self._pending.pop(show_historical, {})
+
+    def _flush(self, show_historical: bool) -> None:
+        with self._lock:
+            batch = self._take(show_historical)
+        if batch:
+            self._send(show_historical, batch)
+
+    def _send(self, show_historical: bool, batch: dict) -> None:
+        with self._lock:
+            self._stats.batches += 1
+            self._stats.aircraft += len(batch)
+        try:
+            data = jetnet_request("POST", RELATIONSHIPS_PATH, self.session,
+                                  json=_batch_body(list(batch), show_historical))
+        except Exception as e:
+            with self._lock:
+                self._stats.failed += 1
+            for futures in batch.values():
+                for future in futures:
+                    future.set_exception(e)
+            return
+        by_id = _split_by_aircraft(data)
+        for aircraft_id, futures in batch.items():
+            for future in futures:
+                future.set_result(list(by_id.get(aircraft_id, [])))
+
+
+class AsyncRelationshipBatcher:
+    """
+    asyncio batcher for AsyncSessionState. Must be used from one event loop.
+    Arguments are the same as RelationshipBatcher.
+    """
+
+    def __init__(self, session, window: float = DEFAULT_WINDOW, max_batch: int = DEFAULT_MAX_BATCH):
+        self.session = session
+        self.window = window
+        self.max_batch = max_batch
+        self._pending = {}   # show_historical -> {aircraft_id: [asyncio.Future, ...]}
+        self._timers = {}    # show_historical -> asyncio.TimerHandle
+        self._tasks = set()
+        self._stats = _BatchStats()
+
+    async def get(self, aircraft_id: int, show_historical: bool = False) -> list:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._stats.requested += 1
+        batch = self._pending.setdefault(show_historical, {})
+        batch.setdefault(aircraft_id, []).append(future)
+        if len(batch) >= self.max_batch:
+            self._dispatch(show_historical)
+        elif show_historical not in self._timers:
+            self._timers[show_historical] = loop.call_later(self.window, self._dispatch, show_historical)
+        return await future
+
+    async def get_many(self, aircraft_ids: list, show_historical: bool = False) -> dict:
+        results = await asyncio.gather(*(self.get(aid, show_historical) for aid in aircraft_ids))
+        return dict(zip(aircraft_ids, results))
+
+    def stats(self) -> dict:
+        return self._stats.snapshot()
+
+    def _dispatch(self, show_historical: bool) -> None:
+        timer = self._timers.pop(show_historical, None)
+        if timer is not None:
+            timer.cancel()
+        batch = self._pending.pop(show_historical, {})
+        if batch:
+            task = asyncio.ensure_future(self._send(show_historical, batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, show_historical: bool, batch: dict) -> None:
+        from .async_session import jetnet_request as async_request
+
+        self._stats.batches += 1
+        self._stats.aircraft += len(batch)
+        try:
+            data = await async_request("POST", RELATIONSHIPS_PATH, self.session,
+                                       json=_batch_body(list(batch), show_historical))
+        except Exception as e:
+            self._stats.failed += 1
+            for futures in batch.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+        by_id = _split_by_aircraft(data)
+        for aircraft_id, futures in batch.items():
+            for future in futures:
+                if not future.done():
+                    future.set_result(list(by_id.get(aircraft_id, [])))
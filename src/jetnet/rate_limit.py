@@ -0,0 +1,188 @@
+"""
+rate_limit.py -- client-side token-bucket rate limiting for JETNET calls
+
+Fan-out workloads (relationships, pictures, contact hydration) can easily
+send more requests than the backend tolerates. A RateLimiter keeps a
+separate token bucket per endpoint class, so paged exports cannot starve
+interactive lookups and vice versa:
+
+    lookup -- single-record calls (getRegNumber, getRelationships, getPictures, ...)
+    paged  -- *Paged endpoints and getBulkAircraftExport
+
+Two backends:
+    in-process (default) -- shared by every thread holding the limiter
+    SQLite               -- RateLimiter(sqlite_path="/tmp/jetnet-rate.db");
+                            every process pointing at the same file shares
+                            one budget
+
+Usage:
+    from src.jetnet.rate_limit import RateLimiter
+    from src.jetnet.session import login, jetnet_request
+
+    session = login()
+    session.rate_limiter = RateLimiter()        # jetnet_request now waits for a token
+    ...
+    session.rate_limiter.stats()                # calls and time spent waiting, per class
+
+Budgets are (requests per second, burst size) and default to
+JETNET_RATE_LOOKUP / JETNET_BURST_LOOKUP and JETNET_RATE_PAGED / JETNET_BURST_PAGED.
+"""
+
+from __future__ import annotations
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+DEFAULT_BUDGETS = {
+    "lookup": (float(os.getenv("JETNET_RATE_LOOKUP", "10")), float(os.getenv("JETNET_BURST_LOOKUP", "20"))),
+    "paged":  (float(os.getenv("JETNET_RATE_PAGED", "2")),   float(os.getenv("JETNET_BURST_PAGED", "4"))),
+}
+
+
+def endpoint_class(path: str) -> str:
+    """Map a request path to its budget class: 'paged' or 'lookup'."""
+    if "Paged" in path or "getBulkAircraftExport" in path:
+        return "paged"
+    return "lookup"
+
+
+class TokenBucket:
+    """
+    In-process token bucket, safe to share across threads.
+
+    reserve() always takes a token, letting the balance go negative, and
+    returns how long the caller must wait for that token to exist. Callers
+    are therefore served in arrival order without polling.
+    """
+
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, cost: float = 1.0) -> float:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= cost
+            return max(-self._tokens / self.rate, 0.0)
+
+
+class SQLiteTokenBucket:
+    """
+    Token bucket whose state lives in a SQLite file, shared by every process
+    that opens the same path. Each reservation is one IMMEDIATE transaction,
+    so concurrent processes serialize on the database lock. Uses wall-clock
+    time, which (unlike monotonic time) is comparable across processes.
+    """
+
+    def __init__(self, path: str, name: str, rate: float, burst: float):
+        self.path = path
+        self.name = name
+        self.rate = rate
+        self.burst = burst
+        self._local = threading.local()
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS buckets "
+                "(name TEXT PRIMARY KEY, tokens REAL NOT NULL, updated REAL NOT NULL)"
+            )
+            conn.execute(
+                "INSERT OR IGNORE INTO buckets (name, tokens, updated) VALUES (?, ?, ?)",
+                (name, burst, time.time()),
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            self._local.conn = conn
+        return conn
+
+    def reserve(self, cost: float = 1.0) -> float:
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            tokens, updated = conn.execute(
+                "SELECT tokens, updated FROM buckets WHERE name = ?", (self.name,)
+            ).fetchone()
+            now = time.time()
+            tokens = min(self.burst, tokens + max(now - updated, 0.0) * self.rate) - cost
+            conn.execute(
+                "UPDATE buckets SET tokens = ?, updated = ? WHERE name = ?",
+                (tokens, now, self.name),
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return max(-tokens / self.rate, 0.0)
+
+
+class RateLimiter:
+    """
+    One token bucket per endpoint class, plus wait-time statistics.
+
+    Args:
+        budgets:     {class_name: (requests_per_second, burst)}; defaults to
+                     DEFAULT_BUDGETS. Paths whose class has no budget are not limited.
+        sqlite_path: if set, buckets live in this SQLite file and are shared
+                     by every process using the same path
+    """
+
+    def __init__(self, budgets: Optional[dict] = None, sqlite_path: Optional[str] = None):
+        self.budgets = dict(budgets or DEFAULT_BUDGETS)
+        if sqlite_path:
+            self.buckets = {
+                name: SQLiteTokenBucket(sqlite_path, name, rate, burst)
+                for name, (rate, burst) in self.budgets.items()
+            }
+        else:
+            self.buckets = {
+                name: TokenBucket(rate, burst)
+                for name, (rate, burst) in self.budgets.items()
+            }
+        self._stats = {name: {"calls": 0, "waited": 0, "total_wait": 0.0, "max_wait": 0.0}
+                       for name in self.budgets}
+        self._stats_lock = threading.Lock()
+
+    def reserve(self, path: str) -> float:
+        """Take a token for `path` and return the seconds to wait before sending."""
+        name = endpoint_class(path)
+        bucket = self.buckets.get(name)
+        if bucket is None:
+            return 0.0
+        wait = bucket.reserve()
+        with self._stats_lock:
+            stats = self._stats[name]
+            stats["calls"] += 1
+            if wait > 0:
+                stats["waited"] += 1
+                stats["total_wait"] += wait
+                stats["max_wait"] = max(stats["max_wait"], wait)
+        return wait
+
+    def acquire(self, path: str) -> float:
+        """Block until a request to `path` may be sent. Returns seconds waited."""
+        wait = self.reserve(path)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, path: str) -> float:
+        """Async acquire() -- waits with asyncio.sleep instead of blocking the loop."""
+        wait = self.reserve(path)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def stats(self) -> dict:
+        """Per-class counters: calls, calls that waited, total and max wait seconds."""
+        with self._stats_lock:
+            return {name: dict(s) for name, s in self._stats.items()}
@@ -10,17 +10,268 @@ Usage:
 
     session = login("you@example.com", "yourpassword")
     result  = jetnet_request("GET", "/api/Aircraft/getRegNumber/N12345/{apiToken}", session)
+
+Connection pooling:
+    Every SessionState owns a pooled, keep-alive requests.Session, so repeated
+    calls reuse TCP/TLS connections instead of handshaking per request.
+    Refreshed sessions inherit the same pool. Tune it with TransportConfig:
+
+    session = login(transport_config=TransportConfig(pool_maxsize=32))
+
+Thread safety:
+    One SessionState can be shared by many worker threads. When the token
+    expires, re-login is single-flight: the first thread to notice logs in,
+    the others wait on the session's refresh lock and pick up the new tokens,
+    which are written into the shared SessionState in place.
+
+Background renewal (opt-in):
+    renewer = TokenRenewer(session).start()   # logs in ahead of TOKEN_TTL_SECONDS
+    ...
+    renewer.stop()
+
+    Tokens are swapped atomically: requests already in flight finish on the
+    old token, new requests start on the new one, and no user request waits
+    on a login.
+
+Cross-process token cache (opt-in):
+    session = cached_login(cache=TokenCache())   # ~/.cache/jetnet/tokens.json
+
+    Short-lived workers adopt a still-valid token from disk instead of
+    logging in. The token is validated lazily (the first INVALID response
+    triggers a refresh), and the file lock makes renewal single-flight
+    across processes: the first stale reader logs in, the rest adopt its token.
+
+Retries:
+    jetnet_request retries transient failures (429/5xx, connection resets,
+    timeouts) with exponential backoff, full jitter, Retry-After support and
+    a total deadline. Tune with RetryPolicy; read counters from policy.stats:
+
+    policy = RetryPolicy(max_attempts=6, deadline=600)
+    jetnet_request("POST", path, session, json=body, retry=policy)
+    policy.stats.snapshot()   # {"calls": ..., "retries": ..., "exhausted": ..., "by_reason": {...}}
+
+Rate limiting (opt-in):
+    session.rate_limiter = RateLimiter()   # see src/jetnet/rate_limit.py
+
+    Every attempt jetnet_request sends (including retries) first takes a
+    token from the limiter's bucket for that endpoint class.
+
+Circuit breaker (opt-in):
+    session.circuit_breaker = CircuitBreaker()
+    session.circuit_breaker.snapshot()     # {"state": "closed", ...} -- expose on /health
+
+    After repeated network errors / 5xx / 429s the breaker opens and
+    jetnet_request raises CircuitOpenError immediately instead of tying up a
+    thread on a 60 s timeout. After reset_timeout it lets probe requests
+    through (half-open) and closes again once they succeed.
 """
 
 from __future__ import annotations
+import contextlib
+import hashlib
+import json
+import logging
 import os
+import random
+import tempfile
+import threading
 import time
+from collections import deque
 import requests
+from requests.adapters import HTTPAdapter
 from dataclasses import dataclass, field
-from typing import Optional
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Callable, Iterator, Optional
+
+if TYPE_CHECKING:
+    from .rate_limit import RateLimiter
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locks; the cache still works, renewal is per process
+    fcntl = None
 
 BASE_URL = os.getenv("JETNET_BASE_URL", "https://customer.jetnetconnect.com")
 TOKEN_TTL_SECONDS = int(os.getenv("JETNET_TOKEN_TTL", "3000"))  # 50 min (tokens last ~60 min)
+RENEW_AHEAD_SECONDS = int(os.getenv("JETNET_RENEW_AHEAD", "300"))  # background renewal lead time
+
+log = logging.getLogger(__name__)
+
+
+@dataclass
+class TransportConfig:
+    """
+    Connection-pool settings for the HTTP transport a SessionState owns.
+
+    pool_connections: number of per-host pools to keep (one per distinct host)
+    pool_maxsize:     max keep-alive connections kept open per host
+    pool_block:       if True, callers wait for a free connection once
+                      pool_maxsize is reached instead of opening extras
+                      (a hard per-host limit)
+    """
+    pool_connections: int = int(os.getenv("JETNET_POOL_CONNECTIONS", "4"))
+    pool_maxsize: int = int(os.getenv("JETNET_POOL_MAXSIZE", "16"))
+    pool_block: bool = os.getenv("JETNET_POOL_BLOCK", "false").lower() == "true"
+
+
+def build_transport(config: Optional[TransportConfig] = None) -> requests.Session:
+    """Create a keep-alive requests.Session with a sized connection pool."""
+    config = config or TransportConfig()
+    transport = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=config.pool_connections,
+        pool_maxsize=config.pool_maxsize,
+        pool_block=config.pool_block,
+    )
+    transport.mount("https://", adapter)
+    transport.mount("http://", adapter)
+    return transport
+
+
+# Network-level failures worth retrying: resets, refused connections, and
+# connect/read timeouts. ChunkedEncodingError covers resets mid-body.
+TRANSIENT_EXCEPTIONS = (
+    requests.ConnectionError,
+    requests.Timeout,
+    requests.exceptions.ChunkedEncodingError,
+)
+
+
+class RetryStats:
+    """Thread-safe retry counters for monitoring. Read with snapshot()."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.retries = 0
+        self.exhausted = 0
+        self.by_reason: dict[str, int] = {}
+
+    def record_call(self) -> None:
+        with self._lock:
+            self.calls += 1
+
+    def record_retry(self, reason: str) -> None:
+        with self._lock:
+            self.retries += 1
+            self.by_reason[reason] = self.by_reason.get(reason, 0) + 1
+
+    def record_exhausted(self) -> None:
+        with self._lock:
+            self.exhausted += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "retries": self.retries,
+                "exhausted": self.exhausted,
+                "by_reason": dict(self.by_reason),
+            }
+
+
+@dataclass
+class RetryPolicy:
+    """
+    Which failures to retry and how long to wait between attempts.
+
+    max_attempts:     total tries per call, including the first
+    retry_statuses:   HTTP status codes treated as transient
+    retry_exceptions: exception types treated as transient; None means the
+                      transport's defaults (TRANSIENT_EXCEPTIONS for requests)
+    backoff_base:     first backoff ceiling in seconds, doubled per attempt
+    backoff_max:      cap on any single computed backoff
+    deadline:         total seconds a call may spend across all attempts
+                      (None = no deadline)
+    respect_retry_after: honour a Retry-After header on 429/503 responses
+
+    Backoff uses full jitter: a uniform random wait in
+    [0, min(backoff_max, backoff_base * 2 ** (attempt - 1))].
+    """
+    max_attempts: int = int(os.getenv("JETNET_RETRY_MAX_ATTEMPTS", "4"))
+    retry_statuses: frozenset = frozenset({429, 500, 502, 503, 504})
+    retry_exceptions: Optional[tuple] = None
+    backoff_base: float = 0.5
+    backoff_max: float = 30.0
+    deadline: Optional[float] = float(os.getenv("JETNET_RETRY_DEADLINE", "300"))
+    respect_retry_after: bool = True
+    stats: RetryStats = field(default_factory=RetryStats, repr=False, compare=False)
+
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Seconds to wait after failed attempt number `attempt` (1-based)."""
+        if retry_after is not None and self.respect_retry_after:
+            return retry_after
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1)))
+
+    def allows(self, attempt: int, started: float, delay: float) -> bool:
+        """True if another attempt fits within max_attempts and the deadline."""
+        if attempt >= self.max_attempts:
+            return False
+        if self.deadline is not None and time.monotonic() - started + delay > self.deadline:
+            return False
+        return True
+
+
+DEFAULT_RETRY_POLICY = RetryPolicy()
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds."""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(when.timestamp() - time.time(), 0.0)
+
+
+def send_with_retry(
+    send: Callable[[], requests.Response],
+    policy: Optional[RetryPolicy] = None,
+) -> requests.Response:
+    """
+    Call `send()` until it returns a non-transient response or the policy gives up.
+
+    Returns the final response -- callers still call raise_for_status(), so an
+    exhausted 503 surfaces as requests.HTTPError exactly as before. An
+    exhausted network error is re-raised.
+    """
+    policy = policy or DEFAULT_RETRY_POLICY
+    transient = policy.retry_exceptions or TRANSIENT_EXCEPTIONS
+    started = time.monotonic()
+    attempt = 0
+    policy.stats.record_call()
+
+    while True:
+        attempt += 1
+        try:
+            r = send()
+        except transient as e:
+            delay = policy.backoff(attempt)
+            if not policy.allows(attempt, started, delay):
+                policy.stats.record_exhausted()
+                raise
+            reason = type(e).__name__
+            log.info("JETNET transient %s (attempt %d/%d), retrying in %.1fs",
+                     reason, attempt, policy.max_attempts, delay)
+        else:
+            if r.status_code not in policy.retry_statuses:
+                return r
+            delay = policy.backoff(attempt, parse_retry_after(r.headers.get("Retry-After")))
+            if not policy.allows(attempt, started, delay):
+                policy.stats.record_exhausted()
+                return r
+            reason = str(r.status_code)
+            log.info("JETNET HTTP %s (attempt %d/%d), retrying in %.1fs",
+                     reason, attempt, policy.max_attempts, delay)
+            r.close()
+        policy.stats.record_retry(reason)
+        time.sleep(delay)
 
 
 @dataclass
@@ -32,6 +283,36 @@ class SessionState:
     api_token: str
     created_at: float = field(default_factory=time.time)
     last_validated_at: float = field(default_factory=time.time)
+    transport: Optional[requests.Session] = field(default=None, repr=False, compare=False)
+    generation: int = field(default=0, repr=False, compare=False)
+    token_cache: Optional[TokenCache] = field(default=None, repr=False, compare=False)
+    rate_limiter: Optional[RateLimiter] = field(default=None, repr=False, compare=False)
+    circuit_breaker: Optional[CircuitBreaker] = field(default=None, repr=False, compare=False)
+    _refresh_lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False, compare=False)
+    _swap_lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False, compare=False)
+    _renewer: Optional[TokenRenewer] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.transport is None:
+            self.transport = build_transport()
+
+    def tokens(self) -> tuple[str, str, int]:
+        """Consistent (bearer_token, api_token, generation) read, safe against a concurrent refresh."""
+        with self._swap_lock:
+            return self.bearer_token, self.api_token, self.generation
+
+    def adopt(self, fresh: SessionState) -> None:
+        """Swap in the tokens from a freshly logged-in SessionState, in place."""
+        with self._swap_lock:
+            self.bearer_token = fresh.bearer_token
+            self.api_token = fresh.api_token
+            self.created_at = fresh.created_at
+            self.last_validated_at = fresh.last_validated_at
+            self.generation += 1
+
+    def close(self) -> None:
+        """Close pooled connections. Call once when the session is no longer needed."""
+        self.transport.close()
 
     def age_seconds(self) -> float:
         return time.time() - self.created_at
@@ -52,6 +333,136 @@ class JetnetError(Exception):
         super().__init__(message)
 
 
+class CircuitOpenError(JetnetError):
+    """Raised without contacting JETNET while the circuit breaker is open."""
+
+
+class CircuitBreaker:
+    """
+    Thread-safe circuit breaker for JETNET calls.
+
+    closed    -- calls flow normally; failures are counted
+    open      -- calls fail fast with CircuitOpenError for reset_timeout seconds
+    half_open -- up to half_open_probes calls are let through; if they all
+                 succeed the breaker closes, if any fails it opens again
+
+    The breaker trips on either signal:
+      - failure_threshold consecutive failures, or
+      - an error rate >= error_rate_threshold over the last window_seconds,
+        once at least min_calls calls were made in that window
+
+    A failure is a network error or an HTTP 5xx/429 that outlasted retries;
+    application-level errors (bad payloads, INVALID tokens) do not count.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        error_rate_threshold: float = 0.5,
+        window_seconds: float = 60.0,
+        min_calls: int = 20,
+        reset_timeout: float = 30.0,
+        half_open_probes: int = 1,
+    ):
+        self.failure_threshold = failure_threshold
+        self.error_rate_threshold = error_rate_threshold
+        self.window_seconds = window_seconds
+        self.min_calls = min_calls
+        self.reset_timeout = reset_timeout
+        self.half_open_probes = half_open_probes
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.times_opened = 0
+        self._window: deque = deque()   # (monotonic time, failed)
+        self._probes_in_flight = 0
+        self._probe_successes = 0
+        self._lock = threading.Lock()
+
+    def _prune(self, now: float) -> None:
+        while self._window and now - self._window[0][0] > self.window_seconds:
+            self._window.popleft()
+
+    def _open(self, now: float) -> None:
+        self.state = self.OPEN
+        self.opened_at = now
+        self.times_opened += 1
+        log.warning("JETNET circuit breaker opened (%d consecutive failures)", self.consecutive_failures)
+
+    def before_call(self, endpoint: str = "") -> None:
+        """Raise CircuitOpenError if the call must not be attempted."""
+        with self._lock:
+            now = time.monotonic()
+            if self.state == self.OPEN:
+                if now - self.opened_at < self.reset_timeout:
+                    raise CircuitOpenError(
+                        f"JETNET circuit open; retry in {self.reset_timeout - (now - self.opened_at):.0f}s",
+                        endpoint=endpoint,
+                    )
+                self.state = self.HALF_OPEN
+                self._probes_in_flight = 0
+                self._probe_successes = 0
+            if self.state == self.HALF_OPEN:
+                if self._probes_in_flight >= self.half_open_probes:
+                    raise CircuitOpenError("JETNET circuit half-open; probe in progress", endpoint=endpoint)
+                self._probes_in_flight += 1
+
+    def record_success(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self.consecutive_failures = 0
+            if self.state == self.HALF_OPEN:
+                self._probe_successes += 1
+                if self._probe_successes >= self.half_open_probes:
+                    self.state = self.CLOSED
+                    self._window.clear()
+                return
+            self._window.append((now, False))
+            self._prune(now)
+
+    def record_failure(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self.consecutive_failures += 1
+            if self.state == self.HALF_OPEN:
+                self._open(now)
+                return
+            if self.state == self.OPEN:
+                return
+            self._window.append((now, True))
+            self._prune(now)
+            failures = sum(1 for _, failed in self._window if failed)
+            if (
+                self.consecutive_failures >= self.failure_threshold
+                or (len(self._window) >= self.min_calls
+                    and failures / len(self._window) >= self.error_rate_threshold)
+            ):
+                self._open(now)
+
+    def snapshot(self) -> dict:
+        """Current state for health endpoints and metrics."""
+        with self._lock:
+            now = time.monotonic()
+            self._prune(now)
+            failures = sum(1 for _, failed in self._window if failed)
+            calls = len(self._window)
+            return {
+                "state": self.state,
+                "consecutive_failures": self.consecutive_failures,
+                "window_calls": calls,
+                "window_error_rate": round(failures / calls, 3) if calls else 0.0,
+                "times_opened": self.times_opened,
+                "retry_in_seconds": (
+                    round(max(self.reset_timeout - (now - self.opened_at), 0.0), 1)
+                    if self.state == self.OPEN else 0.0
+                ),
+            }
+
+
 def normalize_error(response_json: dict, endpoint: str = "") -> Optional[JetnetError]:
     """
     Detect application-level errors that arrive with HTTP 200.
@@ -87,6 +498,8 @@ def login(
     email: Optional[str] = None,
     password: Optional[str] = None,
     base_url: Optional[str] = None,
+    transport: Optional[requests.Session] = None,
+    transport_config: Optional[TransportConfig] = None,
 ) -> SessionState:
     """
     Authenticate with the JETNET API and return a SessionState.
@@ -94,13 +507,18 @@ def login(
     Reads JETNET_EMAIL / JETNET_PASSWORD / JETNET_BASE_URL from environment
     if not passed directly.
 
+    Pass an existing `transport` to keep reusing its connection pool (this is
+    what re-login paths do); otherwise a new pool is built from
+    `transport_config`.
+
     IMPORTANT: emailAddress has a capital A -- this function handles that for you.
     """
     email    = email    or os.environ["JETNET_EMAIL"]
     password = password or os.environ["JETNET_PASSWORD"]
     url      = (base_url or BASE_URL).rstrip("/")
+    transport = transport or build_transport(transport_config)
 
-    r = requests.post(
+    r = transport.post(
         f"{url}/api/Admin/APILogin",
         json={"emailAddress": email, "password": password},
         timeout=30,
@@ -118,6 +536,7 @@ def login(
         password=password,
         bearer_token=data["bearerToken"],
         api_token=data.get("apiToken") or data.get("securityToken"),
+        transport=transport,
     )
 
 
@@ -132,9 +551,10 @@ def get_account_info(session: SessionState) -> dict:
 
     Returns the account info dict, or raises JetnetError if the token is invalid.
     """
-    r = requests.get(
-        f"{session.base_url}/api/Admin/getAccountInfo/{session.api_token}",
-        headers={"Authorization": f"Bearer {session.bearer_token}"},
+    bearer, api_token, _ = session.tokens()
+    r = session.transport.get(
+        f"{session.base_url}/api/Admin/getAccountInfo/{api_token}",
+        headers={"Authorization": f"Bearer {bearer}"},
         timeout=15,
     )
     r.raise_for_status()
@@ -148,6 +568,36 @@ def get_account_info(session: SessionState) -> dict:
     return data
 
 
+def relogin(session: SessionState, seen_generation: Optional[int] = None) -> SessionState:
+    """
+    Single-flight re-login that refreshes `session` in place.
+
+    `seen_generation` is the session.generation the caller's failing request
+    was made with. Callers that race on the same expired token queue on the
+    session's refresh lock; the first one logs in, the rest find the
+    generation already moved on and return without calling login() again.
+
+    If the session has a token_cache, renewal goes through it so other
+    processes sharing the cache log in at most once as well.
+
+    Returns the same SessionState object, now holding the new tokens.
+    """
+    if seen_generation is None:
+        seen_generation = session.generation
+    with session._refresh_lock:
+        if session.generation == seen_generation:
+            if session.token_cache is not None:
+                fresh = session.token_cache.acquire(
+                    session.email, session.password, session.base_url,
+                    transport=session.transport, stale_token=session.api_token,
+                )
+            else:
+                fresh = login(session.email, session.password, session.base_url,
+                              transport=session.transport)
+            session.adopt(fresh)
+    return session
+
+
 def ensure_session(session: SessionState) -> SessionState:
     """
     Validate the session before starting any workflow. Auto-refreshes once on expiry.
@@ -160,9 +610,20 @@ def ensure_session(session: SessionState) -> SessionState:
       2. Otherwise call /getAccountInfo.
       3. If /getAccountInfo fails, re-login once and retry.
       4. If it still fails, raise -- credentials or service issue.
+
+    Re-login goes through relogin(), so the session is refreshed in place and
+    the returned object is always the one passed in.
+
+    If a TokenRenewer is running for this session, a fresh-by-age token is
+    returned as-is without the /getAccountInfo probe -- the renewer keeps it
+    ahead of expiry, and jetnet_request still re-logs in once on INVALID.
     """
+    _, _, generation = session.tokens()
     if session.is_stale():
-        return login(session.email, session.password, session.base_url)
+        return relogin(session, generation)
+
+    if session._renewer is not None and session._renewer.is_running():
+        return session
 
     try:
         get_account_info(session)
@@ -171,9 +632,9 @@ def ensure_session(session: SessionState) -> SessionState:
         pass
 
     try:
-        refreshed = login(session.email, session.password, session.base_url)
-        get_account_info(refreshed)
-        return refreshed
+        relogin(session, generation)
+        get_account_info(session)
+        return session
     except Exception as e:
         raise JetnetError(
             f"Session refresh failed. Check credentials and connectivity. Original error: {e}",
@@ -188,6 +649,7 @@ def jetnet_request(
     json: Optional[dict] = None,
     timeout: int = 60,
     auto_refresh: bool = True,
+    retry: Optional[RetryPolicy] = None,
 ) -> dict:
     """
     Make an authenticated JETNET API request.
@@ -195,46 +657,286 @@ def jetnet_request(
     Handles:
       - Bearer token in Authorization header
       - apiToken substitution in URL path
+      - Retries on transient failures (429/5xx, resets, timeouts) per RetryPolicy
+      - Client-side rate limiting when session.rate_limiter is set
+      - Fail-fast when session.circuit_breaker is open
       - Application-level error detection (HTTP 200 but responsestatus = ERROR)
-      - One automatic re-auth on INVALID SECURITY TOKEN
+      - One automatic re-auth on INVALID SECURITY TOKEN (single-flight;
+        the shared session is updated in place)
 
     Args:
         method:       "GET" or "POST"
         path:         e.g. "/api/Aircraft/getRegNumber/N12345/{apiToken}"
                       Use literal {apiToken} -- it will be substituted automatically.
-        session:      SessionState from login() or ensure_session()
+        session:      SessionState from login() or ensure_session(); may be
+                      shared across threads
         json:         POST body dict (None for GET requests)
         timeout:      Request timeout in seconds
         auto_refresh: If True, re-login once on token error and retry
+        retry:        RetryPolicy for transient failures (default: DEFAULT_RETRY_POLICY)
 
     Returns:
         Parsed JSON response dict
 
     Raises:
         JetnetError: on application-level errors
-        requests.HTTPError: on HTTP 4xx/5xx errors
+        CircuitOpenError: if session.circuit_breaker is open (no request is sent)
+        requests.HTTPError: on HTTP 4xx/5xx errors (after retries, for transient codes)
+        requests.RequestException: on network errors that outlast the retry policy
     """
-    url = f"{session.base_url}{path}".replace("{apiToken}", session.api_token)
+    bearer, api_token, generation = session.tokens()
+    url = f"{session.base_url}{path}".replace("{apiToken}", api_token)
     headers = {
-        "Authorization": f"Bearer {session.bearer_token}",
+        "Authorization": f"Bearer {bearer}",
         "Content-Type": "application/json",
     }
 
-    r = requests.request(method, url, headers=headers, json=json, timeout=timeout)
+    def send() -> requests.Response:
+        if session.rate_limiter is not None:
+            session.rate_limiter.acquire(path)
+        return session.transport.request(method, url, headers=headers, json=json, timeout=timeout)
+
+    breaker = session.circuit_breaker
+    if breaker is not None:
+        breaker.before_call(path)
+    try:
+        r = send_with_retry(send, retry)
+    except requests.RequestException:
+        if breaker is not None:
+            breaker.record_failure()
+        raise
+    if breaker is not None:
+        if r.status_code >= 500 or r.status_code == 429:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+
     r.raise_for_status()
     data = r.json()
 
     err = normalize_error(data, endpoint=path)
     if err:
         if auto_refresh and "INVALID" in err.raw_status.upper():
-            refreshed = login(session.email, session.password, session.base_url)
-            return jetnet_request(method, path, refreshed, json=json,
-                                  timeout=timeout, auto_refresh=False)
+            relogin(session, generation)
+            return jetnet_request(method, path, session, json=json,
+                                  timeout=timeout, auto_refresh=False, retry=retry)
         raise err
 
     return data
 
 
 def refresh_session(session: SessionState) -> SessionState:
-    """Force a fresh login regardless of token age. Returns a new SessionState."""
-    return login(session.email, session.password, session.base_url)
+    """
+    Force a fresh login regardless of token age. Returns a new SessionState
+    that shares the original's connection pool.
+    """
+    return login(session.email, session.password, session.base_url,
+                 transport=session.transport)
+
+
+class TokenCache:
+    """
+    On-disk token cache shared by every process on the host.
+
+    Entries are keyed by a hash of (email, base_url) and hold the bearer and
+    api tokens plus the time they were issued -- never the password. All
+    reads and writes happen under an exclusive file lock, which is also held
+    across the login call when renewing, so concurrent processes that find
+    the token stale queue behind one login and adopt its result.
+
+    Path: JETNET_TOKEN_CACHE, default ~/.cache/jetnet/tokens.json (mode 0600).
+    """
+
+    def __init__(self, path: Optional[str] = None, ttl: int = TOKEN_TTL_SECONDS):
+        self.path = path or os.getenv(
+            "JETNET_TOKEN_CACHE",
+            os.path.join(os.path.expanduser("~"), ".cache", "jetnet", "tokens.json"),
+        )
+        self.ttl = ttl
+
+    @staticmethod
+    def key(email: str, base_url: str) -> str:
+        return hashlib.sha256(f"{email.lower()}|{base_url.rstrip('/')}".encode()).hexdigest()
+
+    @contextlib.contextmanager
+    def _locked(self) -> Iterator[None]:
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        with open(f"{self.path}.lock", "a") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _read(self) -> dict:
+        try:
+            with open(self.path) as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def _write(self, entries: dict) -> None:
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tokens-")
+        with os.fdopen(fd, "w") as f:
+            json.dump(entries, f)
+        os.chmod(tmp_path, 0o600)
+        os.replace(tmp_path, self.path)
+
+    def _fresh_entry(self, entries: dict, email: str, base_url: str) -> Optional[dict]:
+        entry = entries.get(self.key(email, base_url))
+        if entry and time.time() - entry["issued_at"] < self.ttl:
+            return entry
+        return None
+
+    def acquire(
+        self,
+        email: str,
+        password: str,
+        base_url: str,
+        transport: Optional[requests.Session] = None,
+        stale_token: Optional[str] = None,
+    ) -> SessionState:
+        """
+        Return a SessionState for a cached, still-fresh token, or log in and cache a new one.
+
+        `stale_token` is the api token the caller already knows is bad; a cache
+        entry holding that same token is treated as stale and renewed.
+        """
+        url = base_url.rstrip("/")
+        with self._locked():
+            entries = self._read()
+            entry = self._fresh_entry(entries, email, url)
+            if entry and entry["api_token"] != stale_token:
+                return SessionState(
+                    base_url=url,
+                    email=email,
+                    password=password,
+                    bearer_token=entry["bearer_token"],
+                    api_token=entry["api_token"],
+                    created_at=entry["issued_at"],
+                    last_validated_at=0.0,   # adopted, not yet validated by this process
+                    transport=transport,
+                    token_cache=self,
+                )
+
+            fresh = login(email, password, url, transport=transport)
+            entries[self.key(email, url)] = {
+                "bearer_token": fresh.bearer_token,
+                "api_token": fresh.api_token,
+                "issued_at": fresh.created_at,
+            }
+            self._write(entries)
+            fresh.token_cache = self
+            return fresh
+
+    def clear(self, email: str, base_url: str) -> None:
+        """Drop the cached token for one account."""
+        with self._locked():
+            entries = self._read()
+            if entries.pop(self.key(email, base_url.rstrip("/")), None) is not None:
+                self._write(entries)
+
+
+def cached_login(
+    email: Optional[str] = None,
+    password: Optional[str] = None,
+    base_url: Optional[str] = None,
+    cache: Optional[TokenCache] = None,
+    transport: Optional[requests.Session] = None,
+    transport_config: Optional[TransportConfig] = None,
+) -> SessionState:
+    """
+    Like login(), but adopts a still-valid token from a TokenCache when one exists.
+
+    The returned session keeps the cache attached, so later refreshes
+    (relogin, ensure_session, TokenRenewer, INVALID retries) renew through it.
+    """
+    email    = email    or os.environ["JETNET_EMAIL"]
+    password = password or os.environ["JETNET_PASSWORD"]
+    url      = (base_url or BASE_URL).rstrip("/")
+    cache    = cache or TokenCache()
+    return cache.acquire(email, password, url, transport=transport or build_transport(transport_config))
+
+
+class TokenRenewer:
+    """
+    Opt-in background thread that re-logs in ahead of TOKEN_TTL_SECONDS.
+
+    The renewer wakes `renew_ahead` seconds before the session's token would
+    be considered stale and refreshes it through relogin(), so the swap is
+    single-flight with any foreground refresh and atomic for readers. Failed
+    renewals are logged and retried every `retry_interval` seconds; the
+    foreground paths (ensure_session, jetnet_request) remain the fallback.
+
+    Usage:
+        session = login()
+        renewer = TokenRenewer(session).start()
+        ...
+        renewer.stop()
+
+    Or as a context manager:
+        with TokenRenewer(session):
+            run_workers(session)
+    """
+
+    def __init__(
+        self,
+        session: SessionState,
+        ttl: int = TOKEN_TTL_SECONDS,
+        renew_ahead: int = RENEW_AHEAD_SECONDS,
+        retry_interval: float = 30.0,
+    ):
+        self.session = session
+        self.ttl = ttl
+        self.renew_ahead = renew_ahead
+        self.retry_interval = retry_interval
+        self.renewals = 0
+        self.failures = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> TokenRenewer:
+        if self.is_running():
+            return self
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="jetnet-token-renewer", daemon=True)
+        self._thread.start()
+        self.session._renewer = self
+        return self
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        if self.session._renewer is self:
+            self.session._renewer = None
+
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive() and not self._stop.is_set()
+
+    def seconds_until_renewal(self) -> float:
+        return self.session.created_at + self.ttl - self.renew_ahead - time.time()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            if self._stop.wait(max(self.seconds_until_renewal(), 0)):
+                return
+            _, _, generation = self.session.tokens()
+            if self.seconds_until_renewal() > 0:
+                continue  # a foreground refresh already moved created_at forward
+            try:
+                relogin(self.session, generation)
+                self.renewals += 1
+            except Exception as e:
+                self.failures += 1
+                log.warning("JETNET background token renewal failed: %s", e)
+                self._stop.wait(self.retry_interval)
+
+    def __enter__(self) -> TokenRenewer:
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
@@ -0,0 +1,234 @@
+"""
+tail_index.py -- persistent regnbr -> aircraftid index for JETNET lookups
+
+Most workflows start with GET /api/Aircraft/getRegNumber/{reg} to turn a
+tail number into an aircraftid. Registrations rarely change, so a TailIndex
+stores the answer in SQLite and only asks the API again when the entry
+expires:
+
+    known tails   -- kept for `ttl` (default 7 days)
+    unknown tails -- kept as a negative entry for `negative_ttl` (default 1 hour),
+                     so a typo does not cost an API call on every retry
+
+Re-registrations are handled whenever the index sees a fresh
+(regnbr, aircraftid) pair, from a lookup or from observe() on
+bulk-export / delta records:
+    - any other tail still mapped to that aircraftid is dropped, and
+    - prevregnbr (when present) is dropped if it pointed at that aircraft.
+
+Usage:
+    from src.jetnet.session import login
+    from src.jetnet.tail_index import TailIndex
+
+    session = login()
+    index = TailIndex()                                  # ~/.cache/jetnet/tails.db
+    index.resolve(session, "N12345")                     # -> 211461 (API call)
+    index.resolve(session, "N12345")                     # -> 211461 (cache)
+    index.resolve_many(session, ["N1", "N2", "N3"])      # API only for misses, concurrently
+    index.observe(delta_records)                         # keep it current from bulk-export pulls
+
+Path: JETNET_TAIL_INDEX, default ~/.cache/jetnet/tails.db. Every process
+pointing at the same file shares the index.
+"""
+
+from __future__ import annotations
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from .session import SessionState, jetnet_request
+
+DEFAULT_TTL = int(os.getenv("JETNET_TAIL_TTL", str(7 * 24 * 3600)))
+DEFAULT_NEGATIVE_TTL = int(os.getenv("JETNET_TAIL_NEGATIVE_TTL", "3600"))
+
+_MISSING = object()
+
+
+def normalize_tail(tail: str) -> str:
+    return tail.strip().upper()
+
+
+def _aircraft_from_lookup(data: dict) -> tuple:
+    """(aircraftid or None, regnbr, prevregnbr) from a getRegNumber response."""
+    ac = data.get("aircraftresult") or {}
+    return ac.get("aircraftid") or None, ac.get("regnbr"), ac.get("prevregnbr")
+
+
+class TailIndex:
+    """
+    SQLite-backed tail-number index with TTL and negative caching.
+
+    Thread-safe: each thread gets its own connection. Counters in stats()
+    are per instance.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        ttl: int = DEFAULT_TTL,
+        negative_ttl: int = DEFAULT_NEGATIVE_TTL,
+    ):
+        self.path = path or os.getenv(
+            "JETNET_TAIL_INDEX",
+            os.path.join(os.path.expanduser("~"), ".cache", "jetnet", "tails.db"),
+        )
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._local = threading.local()
+        self._stats = {"hits": 0, "negative_hits": 0, "misses": 0, "invalidations": 0}
+        self._stats_lock = threading.Lock()
+        self._connect().executescript(
+            "CREATE TABLE IF NOT EXISTS tails ("
+            " regnbr TEXT PRIMARY KEY, aircraftid INTEGER, expires_at REAL NOT NULL, updated_at REAL NOT NULL);"
+            "CREATE INDEX IF NOT EXISTS tails_aircraftid ON tails (aircraftid);"
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def _count(self, name: str, n: int = 1) -> None:
+        with self._stats_lock:
+            self._stats[name] += n
+
+    # -- cache operations -----------------------------------------------------
+
+    def get(self, tail: str, default=None):
+        """
+        Cached aircraftid for `tail`, None for a cached "not found", or
+        `default` when there is no live entry.
+        """
+        row = self._connect().execute(
+            "SELECT aircraftid FROM tails WHERE regnbr = ? AND expires_at > ?",
+            (normalize_tail(tail), time.time()),
+        ).fetchone()
+        if row is None:
+            self._count("misses")
+            return default
+        self._count("hits" if row[0] is not None else "negative_hits")
+        return row[0]
+
+    def put(self, tail: str, aircraft_id: Optional[int], prev_tail: Optional[str] = None) -> None:
+        """
+        Store a lookup result (aircraft_id=None for an unknown tail). A known
+        aircraft_id evicts any other tail mapped to it, and `prev_tail` too.
+        """
+        tail = normalize_tail(tail)
+        now = time.time()
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            if aircraft_id is not None:
+                removed = conn.execute(
+                    "DELETE FROM tails WHERE aircraftid = ? AND regnbr != ?", (aircraft_id, tail)
+                ).rowcount
+                if prev_tail and normalize_tail(prev_tail) != tail:
+                    removed += conn.execute(
+                        "DELETE FROM tails WHERE regnbr = ? AND (aircraftid = ? OR aircraftid IS NULL)",
+                        (normalize_tail(prev_tail), aircraft_id),
+                    ).rowcount
+                if removed:
+                    self._count("invalidations", removed)
+            ttl = self.ttl if aircraft_id is not None else self.negative_ttl
+            conn.execute(
+                "INSERT INTO tails (regnbr, aircraftid, expires_at, updated_at) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (regnbr) DO UPDATE SET aircraftid = excluded.aircraftid, "
+                "expires_at = excluded.expires_at, updated_at = excluded.updated_at",
+                (tail, aircraft_id, now + ttl, now),
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def invalidate(self, tail: str) -> None:
+        self._connect().execute("DELETE FROM tails WHERE regnbr = ?", (normalize_tail(tail),))
+
+    def observe(self, records: list) -> int:
+        """
+        Refresh the index from records that carry regnbr + aircraftid
+        (bulk export, delta pulls, aircraft lists). Returns records applied.
+        """
+        applied = 0
+        for record in records:
+            aircraft_id, tail = record.get("aircraftid"), record.get("regnbr")
+            if aircraft_id and tail:
+                self.put(tail, aircraft_id, record.get("prevregnbr"))
+                applied += 1
+        return applied
+
+    def stats(self) -> dict:
+        with self._stats_lock:
+            stats = dict(self._stats)
+        stats["entries"] = self._connect().execute("SELECT COUNT(*) FROM tails").fetchone()[0]
+        return stats
+
+    # -- resolution -----------------------------------------------------------
+
+    def _store_lookup(self, tail: str, data: dict) -> Optional[int]:
+        aircraft_id, _, prev = _aircraft_from_lookup(data)
+        self.put(tail, aircraft_id, prev)
+        return aircraft_id
+
+    def _lookup(self, session: SessionState, tail: str) -> Optional[int]:
+        data = jetnet_request("GET", f"/api/Aircraft/getRegNumber/{tail}/{{apiToken}}", session)
+        return self._store_lookup(tail, data)
+
+    def resolve(self, session: SessionState, tail: str) -> Optional[int]:
+        """aircraftid for `tail` (None if JETNET does not know it), from cache when possible."""
+        cached = self.get(tail, _MISSING)
+        if cached is not _MISSING:
+            return cached
+        return self._lookup(session, normalize_tail(tail))
+
+    def resolve_many(self, session: SessionState, tails: list, workers: int = 8) -> dict:
+        """
+        Resolve many tails; only cache misses hit the API, `workers` at a time.
+        Returns {normalized_tail: aircraftid or None}.
+        """
+        result = {}
+        misses = []
+        for tail in dict.fromkeys(normalize_tail(t) for t in tails):
+            cached = self.get(tail, _MISSING)
+            if cached is _MISSING:
+                misses.append(tail)
+            else:
+                result[tail] = cached
+        if misses:
+            with ThreadPoolExecutor(max_workers=max(1, min(workers, len(misses)))) as pool:
+                for tail, aircraft_id in zip(misses, pool.map(lambda t: self._lookup(session, t), misses)):
+                    result[tail] = aircraft_id
+        return result
+
+    async def resolve_many_async(self, session, tails: list, concurrency: int = 8) -> dict:
+        """resolve_many() for an AsyncSessionState (src/jetnet/async_session.py)."""
+        from .async_session import jetnet_request as async_request
+
+        result = {}
+        misses = []
+        for tail in dict.fromkeys(normalize_tail(t) for t in tails):
+            cached = self.get(tail, _MISSING)
+            if cached is _MISSING:
+                misses.append(tail)
+            else:
+                result[tail] = cached
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def lookup(tail):
+            async with semaphore:
+                data = await async_request("GET", f"/api/Aircraft/getRegNumber/{tail}/{{apiToken}}", session)
+            return self._store_lookup(tail, data)
+
+        for tail, aircraft_id in zip(misses, await asyncio.gather(*(lookup(t) for t in misses))):
+            result[tail] = aircraft_id
+        return result
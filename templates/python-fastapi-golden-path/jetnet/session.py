@@ -8,8 +8,10 @@ with docstrings and type hints, see the root repo's src/jetnet/session.py.
 
 from __future__ import annotations
 import os
+import threading
 import time
 import requests
+from collections import deque
 from dataclasses import dataclass, field
 from typing import Optional
 
@@ -36,6 +38,84 @@ class JetnetError(Exception):
         super().__init__(message)
 
 
+class CircuitOpenError(JetnetError):
+    pass
+
+
+class CircuitBreaker:
+    """Opens after N consecutive failures or a high error rate; half-opens after reset_timeout."""
+
+    def __init__(self, failure_threshold: int = 5, error_rate_threshold: float = 0.5,
+                 window_seconds: float = 60.0, min_calls: int = 20, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.error_rate_threshold = error_rate_threshold
+        self.window_seconds = window_seconds
+        self.min_calls = min_calls
+        self.reset_timeout = reset_timeout
+        self.state = "closed"
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self._probing = False
+        self._window: deque = deque()
+        self._lock = threading.Lock()
+
+    def _error_rate(self, now: float) -> float:
+        while self._window and now - self._window[0][0] > self.window_seconds:
+            self._window.popleft()
+        return sum(1 for _, failed in self._window if failed) / len(self._window) if self._window else 0.0
+
+    def before_call(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            if self.state == "open" and now - self.opened_at >= self.reset_timeout:
+                self.state, self._probing = "half_open", False
+            if self.state == "open" or (self.state == "half_open" and self._probing):
+                raise CircuitOpenError("JETNET circuit open -- failing fast")
+            if self.state == "half_open":
+                self._probing = True
+
+    def record(self, failed: bool) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self.consecutive_failures = self.consecutive_failures + 1 if failed else 0
+            if self.state == "half_open":
+                self.state = "open" if failed else "closed"
+                self.opened_at = now
+                self._window.clear()
+                return
+            self._window.append((now, failed))
+            rate = self._error_rate(now)
+            if failed and (self.consecutive_failures >= self.failure_threshold
+                           or (len(self._window) >= self.min_calls and rate >= self.error_rate_threshold)):
+                self.state, self.opened_at = "open", now
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            now = time.monotonic()
+            return {
+                "state": self.state,
+                "consecutive_failures": self.consecutive_failures,
+                "window_error_rate": round(self._error_rate(now), 3),
+                "retry_in_seconds": round(max(self.reset_timeout - (now - self.opened_at), 0.0), 1)
+                if self.state == "open" else 0.0,
+            }
+
+
+breaker = CircuitBreaker()
+
+
+def _send(method: str, url: str, **kwargs) -> requests.Response:
+    """Every JETNET call goes through the shared circuit breaker."""
+    breaker.before_call()
+    try:
+        r = requests.request(method, url, **kwargs)
+    except requests.RequestException:
+        breaker.record(failed=True)
+        raise
+    breaker.record(failed=r.status_code >= 500 or r.status_code == 429)
+    return r
+
+
 def normalize_error(data: dict) -> Optional[JetnetError]:
     status = data.get("responsestatus", "")
     if status:
@@ -52,8 +132,8 @@ def login(email: Optional[str] = None, password: Optional[str] = None, base_url:
     email = email or os.environ["JETNET_EMAIL"]
     password = password or os.environ["JETNET_PASSWORD"]
     url = (base_url or BASE_URL).rstrip("/")
-    r = requests.post(f"{url}/api/Admin/APILogin",
-                      json={"emailAddress": email, "password": password}, timeout=30)
+    r = _send("POST", f"{url}/api/Admin/APILogin",
+              json={"emailAddress": email, "password": password}, timeout=30)
     r.raise_for_status()
     data = r.json()
     err = normalize_error(data)
@@ -70,14 +150,16 @@ def ensure_session(session: SessionState) -> SessionState:
     if session.is_stale():
         return login(session.email, session.password, session.base_url)
     try:
-        r = requests.get(
-            f"{session.base_url}/api/Admin/getAccountInfo/{session.api_token}",
+        r = _send(
+            "GET", f"{session.base_url}/api/Admin/getAccountInfo/{session.api_token}",
             headers={"Authorization": f"Bearer {session.bearer_token}"}, timeout=15)
         r.raise_for_status()
         err = normalize_error(r.json())
         if err:
             raise err
         return session
+    except CircuitOpenError:
+        raise
     except Exception:
         return login(session.email, session.password, session.base_url)
 
@@ -85,7 +167,7 @@ def ensure_session(session: SessionState) -> SessionState:
 def jetnet_request(method: str, path: str, session: SessionState, json: Optional[dict] = None) -> dict:
     url = f"{session.base_url}{path}".replace("{apiToken}", session.api_token)
     headers = {"Authorization": f"Bearer {session.bearer_token}", "Content-Type": "application/json"}
-    r = requests.request(method, url, headers=headers, json=json, timeout=60)
+    r = _send(method, url, headers=headers, json=json, timeout=60)
     r.raise_for_status()
     data = r.json()
     err = normalize_error(data)
@@ -6,7 +6,9 @@ from typing import Optional
 from dotenv import load_dotenv
 from fastapi import FastAPI, HTTPException, Query
 
-from jetnet.session import login, ensure_session, jetnet_request, SessionState
+from jetnet.session import (
+    CircuitOpenError, SessionState, breaker, ensure_session, jetnet_request, login,
+)
 
 load_dotenv()
 
@@ -64,8 +66,11 @@ def lookup(tail: str = Query(..., description="Aircraft registration / tail numb
     if not tail:
         raise HTTPException(status_code=400, detail="tail query parameter is required")
 
-    s = _get_session()
-    ac_data = jetnet_request("GET", f"/api/Aircraft/getRegNumber/{tail}/{{apiToken}}", s)
+    try:
+        s = _get_session()
+        ac_data = jetnet_request("GET", f"/api/Aircraft/getRegNumber/{tail}/{{apiToken}}", s)
+    except CircuitOpenError as e:
+        raise HTTPException(status_code=503, detail=str(e))
     ac = ac_data.get("aircraftresult") or {}
     aircraft_id = ac.get("aircraftid")
     if not aircraft_id:
@@ -107,7 +112,9 @@ def lookup(tail: str = Query(..., description="Aircraft registration / tail numb
 
 @app.get("/health")
 def health():
+    circuit = breaker.snapshot()
     return {
-        "status": "ok",
+        "status": "ok" if circuit["state"] == "closed" else "degraded",
         "session_active": session is not None and not session.is_stale(),
+        "circuit_breaker": circuit,
     }